@@ -31,8 +31,40 @@ class Config:
     # 데이터베이스 설정 (루트/data/zitta.db)
     DB_PATH = os.path.join(BASE_DIR, "data", "zitta.db")
     
+    # LLM 응답 캐시 설정 (루트/data/llm_cache.db)
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = os.path.join(BASE_DIR, "data", "llm_cache.db")
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 60 * 60)))  # 초 단위 (기본 7일)
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))
+    
+    # 파일명 색인 설정 (루트/data/file_index.db)
+    FILE_INDEX_PATH = os.path.join(BASE_DIR, "data", "file_index.db")
+    
+    # 대화창 "!명령"으로 시스템 명령 실행 허용 (기본 꺼짐, 켜도 실행할 때마다 확인)
+    CHAT_COMMANDS_ENABLED = os.getenv("CHAT_COMMANDS_ENABLED", "false").lower() == "true"
+    
     # 플러그인 설정 (루트/plugins)
     PLUGIN_DIR = os.path.join(BASE_DIR, "plugins")
+    # 플러그인 매니페스트 캐시 (루트/data/plugin_manifest.json, 시작 시 플러그인을 import하지 않기 위함)
+    PLUGIN_MANIFEST_PATH = os.path.join(BASE_DIR, "data", "plugin_manifest.json")
+    # 플러그인 실행 방식: inline (GUI 스레드), thread (백그라운드 스레드), process (플러그인별 작업 프로세스)
+    PLUGIN_EXECUTION_MODE = os.getenv("PLUGIN_EXECUTION_MODE", "thread").lower()
+    PLUGIN_TIMEOUT = float(os.getenv("PLUGIN_TIMEOUT", "5"))  # 명령 처리 제한 시간 (초)
+    PLUGIN_MAX_CONCURRENCY = int(os.getenv("PLUGIN_MAX_CONCURRENCY", "2"))  # 플러그인별 최대 동시 처리 수
+    # 플러그인 파일이 바뀌면 재시작 없이 다시 로드
+    PLUGIN_HOT_RELOAD = os.getenv("PLUGIN_HOT_RELOAD", "true").lower() == "true"
+    # 플러그인 지표 JSON 저장 위치 (루트/data/plugin_metrics.json, 종료 시 및 진단 탭에서 저장)
+    PLUGIN_METRICS_PATH = os.path.join(BASE_DIR, "data", "plugin_metrics.json")
+    
+    # 음성 설정
+    # Whisper 모델 크기 (tiny/base/small/medium/large, 클수록 정확하지만 로드/인식이 느림)
+    WHISPER_MODEL_SIZE = os.getenv("WHISPER_MODEL_SIZE", "base")
+    # 시작 직후 백그라운드에서 Whisper 모델 미리 로드 (기본 꺼짐: 처음 음성 인식할 때 로드)
+    WHISPER_PRELOAD = os.getenv("WHISPER_PRELOAD", "false").lower() == "true"
+    # 합성 음성 캐시 (루트/data/tts_cache, 반복되는 문장은 WAV로 저장해 두고 바로 재생)
+    TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+    TTS_CACHE_DIR = os.path.join(BASE_DIR, "data", "tts_cache")
+    TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "50"))  # 초과 시 오래 사용하지 않은 파일부터 삭제
     
     @classmethod
     def validate(cls):
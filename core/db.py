@@ -0,0 +1,205 @@
+"""
+SQLite 저장소 계층 모듈 (core 패키지)
+스레드별로 오래 유지되는 연결을 제공하여 매 작업마다 연결/해제하는 비용을 없앱니다.
+WAL 저널 모드를 사용하므로 쓰기 중에도 읽기가 막히지 않습니다.
+"""
+import sqlite3
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from .config import Config
+
+
+class _ThreadConnection:
+    """스레드별 연결 보관 객체 (스레드가 끝나 threading.local이 정리되면 연결도 닫힘)"""
+    
+    def __init__(self, database: "Database", conn: sqlite3.Connection):
+        self.conn = conn
+        self.finalizer = weakref.finalize(self, database._release, conn)
+
+
+class Database:
+    """스레드별 연결을 관리하는 SQLite 데이터베이스"""
+    
+    # 연결마다 캐시할 prepared statement 개수
+    STATEMENT_CACHE_SIZE = 256
+    # 다른 연결이 쓰기 잠금을 잡고 있을 때 기다릴 시간(초)
+    BUSY_TIMEOUT = 5.0
+    
+    def __init__(self, db_path: str):
+        """
+        데이터베이스 초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        # 데이터 디렉토리 생성
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+        
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+    
+    def _connect(self) -> sqlite3.Connection:
+        """새 연결 생성 및 PRAGMA 설정"""
+        # 연결은 생성한 스레드에서만 사용하지만, 종료 시 close_all()에서 닫을 수 있도록 허용
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL 모드에서는 NORMAL이어도 손상 없이 안전하며 커밋마다 fsync하지 않음
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    
+    def connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 연결 반환 (없으면 생성)
+        
+        Returns:
+            현재 스레드 전용 SQLite 연결
+        """
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            conn = self._connect()
+            with self._lock:
+                self._connections.append(conn)
+            # 짧게 쓰고 끝나는 작업 스레드의 연결이 쌓이지 않도록 스레드 종료 시 자동으로 닫음
+            holder = _ThreadConnection(self, conn)
+            self._local.holder = holder
+        return holder.conn
+    
+    def _release(self, conn: sqlite3.Connection):
+        """연결 목록에서 제거 후 닫기 (close_all()로 이미 닫힌 연결은 무시)"""
+        with self._lock:
+            if conn not in self._connections:
+                return
+            self._connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        쓰기 트랜잭션 (정상 종료 시 커밋, 예외 시 롤백)
+        
+        Yields:
+            현재 스레드의 연결
+        """
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def execute(self, sql: str, params=()) -> sqlite3.Cursor:
+        """
+        읽기 쿼리 실행
+        
+        Args:
+            sql: SQL 문
+            params: 바인딩 파라미터
+            
+        Returns:
+            결과 커서
+        """
+        return self.connection().execute(sql, params)
+    
+    def fetch_all(self, sql: str, params=()) -> List[Dict]:
+        """
+        읽기 쿼리 실행 후 모든 행을 딕셔너리 리스트로 반환
+        
+        Args:
+            sql: SQL 문
+            params: 바인딩 파라미터
+            
+        Returns:
+            행 딕셔너리 리스트
+        """
+        return [dict(row) for row in self.execute(sql, params).fetchall()]
+    
+    def fetch_one(self, sql: str, params=()) -> Optional[Dict]:
+        """
+        읽기 쿼리 실행 후 첫 행을 딕셔너리로 반환
+        
+        Args:
+            sql: SQL 문
+            params: 바인딩 파라미터
+            
+        Returns:
+            행 딕셔너리 또는 None
+        """
+        row = self.execute(sql, params).fetchone()
+        return dict(row) if row else None
+    
+    def close(self):
+        """현재 스레드의 연결 종료 (작업 스레드가 끝날 때 호출)"""
+        holder = getattr(self._local, "holder", None)
+        if holder is not None:
+            self._local.holder = None
+            holder.finalizer()
+    
+    def close_all(self):
+        """모든 스레드의 연결 종료 (애플리케이션 종료 시)"""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+# 경로별로 공유되는 Database 인스턴스
+_databases: Dict[str, Database] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(db_path: str = None) -> Database:
+    """
+    경로별 공유 Database 인스턴스 반환
+    
+    Args:
+        db_path: SQLite 파일 경로 (기본값: Config.DB_PATH)
+        
+    Returns:
+        Database 인스턴스
+    """
+    db_path = os.path.abspath(db_path or Config.DB_PATH)
+    with _databases_lock:
+        database = _databases.get(db_path)
+        if database is None:
+            database = Database(db_path)
+            _databases[db_path] = database
+        return database
+
+
+def close_thread_connections():
+    """현재 스레드가 연 모든 데이터베이스 연결 종료 (작업 스레드의 run() 끝에서 호출)"""
+    with _databases_lock:
+        databases = list(_databases.values())
+    for database in databases:
+        database.close()
+
+
+def close_all_databases():
+    """get_database()로 연 모든 데이터베이스의 모든 연결 종료 (애플리케이션 종료 시, WAL 체크포인트 포함)"""
+    with _databases_lock:
+        databases = list(_databases.values())
+    for database in databases:
+        database.close_all()
@@ -0,0 +1,384 @@
+"""
+디스크 사용량 분석 모듈 (core 패키지)
+디렉토리별 재귀 크기 집계와 중복 파일 탐지를 스레드 풀 기반 병렬 탐색으로 수행합니다.
+"""
+import os
+import time
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class DiskAnalyzer:
+    """디렉토리 크기 집계 및 중복 파일 탐지 엔진"""
+    
+    # 진행 콜백 최소 호출 간격 (초)
+    PROGRESS_INTERVAL = 0.2
+    # 1차 비교에 사용하는 앞/뒤 부분 크기 (바이트)
+    PARTIAL_HASH_SIZE = 64 * 1024
+    # 전체 해시 계산 시 한 번에 읽는 크기
+    HASH_CHUNK_SIZE = 1024 * 1024
+    # 스레드 하나당 미리 등록해 두는 작업 수 (작업 전체를 한꺼번에 등록하지 않음)
+    SUBMIT_WINDOW_PER_WORKER = 4
+    
+    def __init__(self, max_workers: int = None):
+        """
+        분석 엔진 초기화
+        
+        Args:
+            max_workers: 스레드 수 (기본값: CPU 수 기반, 디스크 I/O 대기를 고려해 여유 있게)
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="disk-analysis")
+        # 디렉토리 경로 -> (mtime_ns, 직속 파일 크기 합, 직속 파일 수, 하위 디렉토리 경로 튜플)
+        self._dir_cache: Dict[str, Tuple[int, int, int, Tuple[str, ...]]] = {}
+    
+    def clear_cache(self):
+        """디렉토리 크기 캐시 비우기"""
+        self._dir_cache.clear()
+    
+    def disk_usage(self, root: str, progress: Callable[[Dict], None] = None,
+                   cancel_event: threading.Event = None, use_cache: bool = True) -> Dict:
+        """
+        root 이하 디렉토리별 재귀 크기 집계
+        
+        디렉토리 수정 시각이 이전 분석 때와 같으면 그 디렉토리는 다시 읽지 않습니다.
+        (디렉토리 수정 시각은 항목 추가/삭제/이름 변경 때만 바뀌므로,
+        기존 파일의 내용만 바뀐 경우를 반영하려면 use_cache=False로 호출합니다.)
+        
+        Args:
+            root: 분석할 루트 디렉토리
+            progress: 진행 콜백 ({"phase": "scan", "dirs", "files", "bytes"})
+            cancel_event: 설정되면 분석 중단
+            use_cache: 디렉토리 수정 시각 기반 캐시 사용 여부
+        
+        Returns:
+            {"path", "size", "file_count", "dir_count", "children": [{"name", "path", "size", "file_count"}, ...],
+             "files_size", "rescanned", "errors", "cancelled", "elapsed"}
+            children은 root 바로 아래 디렉토리를 크기 내림차순으로 정렬한 목록
+        """
+        start = time.perf_counter()
+        root = os.path.abspath(root)
+        reporter = _ProgressReporter(progress, self.PROGRESS_INTERVAL)
+        errors: List[Tuple[str, str]] = []
+        
+        def scan(directory: str):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError as e:
+                errors.append((directory, str(e)))
+                return None
+            
+            cached = self._dir_cache.get(directory) if use_cache else None
+            if cached is not None and cached[0] == mtime_ns:
+                return cached, False
+            
+            own_size = 0
+            own_files = 0
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                own_size += entry.stat(follow_symlinks=False).st_size
+                                own_files += 1
+                        except OSError:
+                            continue
+            except OSError as e:
+                errors.append((directory, str(e)))
+                return None
+            
+            result = (mtime_ns, own_size, own_files, tuple(subdirs))
+            self._dir_cache[directory] = result
+            return result, True
+        
+        # 레벨 단위 병렬 탐색: 각 레벨의 디렉토리를 동시에 읽고 하위 디렉토리를 다음 레벨로
+        scanned: Dict[str, Tuple[int, int, int, Tuple[str, ...]]] = {}
+        order: List[str] = []
+        frontier = [root]
+        stats = {"phase": "scan", "dirs": 0, "files": 0, "bytes": 0}
+        rescanned = 0
+        while frontier:
+            next_frontier = []
+            for directory, result in zip(frontier, self._map_bounded(scan, frontier)):
+                if result is None:
+                    continue
+                info, fresh = result
+                rescanned += fresh
+                scanned[directory] = info
+                order.append(directory)
+                next_frontier.extend(info[3])
+                stats["dirs"] += 1
+                stats["files"] += info[2]
+                stats["bytes"] += info[1]
+            reporter.report(stats)
+            frontier = next_frontier
+        reporter.report(stats, force=True)
+        
+        # 깊은 디렉토리부터 부모로 합산 (탐색 순서의 역순이면 자식이 항상 먼저)
+        totals: Dict[str, Tuple[int, int]] = {}
+        for directory in reversed(order):
+            _, own_size, own_files, subdirs = scanned[directory]
+            size, file_count = own_size, own_files
+            for subdir in subdirs:
+                child = totals.get(subdir)
+                if child is not None:
+                    size += child[0]
+                    file_count += child[1]
+            totals[directory] = (size, file_count)
+        
+        root_info = scanned.get(root)
+        children = []
+        if root_info is not None:
+            for subdir in root_info[3]:
+                if subdir in totals:
+                    size, file_count = totals[subdir]
+                    children.append({
+                        "name": os.path.basename(subdir),
+                        "path": subdir,
+                        "size": size,
+                        "file_count": file_count,
+                    })
+            children.sort(key=lambda child: child["size"], reverse=True)
+        
+        size, file_count = totals.get(root, (0, 0))
+        return {
+            "path": root,
+            "size": size,
+            "file_count": file_count,
+            "dir_count": max(len(order) - 1, 0),
+            "children": children,
+            "files_size": root_info[1] if root_info else 0,
+            "rescanned": rescanned,
+            "errors": errors,
+            "cancelled": cancel_event is not None and cancel_event.is_set(),
+            "elapsed": time.perf_counter() - start,
+        }
+    
+    def find_duplicates(self, root: str, min_size: int = 1, progress: Callable[[Dict], None] = None,
+                        cancel_event: threading.Event = None) -> Dict:
+        """
+        root 이하 중복 파일 탐지
+        
+        크기가 같은 파일끼리만 앞/뒤 부분 해시를 비교하고, 그래도 같은 파일만 전체 해시를
+        계산하므로 대부분의 파일은 한 번도 읽지 않습니다. 하드 링크(같은 inode)는 중복으로 보지 않습니다.
+        
+        Args:
+            root: 탐색할 루트 디렉토리
+            min_size: 비교 대상 최소 파일 크기 (바이트, 기본값: 빈 파일 제외)
+            progress: 진행 콜백 ({"phase": "scan"|"partial"|"full", "dirs"/"files" 또는 "done", "total"})
+            cancel_event: 설정되면 탐지 중단
+        
+        Returns:
+            {"groups": [{"size", "hash", "paths": [...]}, ...], "wasted", "files_scanned",
+             "errors", "cancelled", "elapsed"}
+            groups는 낭비 용량(크기 x (개수 - 1)) 내림차순
+        """
+        start = time.perf_counter()
+        root = os.path.abspath(root)
+        reporter = _ProgressReporter(progress, self.PROGRESS_INTERVAL)
+        errors: List[Tuple[str, str]] = []
+        
+        def cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+        
+        def scan(directory: str):
+            if cancelled():
+                return None
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                if st.st_size >= min_size:
+                                    files.append((entry.path, st.st_size, (st.st_dev, st.st_ino)))
+                        except OSError:
+                            continue
+            except OSError as e:
+                errors.append((directory, str(e)))
+                return None
+            return files, subdirs
+        
+        # 1단계: 크기별 분류
+        by_size: Dict[int, List[Tuple[str, Tuple[int, int]]]] = {}
+        files_scanned = 0
+        frontier = [root]
+        stats = {"phase": "scan", "dirs": 0, "files": 0}
+        while frontier and not cancelled():
+            next_frontier = []
+            for result in self._map_bounded(scan, frontier):
+                if result is None:
+                    continue
+                files, subdirs = result
+                for path, size, inode in files:
+                    by_size.setdefault(size, []).append((path, inode))
+                files_scanned += len(files)
+                next_frontier.extend(subdirs)
+                stats["dirs"] += 1
+                stats["files"] = files_scanned
+            reporter.report(stats)
+            frontier = next_frontier
+        
+        candidates: List[Tuple[str, int]] = []
+        for size, entries in by_size.items():
+            if len(entries) < 2:
+                continue
+            # 같은 inode는 한 번만 비교
+            unique = {}
+            for path, inode in entries:
+                unique.setdefault(inode, path)
+            if len(unique) > 1:
+                candidates.extend((path, size) for path in unique.values())
+        by_size.clear()
+        
+        # 2단계: 앞/뒤 부분 해시
+        partial_groups = self._group_by_hash(candidates, self._partial_hash, "partial",
+                                             reporter, errors, cancelled)
+        
+        # 3단계: 부분 해시가 파일 전체를 덮지 않는 경우만 전체 해시
+        groups = []
+        full_candidates = []
+        for (size, digest), paths in partial_groups.items():
+            if size <= self.PARTIAL_HASH_SIZE * 2:
+                groups.append({"size": size, "hash": digest, "paths": sorted(paths)})
+            else:
+                full_candidates.extend((path, size) for path in paths)
+        
+        full_groups = self._group_by_hash(full_candidates, self._full_hash, "full",
+                                          reporter, errors, cancelled)
+        for (size, digest), paths in full_groups.items():
+            groups.append({"size": size, "hash": digest, "paths": sorted(paths)})
+        
+        groups.sort(key=lambda group: group["size"] * (len(group["paths"]) - 1), reverse=True)
+        return {
+            "groups": groups,
+            "wasted": sum(group["size"] * (len(group["paths"]) - 1) for group in groups),
+            "files_scanned": files_scanned,
+            "errors": errors,
+            "cancelled": cancelled(),
+            "elapsed": time.perf_counter() - start,
+        }
+    
+    def _group_by_hash(self, files: List[Tuple[str, int]], hash_func: Callable[[str, int], str],
+                       phase: str, reporter: "_ProgressReporter", errors: List[Tuple[str, str]],
+                       cancelled: Callable[[], bool]) -> Dict[Tuple[int, str], List[str]]:
+        """
+        (크기, 해시)로 파일 묶기
+        
+        Returns:
+            {(크기, 해시): [경로, ...]} (두 개 이상인 묶음만)
+        """
+        def compute(item: Tuple[str, int]):
+            path, size = item
+            if cancelled():
+                return None
+            try:
+                return hash_func(path, size)
+            except OSError as e:
+                errors.append((path, str(e)))
+                return None
+        
+        grouped: Dict[Tuple[int, str], List[str]] = {}
+        stats = {"phase": phase, "done": 0, "total": len(files)}
+        for (path, size), digest in zip(files, self._map_bounded(compute, files)):
+            stats["done"] += 1
+            reporter.report(stats)
+            if digest is not None:
+                grouped.setdefault((size, digest), []).append(path)
+        reporter.report(stats, force=True)
+        return {key: paths for key, paths in grouped.items() if len(paths) > 1}
+    
+    def _map_bounded(self, func: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """
+        executor.map()처럼 입력 순서대로 결과를 생성하되, 등록된 작업 수를 제한
+        
+        executor.map()은 모든 항목을 즉시 등록하므로 후보가 수십만 개면 Future도 그만큼 쌓입니다.
+        여기서는 작업이 하나 끝날 때마다 하나씩 채워 넣어 스레드 수 x SUBMIT_WINDOW_PER_WORKER개
+        까지만 대기시키며, 중간에 이터레이션을 멈추면 남은 작업은 취소합니다.
+        
+        Args:
+            func: 각 항목에 적용할 함수
+            items: 입력 항목
+        
+        Returns:
+            결과 이터레이터 (입력 순서)
+        """
+        window = self.max_workers * self.SUBMIT_WINDOW_PER_WORKER
+        iterator = iter(items)
+        pending = deque()
+        try:
+            for item in iterator:
+                pending.append(self.executor.submit(func, item))
+                if len(pending) >= window:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                for item in iterator:
+                    pending.append(self.executor.submit(func, item))
+                    break
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def _partial_hash(self, path: str, size: int) -> str:
+        """파일 앞/뒤 부분 해시 (작은 파일은 전체)"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            digest.update(f.read(self.PARTIAL_HASH_SIZE))
+            if size > self.PARTIAL_HASH_SIZE * 2:
+                f.seek(-self.PARTIAL_HASH_SIZE, os.SEEK_END)
+                digest.update(f.read(self.PARTIAL_HASH_SIZE))
+            elif size > self.PARTIAL_HASH_SIZE:
+                digest.update(f.read())
+        return digest.hexdigest()
+    
+    def _full_hash(self, path: str, size: int) -> str:
+        """파일 전체 해시 (청크 단위로 읽음)"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(self.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def shutdown(self):
+        """스레드 풀 종료"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _ProgressReporter:
+    """진행 콜백 호출 간격 제한"""
+    
+    def __init__(self, callback: Optional[Callable[[Dict], None]], interval: float):
+        self.callback = callback
+        self.interval = interval
+        self._last = 0.0
+    
+    def report(self, stats: Dict, force: bool = False):
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last < self.interval:
+            return
+        self._last = now
+        try:
+            self.callback(dict(stats))
+        except Exception as e:
+            print(f"진행 콜백 오류: {e}")
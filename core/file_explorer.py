@@ -3,10 +3,15 @@
 파일 시스템 탐색 및 기본적인 시스템 제어 기능을 제공합니다.
 """
 import os
-import subprocess
+import stat
 import platform
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from pathlib import Path
+from .disk_analysis import DiskAnalyzer
+from .file_index import FileIndex
+from .file_search import ParallelFileSearch, SearchHandle
+from .fs_watcher import DirectoryWatcher
+from .process_runner import ProcessHandle, ProcessRunner
 
 
 class FileExplorer:
@@ -15,40 +20,120 @@ class FileExplorer:
     def __init__(self):
         """FileExplorer 초기화"""
         self.system = platform.system()
+        # 파일명 색인과 병렬 검색 엔진은 처음 사용할 때 만든다
+        self._file_index = None
+        self._search_engine = None
+        self._disk_analyzer = None
+        # 외부 명령 실행기 (동시 실행 수 제한, 출력 링 버퍼)
+        self.process_runner = ProcessRunner()
     
-    def list_directory(self, path: str = None) -> List[Dict]:
+    @property
+    def file_index(self) -> FileIndex:
+        """파일명 색인 (처음 접근 시 생성)"""
+        if self._file_index is None:
+            self._file_index = FileIndex()
+        return self._file_index
+    
+    def update_index(self, root: str, progress=None, cancel_event=None) -> Dict:
         """
-        디렉토리 내용 나열
+        root 이하 파일명 색인 생성/증분 갱신
         
         Args:
-            path: 디렉토리 경로 (None이면 현재 디렉토리)
+            root: 색인할 루트 디렉토리
+            progress: 진행 콜백 (확인한 디렉토리 수, 다시 읽은 디렉토리 수)
+            cancel_event: 설정되면 색인 중단 (다음 호출 때 이어서 색인)
             
         Returns:
-            파일/디렉토리 정보 리스트
+            색인 통계 딕셔너리
+        """
+        return self.file_index.update(root, progress, cancel_event)
+    
+    def iter_directory(self, path: str = None) -> Iterator[Dict]:
+        """
+        디렉토리 내용을 하나씩 생성 (정렬하지 않음)
+        
+        os.scandir의 DirEntry 정보를 사용하므로 디렉토리는 추가 stat 없이,
+        파일은 크기 조회를 위한 stat 한 번만으로 처리합니다.
+        
+        Args:
+            path: 디렉토리 경로 (None이면 현재 디렉토리)
+            
+        Yields:
+            파일/디렉토리 정보 딕셔너리
         """
         if path is None:
             path = os.getcwd()
         
         try:
-            items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                is_dir = os.path.isdir(item_path)
-                size = 0 if is_dir else os.path.getsize(item_path)
-                
-                items.append({
-                    "name": item,
-                    "path": item_path,
-                    "is_directory": is_dir,
-                    "size": size
-                })
-            
-            return sorted(items, key=lambda x: (not x["is_directory"], x["name"].lower()))
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    yield self._entry_info(entry)
         except PermissionError:
-            return []
+            return
         except Exception as e:
             print(f"디렉토리 나열 오류: {e}")
-            return []
+            return
+    
+    def _entry_info(self, entry: os.DirEntry) -> Dict:
+        """DirEntry를 파일/디렉토리 정보 딕셔너리로 변환"""
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        
+        size = 0
+        if not is_dir:
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                # 깨진 심볼릭 링크 등
+                size = 0
+        
+        return {
+            "name": entry.name,
+            "path": entry.path,
+            "is_directory": is_dir,
+            "size": size
+        }
+    
+    def get_item(self, path: str) -> Optional[Dict]:
+        """
+        경로 하나의 목록 항목 정보 조회 (iter_directory()와 같은 형식)
+        
+        Args:
+            path: 파일/디렉토리 경로
+            
+        Returns:
+            파일/디렉토리 정보 딕셔너리 또는 None (존재하지 않음)
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        is_dir = stat.S_ISDIR(st.st_mode)
+        return {
+            "name": os.path.basename(path),
+            "path": path,
+            "is_directory": is_dir,
+            "size": 0 if is_dir else st.st_size
+        }
+    
+    @staticmethod
+    def sort_key(item: Dict):
+        """목록 정렬 키 (디렉토리 먼저, 이름순)"""
+        return (not item["is_directory"], item["name"].lower())
+    
+    def list_directory(self, path: str = None) -> List[Dict]:
+        """
+        디렉토리 내용 나열
+        
+        Args:
+            path: 디렉토리 경로 (None이면 현재 디렉토리)
+            
+        Returns:
+            파일/디렉토리 정보 리스트
+        """
+        return sorted(self.iter_directory(path), key=self.sort_key)
     
     def get_file_info(self, file_path: str) -> Optional[Dict]:
         """
@@ -74,18 +159,35 @@ class FileExplorer:
             print(f"파일 정보 조회 오류: {e}")
             return None
     
-    def search_files(self, directory: str, pattern: str, recursive: bool = True) -> List[str]:
+    def search_files(self, directory: str, pattern: str, recursive: bool = True,
+                     use_index: bool = True, refresh: bool = True) -> List[str]:
         """
         파일 검색
         
+        directory가 파일명 색인(update_index) 범위에 있으면 검색 범위(directory 하위)만 먼저
+        증분 갱신한 뒤 (수정 시각이 바뀐 디렉토리만 다시 읽음) 색인에서 검색하고,
+        그렇지 않으면 디렉토리를 직접 탐색합니다.
+        
         Args:
             directory: 검색할 디렉토리
             pattern: 검색 패턴 (파일명에 포함될 문자열)
             recursive: 재귀 검색 여부
+            use_index: 파일명 색인 사용 여부
+            refresh: 색인 검색 전 검색 범위 증분 갱신 여부 (방금 update_index()를 호출했으면 False)
             
         Returns:
             찾은 파일 경로 리스트
         """
+        if use_index:
+            try:
+                if self.file_index.covers(directory):
+                    if refresh:
+                        # 색인 이후 추가/삭제된 파일 반영 (감시하지 않는 디렉토리 포함)
+                        self.file_index.refresh(directory, recursive)
+                    return self.file_index.search(directory, pattern, recursive)
+            except Exception as e:
+                print(f"파일 색인 검색 오류: {e}")
+        
         found_files = []
         
         try:
@@ -106,6 +208,88 @@ class FileExplorer:
         
         return found_files
     
+    def create_watcher(self, callback, **options) -> DirectoryWatcher:
+        """
+        디렉토리 감시자 생성
+        
+        감시 이벤트는 파일명 색인에 먼저 반영된 뒤 callback으로 전달됩니다.
+        
+        Args:
+            callback: 합쳐진 이벤트 리스트를 받을 함수 (감시 스레드에서 호출됨)
+            **options: DirectoryWatcher 옵션 (debounce, poll_interval 등)
+            
+        Returns:
+            DirectoryWatcher (watch()로 감시할 디렉토리 추가)
+        """
+        def handle_events(events):
+            if self._file_index is not None:
+                try:
+                    self._file_index.apply_events(events)
+                except Exception as e:
+                    print(f"파일 색인 갱신 오류: {e}")
+            callback(events)
+        
+        return DirectoryWatcher(handle_events, **options)
+    
+    def search_parallel(self, roots: List[str], pattern: str = "", content: str = None,
+                        recursive: bool = True, on_result=None, **options) -> SearchHandle:
+        """
+        여러 디렉토리를 병렬로 검색 (파일명 및 선택적으로 파일 내용)
+        
+        Args:
+            roots: 검색할 루트 디렉토리 목록
+            pattern: 파일명에 포함될 문자열 ("" 이면 모든 파일)
+            content: 파일 내용에 포함될 문자열 (None이면 파일명만 검색)
+            recursive: 재귀 검색 여부
+            on_result: 결과를 찾을 때마다 호출할 콜백 (검색 스레드에서 호출됨)
+            **options: ParallelFileSearch.search()의 추가 옵션 (case_sensitive, max_file_size)
+            
+        Returns:
+            결과를 스트리밍하고 취소할 수 있는 SearchHandle
+        """
+        if self._search_engine is None:
+            self._search_engine = ParallelFileSearch()
+        return self._search_engine.search(
+            roots, pattern, content, recursive=recursive, on_result=on_result, **options
+        )
+    
+    @property
+    def disk_analyzer(self) -> DiskAnalyzer:
+        """디스크 사용량 분석 엔진 (처음 접근 시 생성, 디렉토리 크기 캐시 유지)"""
+        if self._disk_analyzer is None:
+            self._disk_analyzer = DiskAnalyzer()
+        return self._disk_analyzer
+    
+    def disk_usage(self, root: str, progress=None, cancel_event=None, use_cache: bool = True) -> Dict:
+        """
+        root 이하 디렉토리별 재귀 크기 집계 (병렬 탐색, 디렉토리 수정 시각 기반 캐시)
+        
+        Args:
+            root: 분석할 루트 디렉토리
+            progress: 진행 콜백 (진행 상태 딕셔너리)
+            cancel_event: 설정되면 분석 중단 (threading.Event)
+            use_cache: 이전 분석 결과 재사용 여부
+            
+        Returns:
+            크기 집계 결과 딕셔너리 (DiskAnalyzer.disk_usage 참고)
+        """
+        return self.disk_analyzer.disk_usage(root, progress, cancel_event, use_cache)
+    
+    def find_duplicates(self, root: str, min_size: int = 1, progress=None, cancel_event=None) -> Dict:
+        """
+        root 이하 중복 파일 탐지 (크기 -> 부분 해시 -> 전체 해시 순으로 후보 축소)
+        
+        Args:
+            root: 탐색할 루트 디렉토리
+            min_size: 비교 대상 최소 파일 크기 (바이트)
+            progress: 진행 콜백 (진행 상태 딕셔너리)
+            cancel_event: 설정되면 탐지 중단 (threading.Event)
+            
+        Returns:
+            중복 묶음 결과 딕셔너리 (DiskAnalyzer.find_duplicates 참고)
+        """
+        return self.disk_analyzer.find_duplicates(root, min_size, progress, cancel_event)
+    
     def open_file(self, file_path: str) -> bool:
         """
         파일 열기 (시스템 기본 프로그램으로)
@@ -120,9 +304,9 @@ class FileExplorer:
             if self.system == "Windows":
                 os.startfile(file_path)
             elif self.system == "Darwin":  # macOS
-                subprocess.run(["open", file_path])
+                return self.process_runner.spawn_detached(["open", file_path])
             else:  # Linux
-                subprocess.run(["xdg-open", file_path])
+                return self.process_runner.spawn_detached(["xdg-open", file_path])
             return True
         except Exception as e:
             print(f"파일 열기 오류: {e}")
@@ -142,9 +326,9 @@ class FileExplorer:
             if self.system == "Windows":
                 os.startfile(directory_path)
             elif self.system == "Darwin":  # macOS
-                subprocess.run(["open", directory_path])
+                return self.process_runner.spawn_detached(["open", directory_path])
             else:  # Linux
-                subprocess.run(["xdg-open", directory_path])
+                return self.process_runner.spawn_detached(["xdg-open", directory_path])
             return True
         except Exception as e:
             print(f"디렉토리 열기 오류: {e}")
@@ -164,29 +348,43 @@ class FileExplorer:
             "python_version": platform.python_version()
         }
     
-    def execute_command(self, command: str, shell: bool = True) -> tuple[str, int]:
+    def execute_command(self, command: str, shell: bool = True, timeout: float = 10) -> tuple[str, int]:
         """
-        시스템 명령 실행 (주의: 보안상 제한적으로 사용)
+        시스템 명령 실행 후 종료까지 대기 (주의: 보안상 제한적으로 사용)
         
         Args:
             command: 실행할 명령
             shell: 셸 사용 여부
+            timeout: 최대 실행 시간(초)
             
         Returns:
-            (출력, 반환 코드) 튜플
+            (출력, 반환 코드) 튜플 (출력은 최근 줄만 보관됨)
         """
-        try:
-            result = subprocess.run(
-                command,
-                shell=shell,
-                capture_output=True,
-                text=True,
-                timeout=10  # 10초 타임아웃
-            )
-            return (result.stdout + result.stderr, result.returncode)
-        except subprocess.TimeoutExpired:
+        handle = self.process_runner.run(command, shell=shell, timeout=timeout)
+        handle.wait()
+        if handle.error:
+            return (handle.error, -1)
+        if handle.timed_out:
             return ("명령 실행 시간 초과", -1)
-        except Exception as e:
-            return (f"명령 실행 오류: {str(e)}", -1)
+        return (handle.output_text(), handle.returncode)
+    
+    def run_command(self, command: str, on_line=None, on_exit=None, cwd: str = None,
+                    timeout: float = None, shell: bool = True) -> ProcessHandle:
+        """
+        시스템 명령을 백그라운드에서 실행 (즉시 반환, 출력은 줄 단위로 스트리밍)
+        
+        Args:
+            command: 실행할 명령
+            on_line: 출력 줄마다 호출할 콜백 (스트림 이름, 줄) - 백그라운드 스레드에서 호출됨
+            on_exit: 종료 시 호출할 콜백 (ProcessHandle)
+            cwd: 작업 디렉토리
+            timeout: 최대 실행 시간(초, None이면 제한 없음)
+            shell: 셸 사용 여부
+            
+        Returns:
+            ProcessHandle (cancel()로 취소)
+        """
+        return self.process_runner.run(command, shell=shell, cwd=cwd, timeout=timeout,
+                                       on_line=on_line, on_exit=on_exit)
 
 
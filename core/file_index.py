@@ -0,0 +1,412 @@
+"""
+파일명 색인 모듈 (core 패키지)
+SQLite에 파일명을 색인하여 반복 검색 시 디렉토리 전체를 다시 탐색하지 않도록 합니다.
+디렉토리별 수정 시각을 저장하므로 재색인할 때는 변경된 디렉토리만 다시 읽습니다.
+"""
+import os
+import sqlite3
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import Config
+from .db import get_database
+
+
+class FileIndex:
+    """증분 갱신을 지원하는 파일명 색인"""
+    
+    # trigram 토크나이저는 3글자 이상 검색어만 색인으로 찾을 수 있음
+    TRIGRAM_MIN_LENGTH = 3
+    # 색인 중 이 개수의 디렉토리를 처리할 때마다 커밋
+    COMMIT_INTERVAL = 500
+    
+    def __init__(self, db_path: str = None):
+        """
+        파일명 색인 초기화
+        
+        Args:
+            db_path: 색인 DB 경로 (기본값: Config.FILE_INDEX_PATH)
+        """
+        self.db_path = db_path or Config.FILE_INDEX_PATH
+        # 공유 저장소 계층 (스레드별 장기 연결, WAL 모드)
+        self.db = get_database(self.db_path)
+        self._init_database()
+    
+    def _init_database(self):
+        """색인 테이블 초기화"""
+        with self.db.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_roots (
+                    path TEXT PRIMARY KEY,
+                    indexed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_dirs (
+                    path TEXT PRIMARY KEY,
+                    parent TEXT,
+                    mtime_ns INTEGER NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_index_dirs_parent ON index_dirs (parent)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS index_files (
+                    id INTEGER PRIMARY KEY,
+                    dir TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    path TEXT NOT NULL UNIQUE
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_index_files_dir ON index_files (dir)")
+            
+            # 파일명 부분 문자열 검색용 trigram 색인 (트리거로 동기화)
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS index_files_fts USING fts5(
+                    name, content='index_files', content_rowid='id', tokenize='trigram'
+                )
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS index_files_fts_insert AFTER INSERT ON index_files BEGIN
+                    INSERT INTO index_files_fts (rowid, name) VALUES (new.id, new.name);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS index_files_fts_delete AFTER DELETE ON index_files BEGIN
+                    INSERT INTO index_files_fts (index_files_fts, rowid, name)
+                    VALUES ('delete', old.id, old.name);
+                END
+            """)
+    
+    @staticmethod
+    def _normalize(path: str) -> str:
+        """경로 정규화 (절대 경로, 끝 구분자 제거)"""
+        return os.path.normpath(os.path.abspath(path))
+    
+    @staticmethod
+    def _subtree_range(directory: str) -> Tuple[str, str]:
+        """
+        directory 하위 경로를 찾기 위한 문자열 범위 [low, high)
+        
+        "dir/"로 시작하는 모든 문자열은 "dir/" 이상 "dir0" 미만이므로
+        LIKE 대신 인덱스 범위 검색을 사용할 수 있습니다.
+        """
+        prefix = directory.rstrip(os.sep) + os.sep
+        return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+    
+    def get_covering_root(self, directory: str) -> Optional[str]:
+        """
+        directory를 포함하는 색인 루트 조회
+        
+        Args:
+            directory: 검색할 디렉토리
+            
+        Returns:
+            색인 루트 경로 또는 None (색인되지 않음)
+        """
+        directory = self._normalize(directory)
+        for row in self.db.execute("SELECT path FROM index_roots"):
+            root = row[0]
+            if directory == root or directory.startswith(root.rstrip(os.sep) + os.sep):
+                return root
+        return None
+    
+    def covers(self, directory: str) -> bool:
+        """
+        directory가 색인되어 있는지 여부
+        
+        Args:
+            directory: 검색할 디렉토리
+            
+        Returns:
+            색인 루트 하위이면 True
+        """
+        return self.get_covering_root(directory) is not None
+    
+    def update(self, root: str, progress: Callable[[int, int], None] = None,
+               cancel_event: threading.Event = None) -> Dict:
+        """
+        root 이하를 증분 색인
+        
+        수정 시각이 저장된 값과 같은 디렉토리는 다시 읽지 않고, 알고 있는 하위 디렉토리만 확인합니다.
+        (디렉토리 수정 시각은 그 안의 항목이 추가/삭제/이름 변경될 때만 바뀝니다.)
+        중단되면 그때까지 읽은 디렉토리만 저장하고 root를 색인 루트로 등록하지 않으므로,
+        다음 호출 때 이미 읽은 디렉토리는 건너뛰고 이어서 색인합니다.
+        
+        Args:
+            root: 색인할 루트 디렉토리
+            progress: 진행 콜백 (확인한 디렉토리 수, 다시 읽은 디렉토리 수)
+            cancel_event: 설정되면 색인 중단
+            
+        Returns:
+            {"dirs_checked", "dirs_rescanned", "dirs_removed", "cancelled", "elapsed"} 통계
+        """
+        started = time.perf_counter()
+        root = self._normalize(root)
+        conn = self.db.connection()
+        low, high = self._subtree_range(root)
+        
+        try:
+            stats = self._update_tree(conn, root, True, progress, cancel_event)
+            if not stats["cancelled"]:
+                # 새 루트가 기존 하위 루트를 포함하면 하나로 합침
+                conn.execute(
+                    "DELETE FROM index_roots WHERE path >= ? AND path < ?", (low, high)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO index_roots (path, indexed_at) VALUES (?, ?)",
+                    (root, time.time()),
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        stats["elapsed"] = time.perf_counter() - started
+        return stats
+    
+    def refresh(self, directory: str, recursive: bool = True) -> Dict:
+        """
+        색인된 디렉토리 하나(와 하위)만 증분 갱신 (색인 루트 목록은 바꾸지 않음)
+        
+        검색 직전에 검색 범위만 확인하기 위한 것으로, 루트 전체를 확인하는 update()보다 가볍습니다.
+        
+        Args:
+            directory: 색인 루트 하위 디렉토리
+            recursive: 하위 디렉토리까지 확인할지 여부 (False면 directory 자신만)
+            
+        Returns:
+            {"dirs_checked", "dirs_rescanned", "dirs_removed", "cancelled", "elapsed"} 통계
+        """
+        started = time.perf_counter()
+        directory = self._normalize(directory)
+        conn = self.db.connection()
+        try:
+            stats = self._update_tree(conn, directory, recursive)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        stats["elapsed"] = time.perf_counter() - started
+        return stats
+    
+    def _update_tree(self, conn: sqlite3.Connection, root: str, recursive: bool,
+                     progress: Callable[[int, int], None] = None,
+                     cancel_event: threading.Event = None) -> Dict:
+        """root 이하(recursive가 False면 root만)의 바뀐 디렉토리를 다시 읽음 (커밋은 호출한 쪽에서)"""
+        # 기존 디렉토리 정보 (root 자신과 하위 전체)
+        known: Dict[str, int] = {}
+        children: Dict[str, List[str]] = {}
+        if recursive:
+            low, high = self._subtree_range(root)
+            rows = conn.execute(
+                "SELECT path, parent, mtime_ns FROM index_dirs WHERE path = ? OR (path >= ? AND path < ?)",
+                (root, low, high),
+            )
+        else:
+            rows = conn.execute("SELECT path, parent, mtime_ns FROM index_dirs WHERE path = ?", (root,))
+        for path, parent, mtime_ns in rows:
+            known[path] = mtime_ns
+            children.setdefault(parent, []).append(path)
+        
+        seen = set()
+        checked = 0
+        rescanned = 0
+        stack = [root]
+        cancelled = False
+        
+        while stack:
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
+            directory = stack.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            seen.add(directory)
+            checked += 1
+            
+            if known.get(directory) == mtime_ns:
+                # 변경 없음: 목록을 다시 읽지 않고 알려진 하위 디렉토리만 확인
+                if recursive:
+                    stack.extend(children.get(directory, []))
+                continue
+            
+            subdirs = self._rescan_directory(conn, directory, mtime_ns)
+            if recursive:
+                stack.extend(subdirs)
+            rescanned += 1
+            
+            if rescanned % self.COMMIT_INTERVAL == 0:
+                conn.commit()
+            if progress:
+                progress(checked, rescanned)
+        
+        # 사라진 디렉토리 정리 (중단된 경우 확인하지 못한 디렉토리가 있으므로 생략)
+        removed = [] if cancelled else [path for path in known if path not in seen]
+        for path in removed:
+            conn.execute("DELETE FROM index_files WHERE dir = ?", (path,))
+            conn.execute("DELETE FROM index_dirs WHERE path = ?", (path,))
+        
+        return {
+            "dirs_checked": checked,
+            "dirs_rescanned": rescanned,
+            "dirs_removed": len(removed),
+            "cancelled": cancelled,
+        }
+    
+    def _rescan_directory(self, conn: sqlite3.Connection, directory: str, mtime_ns: int) -> List[str]:
+        """
+        디렉토리 하나를 다시 읽어 파일 목록 교체
+        
+        Returns:
+            하위 디렉토리 경로 리스트 (심볼릭 링크 디렉토리는 따라가지 않음)
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            files.append((directory, entry.name, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            # 권한 없음 등: 이 디렉토리만 건너뜀
+            pass
+        
+        conn.execute("DELETE FROM index_files WHERE dir = ?", (directory,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO index_files (dir, name, path) VALUES (?, ?, ?)", files
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO index_dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+            (directory, os.path.dirname(directory), mtime_ns),
+        )
+        return subdirs
+    
+    def search(self, directory: str, pattern: str, recursive: bool = True,
+               limit: Optional[int] = None) -> List[str]:
+        """
+        색인에서 파일명 검색 (대소문자 무시 부분 문자열 일치)
+        
+        Args:
+            directory: 검색할 디렉토리
+            pattern: 파일명에 포함될 문자열
+            recursive: 하위 디렉토리 포함 여부
+            limit: 최대 결과 수 (None이면 전체)
+            
+        Returns:
+            찾은 파일 경로 리스트
+        """
+        directory = self._normalize(directory)
+        sql = "SELECT path FROM index_files WHERE "
+        params: List = []
+        
+        if recursive:
+            low, high = self._subtree_range(directory)
+            sql += "(dir = ? OR (dir >= ? AND dir < ?))"
+            params.extend([directory, low, high])
+        else:
+            sql += "dir = ?"
+            params.append(directory)
+        
+        if len(pattern) >= self.TRIGRAM_MIN_LENGTH:
+            sql += " AND id IN (SELECT rowid FROM index_files_fts WHERE index_files_fts MATCH ?)"
+            params.append('"' + pattern.replace('"', '""') + '"')
+        elif pattern:
+            sql += " AND name LIKE ? ESCAPE '\\'"
+            escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return [row[0] for row in self.db.execute(sql, params)]
+    
+    def apply_events(self, events: List[Dict]):
+        """
+        파일 감시 이벤트(DirectoryWatcher)를 색인에 바로 반영
+        
+        색인된 디렉토리의 파일 추가/삭제/이름 변경은 해당 행만 고치고 디렉토리 수정 시각도 갱신하여
+        다음 update()에서 다시 읽지 않도록 합니다. 새 디렉토리처럼 내용을 모르는 변경은
+        부모 디렉토리를 "변경됨"으로 표시해 두어 다음 update()에서 다시 읽게 합니다.
+        
+        Args:
+            events: fs_watcher 이벤트 딕셔너리 리스트
+        """
+        touched = set()
+        stale = set()
+        
+        with self.db.transaction() as conn:
+            def is_indexed(directory: str) -> bool:
+                return conn.execute(
+                    "SELECT 1 FROM index_dirs WHERE path = ?", (directory,)
+                ).fetchone() is not None
+            
+            for event in events:
+                kind = event["type"]
+                path = self._normalize(event["path"])
+                
+                if kind == "overflow":
+                    stale.add(path)
+                    continue
+                
+                if kind in ("deleted", "renamed"):
+                    self._remove_path(conn, path, event.get("is_directory", False))
+                    touched.add(os.path.dirname(path))
+                
+                target = None
+                if kind == "created":
+                    target = path
+                elif kind == "renamed" and event.get("dest_path"):
+                    target = self._normalize(event["dest_path"])
+                if target is None:
+                    continue
+                
+                parent = os.path.dirname(target)
+                if event.get("is_directory", False):
+                    # 새 디렉토리의 내용은 다음 update()에서 읽음
+                    stale.add(parent)
+                elif is_indexed(parent):
+                    conn.execute(
+                        "INSERT OR REPLACE INTO index_files (dir, name, path) VALUES (?, ?, ?)",
+                        (parent, os.path.basename(target), target),
+                    )
+                    touched.add(parent)
+            
+            for directory in touched - stale:
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    continue
+                conn.execute("UPDATE index_dirs SET mtime_ns = ? WHERE path = ?", (mtime_ns, directory))
+            for directory in stale:
+                conn.execute("UPDATE index_dirs SET mtime_ns = -1 WHERE path = ?", (directory,))
+    
+    def _remove_path(self, conn: sqlite3.Connection, path: str, is_directory: bool):
+        """파일 또는 디렉토리(하위 전체) 색인 삭제"""
+        conn.execute("DELETE FROM index_files WHERE path = ?", (path,))
+        if is_directory:
+            low, high = self._subtree_range(path)
+            conn.execute("DELETE FROM index_files WHERE dir = ? OR (dir >= ? AND dir < ?)", (path, low, high))
+            conn.execute("DELETE FROM index_dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, low, high))
+    
+    def remove_root(self, root: str):
+        """
+        색인 루트와 그 하위 항목 삭제
+        
+        Args:
+            root: 색인 루트 경로
+        """
+        root = self._normalize(root)
+        low, high = self._subtree_range(root)
+        with self.db.transaction() as conn:
+            conn.execute("DELETE FROM index_files WHERE dir = ? OR (dir >= ? AND dir < ?)", (root, low, high))
+            conn.execute("DELETE FROM index_dirs WHERE path = ? OR (path >= ? AND path < ?)", (root, low, high))
+            conn.execute("DELETE FROM index_roots WHERE path = ?", (root,))
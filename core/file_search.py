@@ -0,0 +1,318 @@
+"""
+병렬 파일 검색 모듈 (core 패키지)
+여러 루트 디렉토리를 스레드 풀로 동시에 탐색하고, 선택적으로 파일 내용을 mmap으로 검색합니다.
+결과는 찾는 즉시 SearchHandle을 통해 스트리밍되며 언제든 취소할 수 있습니다.
+"""
+import os
+import re
+import mmap
+import queue
+import weakref
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class SearchHandle:
+    """진행 중인 검색의 결과 스트림 및 취소 핸들"""
+    
+    # 결과 스트림 종료 표시
+    _DONE = object()
+    
+    def __init__(self, on_result: Callable[[Dict], None] = None):
+        """
+        검색 핸들 초기화
+        
+        Args:
+            on_result: 결과를 찾을 때마다 (검색 스레드에서) 호출할 콜백 (선택적)
+        """
+        self.on_result = on_result
+        # 권한 없음 등으로 건너뛴 경로 [(경로, 오류 메시지), ...]
+        self.errors: List[Tuple[str, str]] = []
+        self._queue: "queue.Queue" = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+    
+    def cancel(self):
+        """검색 취소 (이미 시작된 디렉토리 작업은 곧 중단됨)"""
+        self._cancel_event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._cancel_event.is_set()
+    
+    @property
+    def done(self) -> bool:
+        """검색 종료 여부 (완료 또는 취소)"""
+        return self._done_event.is_set()
+    
+    def wait(self, timeout: float = None) -> bool:
+        """
+        검색 종료 대기
+        
+        Args:
+            timeout: 최대 대기 시간(초)
+            
+        Returns:
+            종료 여부
+        """
+        return self._done_event.wait(timeout)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        """찾는 순서대로 결과를 생성 (검색이 끝나면 종료)"""
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                # 다른 이터레이터도 종료되도록 다시 넣어둠
+                self._queue.put(self._DONE)
+                return
+            yield item
+    
+    def results(self, timeout: float = None) -> List[Dict]:
+        """
+        검색이 끝날 때까지 기다린 뒤 모든 결과 반환
+        
+        Args:
+            timeout: 최대 대기 시간(초)
+            
+        Returns:
+            결과 리스트 (시간 초과 시 그때까지의 결과)
+        """
+        self.wait(timeout)
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._DONE:
+                self._queue.put(self._DONE)
+                break
+            items.append(item)
+        return items
+    
+    def _emit(self, result: Dict):
+        """결과 전달"""
+        self._queue.put(result)
+        if self.on_result:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                print(f"검색 결과 콜백 오류: {e}")
+    
+    def _task_started(self):
+        with self._lock:
+            self._pending += 1
+    
+    def _task_finished(self):
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self._done_event.set()
+            self._queue.put(self._DONE)
+
+
+class ParallelFileSearch:
+    """스레드 풀 기반 병렬 파일 검색 엔진"""
+    
+    # 이보다 큰 파일은 내용 검색에서 제외 (바이트)
+    DEFAULT_MAX_FILE_SIZE = 50 * 1024 * 1024
+    # 바이너리 파일 판별을 위해 검사할 앞부분 크기
+    BINARY_CHECK_SIZE = 8192
+    # 줄 번호 계산 시 한 번에 읽는 크기
+    LINE_COUNT_CHUNK = 1024 * 1024
+    # 내용 검색어를 인코딩할 문자 집합 (UTF-8 및 한국어 Windows 기본 인코딩)
+    CONTENT_ENCODINGS = ("utf-8", "cp949")
+    
+    def __init__(self, max_workers: int = None):
+        """
+        검색 엔진 초기화
+        
+        Args:
+            max_workers: 스레드 수 (기본값: CPU 수 기반, 디스크 I/O 대기를 고려해 여유 있게)
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="file-search")
+        # 진행 중인 검색 핸들 (shutdown() 시 취소)
+        self._handles: "weakref.WeakSet[SearchHandle]" = weakref.WeakSet()
+        self._handles_lock = threading.Lock()
+    
+    def search(self, roots: Sequence[str], pattern: str = "", content: Optional[str] = None,
+               recursive: bool = True, case_sensitive: bool = False,
+               max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+               on_result: Callable[[Dict], None] = None) -> SearchHandle:
+        """
+        검색 시작 (즉시 반환)
+        
+        Args:
+            roots: 검색할 루트 디렉토리 목록
+            pattern: 파일명에 포함될 문자열 ("" 이면 모든 파일)
+            content: 파일 내용에 포함될 문자열 (None이면 파일명만 검색)
+            recursive: 하위 디렉토리 포함 여부
+            case_sensitive: 대소문자 구분 여부
+            max_file_size: 내용 검색 대상 최대 파일 크기 (바이트)
+            on_result: 결과를 찾을 때마다 호출할 콜백 (검색 스레드에서 호출됨)
+            
+        Returns:
+            SearchHandle (이터레이션으로 결과를 스트리밍, cancel()로 취소)
+            결과 딕셔너리: {"path", "type": "name"} 또는
+            {"path", "type": "content", "line_number", "line"}
+        """
+        handle = SearchHandle(on_result)
+        with self._handles_lock:
+            self._handles.add(handle)
+        name_pattern = pattern if case_sensitive else pattern.lower()
+        content_regex = self._compile_content_regex(content, case_sensitive) if content else None
+        
+        options = {
+            "name_pattern": name_pattern,
+            "case_sensitive": case_sensitive,
+            "content_regex": content_regex,
+            "recursive": recursive,
+            "max_file_size": max_file_size,
+        }
+        
+        # 루트가 하나도 없어도 종료 표시가 되도록 시작 작업을 하나 잡아둠
+        handle._task_started()
+        for root in dict.fromkeys(os.path.abspath(root) for root in roots):
+            self._submit_directory(handle, root, options)
+        handle._task_finished()
+        return handle
+    
+    def _compile_content_regex(self, content: str, case_sensitive: bool) -> "re.Pattern":
+        """내용 검색어를 인코딩별 바이트 정규식으로 변환"""
+        variants = []
+        for encoding in self.CONTENT_ENCODINGS:
+            try:
+                encoded = content.encode(encoding)
+            except UnicodeEncodeError:
+                continue
+            if encoded not in variants:
+                variants.append(encoded)
+        flags = 0 if case_sensitive else re.IGNORECASE
+        return re.compile(b"|".join(re.escape(variant) for variant in variants), flags)
+    
+    def _submit_directory(self, handle: SearchHandle, directory: str, options: Dict):
+        """디렉토리 작업 등록"""
+        handle._task_started()
+        try:
+            future = self.executor.submit(self._search_directory, handle, directory, options)
+        except RuntimeError:
+            # 엔진이 종료된 경우
+            handle._task_finished()
+            return
+        future.add_done_callback(lambda f: self._on_task_done(handle, f))
+    
+    @staticmethod
+    def _on_task_done(handle: SearchHandle, future: Future):
+        """실행되지 못하고 취소된 작업도 완료로 처리 (shutdown() 후 핸들이 끝나지 않는 문제 방지)"""
+        if future.cancelled():
+            handle._task_finished()
+    
+    def _search_directory(self, handle: SearchHandle, directory: str, options: Dict):
+        """디렉토리 하나 검색 (하위 디렉토리는 별도 작업으로 분산)"""
+        try:
+            if handle.cancelled:
+                return
+            
+            try:
+                with os.scandir(directory) as entries:
+                    entry_list = list(entries)
+            except OSError as e:
+                # 디렉토리 하나의 권한 오류가 전체 검색을 멈추지 않도록 기록만 함
+                handle.errors.append((directory, str(e)))
+                return
+            
+            for entry in entry_list:
+                if handle.cancelled:
+                    return
+                try:
+                    if entry.is_dir():
+                        if options["recursive"] and not entry.is_symlink():
+                            self._submit_directory(handle, entry.path, options)
+                        continue
+                except OSError:
+                    continue
+                
+                name = entry.name if options["case_sensitive"] else entry.name.lower()
+                if options["name_pattern"] not in name:
+                    continue
+                
+                if options["content_regex"] is None:
+                    handle._emit({"path": entry.path, "type": "name"})
+                else:
+                    match = self._grep_file(entry, options["content_regex"], options["max_file_size"])
+                    if match is not None:
+                        line_number, line = match
+                        handle._emit({
+                            "path": entry.path,
+                            "type": "content",
+                            "line_number": line_number,
+                            "line": line,
+                        })
+        except Exception as e:
+            handle.errors.append((directory, str(e)))
+        finally:
+            handle._task_finished()
+    
+    def _grep_file(self, entry: os.DirEntry, regex: "re.Pattern", max_file_size: int) -> Optional[Tuple[int, str]]:
+        """
+        mmap으로 파일 내용 검색 (파일 전체를 메모리에 읽지 않음)
+        
+        Returns:
+            (줄 번호, 줄 내용) 또는 None (불일치/바이너리/크기 초과/읽기 실패)
+        """
+        try:
+            size = entry.stat().st_size
+            if size == 0 or size > max_file_size:
+                return None
+            
+            with open(entry.path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 앞부분에 NUL 바이트가 있으면 바이너리로 간주
+                    if mm.find(b"\0", 0, min(size, self.BINARY_CHECK_SIZE)) != -1:
+                        return None
+                    
+                    match = regex.search(mm)
+                    if match is None:
+                        return None
+                    
+                    start = match.start()
+                    line_start = mm.rfind(b"\n", 0, start) + 1
+                    line_end = mm.find(b"\n", start)
+                    if line_end == -1:
+                        line_end = size
+                    line = self._decode_line(mm[line_start:line_end])
+                    return self._count_lines(mm, line_start) + 1, line
+        except (OSError, ValueError):
+            return None
+    
+    def _count_lines(self, mm: mmap.mmap, end: int) -> int:
+        """end 위치 앞의 줄바꿈 수 (고정 크기 조각 단위로 계산)"""
+        count = 0
+        for offset in range(0, end, self.LINE_COUNT_CHUNK):
+            count += mm[offset:min(offset + self.LINE_COUNT_CHUNK, end)].count(b"\n")
+        return count
+    
+    def _decode_line(self, data: bytes) -> str:
+        """검색 결과 줄을 문자열로 변환"""
+        data = data.rstrip(b"\r")
+        for encoding in self.CONTENT_ENCODINGS:
+            try:
+                return data.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+        return data.decode("utf-8", errors="replace")
+    
+    def shutdown(self):
+        """스레드 풀 종료 (진행 중인 검색은 취소되고, 대기 중이던 작업은 완료로 처리됨)"""
+        with self._handles_lock:
+            handles = list(self._handles)
+        for handle in handles:
+            handle.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
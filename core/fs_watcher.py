@@ -0,0 +1,409 @@
+"""
+파일 시스템 감시 모듈 (core 패키지)
+디렉토리의 파일 생성/삭제/수정/이름 변경을 감지하여 묶어서 전달합니다.
+Linux에서는 inotify를 사용하고, 그 외 환경에서는 주기적 스캔(polling)으로 동작합니다.
+
+이벤트 딕셔너리 형식:
+    {"type": "created" | "deleted" | "modified" | "renamed" | "overflow",
+     "path": 경로, "dest_path": 새 경로(renamed만), "is_directory": bool}
+"overflow"는 커널 이벤트 큐가 넘쳐 일부 이벤트가 유실되었음을 뜻하며, 해당 디렉토리를 다시 읽어야 합니다.
+"""
+import os
+import sys
+import stat
+import time
+import select
+import struct
+import threading
+from typing import Callable, Dict, List, Optional
+
+# inotify 상수 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_INOTIFY_MASK = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    """libc의 inotify 함수 로드 (사용할 수 없으면 None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class _EventCoalescer:
+    """짧은 시간 동안 발생한 이벤트를 경로별로 합치는 버퍼"""
+    
+    def __init__(self):
+        self._pending: Dict[str, Dict] = {}
+    
+    def add(self, event: Dict):
+        """이벤트 추가 (같은 경로의 이전 이벤트와 합침)"""
+        path = event["path"]
+        previous = self._pending.get(path)
+        kind = event["type"]
+        
+        if kind == "overflow":
+            self._pending[path] = event
+        elif kind == "created":
+            # 삭제 후 다시 생성 → 수정
+            if previous is not None and previous["type"] == "deleted":
+                self._pending[path] = dict(event, type="modified")
+            else:
+                self._pending[path] = event
+        elif kind == "modified":
+            # 생성/수정 이벤트가 이미 있으면 그대로 둠
+            if previous is None:
+                self._pending[path] = event
+        elif kind == "deleted":
+            # 생성 직후 삭제 → 없던 일
+            if previous is not None and previous["type"] == "created":
+                del self._pending[path]
+            else:
+                self._pending[path] = event
+        elif kind == "renamed":
+            self._pending.pop(path, None)
+            if previous is not None and previous["type"] == "created":
+                # 생성 직후 이름 변경 → 새 이름으로 생성
+                self.add(dict(event, type="created", path=event["dest_path"], dest_path=None))
+            else:
+                self._pending[path] = event
+                # 새 이름 위치의 이전 삭제 이벤트는 이름 변경으로 대체됨
+                dest_previous = self._pending.get(event["dest_path"])
+                if dest_previous is not None and dest_previous["type"] == "deleted":
+                    del self._pending[event["dest_path"]]
+    
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+    
+    def drain(self) -> List[Dict]:
+        """합쳐진 이벤트를 꺼내고 비움"""
+        events = list(self._pending.values())
+        self._pending.clear()
+        return events
+
+
+class DirectoryWatcher:
+    """디렉토리 변경 감시자 (하위 디렉토리는 감시하지 않음)"""
+    
+    def __init__(self, callback: Callable[[List[Dict]], None], debounce: float = 0.2,
+                 max_latency: float = 1.0, poll_interval: float = 1.0, use_inotify: bool = None):
+        """
+        감시자 초기화
+        
+        Args:
+            callback: 합쳐진 이벤트 리스트를 받을 함수 (감시 스레드에서 호출됨)
+            debounce: 마지막 이벤트 후 이 시간(초) 동안 조용하면 전달
+            max_latency: 이벤트가 계속 발생해도 이 시간(초)이 지나면 전달
+            poll_interval: polling 모드의 스캔 주기(초)
+            use_inotify: inotify 사용 여부 (None이면 가능할 때 사용)
+        """
+        self.callback = callback
+        self.debounce = debounce
+        self.max_latency = max_latency
+        self.poll_interval = poll_interval
+        
+        self._libc = _load_inotify() if use_inotify is not False else None
+        self.backend = "inotify" if self._libc is not None else "polling"
+        
+        self._lock = threading.Condition()
+        self._coalescer = _EventCoalescer()
+        self._first_event_at: Optional[float] = None
+        self._last_event_at: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        
+        # inotify 상태
+        self._fd: Optional[int] = None
+        self._wd_to_path: Dict[int, str] = {}
+        self._path_to_wd: Dict[str, int] = {}
+        self._pending_moves: Dict[int, Dict] = {}
+        
+        # polling 상태 (경로별 스냅샷)
+        self._snapshots: Dict[str, Dict[str, tuple]] = {}
+    
+    def start(self):
+        """감시 스레드 시작"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        
+        if self.backend == "inotify":
+            self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if self._fd < 0:
+                # 감시 개수 제한 등으로 실패하면 polling으로 대체
+                self._fd = None
+                self.backend = "polling"
+        
+        reader = self._inotify_loop if self.backend == "inotify" else self._polling_loop
+        for target, name in ((reader, "fs-watcher"), (self._dispatch_loop, "fs-watcher-dispatch")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self):
+        """감시 중지"""
+        self._stop_event.set()
+        with self._lock:
+            self._lock.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=2)
+        self._threads = []
+        
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._wd_to_path.clear()
+        self._path_to_wd.clear()
+        self._snapshots.clear()
+    
+    def watch(self, path: str) -> bool:
+        """
+        디렉토리 감시 추가
+        
+        Args:
+            path: 감시할 디렉토리
+            
+        Returns:
+            성공 여부
+        """
+        path = os.path.abspath(path)
+        if not os.path.isdir(path):
+            return False
+        if not self._threads:
+            self.start()
+        
+        if self.backend == "inotify" and self._fd is not None:
+            if path in self._path_to_wd:
+                return True
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _INOTIFY_MASK)
+            if wd < 0:
+                print(f"디렉토리 감시 실패: {path}")
+                return False
+            self._wd_to_path[wd] = path
+            self._path_to_wd[path] = wd
+            return True
+        
+        with self._lock:
+            self._snapshots[path] = self._snapshot(path)
+        return True
+    
+    def unwatch(self, path: str):
+        """
+        디렉토리 감시 해제
+        
+        Args:
+            path: 감시 중인 디렉토리
+        """
+        path = os.path.abspath(path)
+        if self.backend == "inotify" and self._fd is not None:
+            wd = self._path_to_wd.pop(path, None)
+            if wd is not None:
+                self._wd_to_path.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+            return
+        
+        with self._lock:
+            self._snapshots.pop(path, None)
+    
+    def watched_paths(self) -> List[str]:
+        """감시 중인 디렉토리 목록"""
+        if self.backend == "inotify":
+            return list(self._path_to_wd)
+        with self._lock:
+            return list(self._snapshots)
+    
+    # ===== 이벤트 수집/전달 =====
+    
+    def _push(self, event: Dict):
+        """원시 이벤트를 버퍼에 추가"""
+        with self._lock:
+            now = time.monotonic()
+            if not self._coalescer:
+                self._first_event_at = now
+            self._last_event_at = now
+            self._coalescer.add(event)
+            self._lock.notify_all()
+    
+    def _dispatch_loop(self):
+        """조용해지거나 최대 지연 시간이 지나면 합쳐진 이벤트 전달"""
+        while not self._stop_event.is_set():
+            with self._lock:
+                if not self._coalescer:
+                    self._lock.wait(timeout=0.5)
+                    continue
+                
+                now = time.monotonic()
+                quiet_for = now - self._last_event_at
+                waited = now - self._first_event_at
+                if quiet_for < self.debounce and waited < self.max_latency:
+                    self._lock.wait(timeout=min(self.debounce - quiet_for, self.max_latency - waited))
+                    continue
+                
+                events = self._coalescer.drain()
+            
+            try:
+                self.callback(events)
+            except Exception as e:
+                print(f"파일 감시 콜백 오류: {e}")
+    
+    # ===== inotify =====
+    
+    def _inotify_loop(self):
+        """inotify 이벤트 읽기"""
+        while not self._stop_event.is_set():
+            try:
+                readable, _, _ = select.select([self._fd], [], [], 0.5)
+                if not readable:
+                    continue
+                data = os.read(self._fd, 64 * 1024)
+            except (OSError, ValueError, TypeError):
+                # stop()에서 fd를 닫은 경우
+                if self._stop_event.is_set():
+                    return
+                time.sleep(0.1)
+                continue
+            self._parse_inotify_events(data)
+            self._flush_unpaired_moves()
+    
+    def _parse_inotify_events(self, data: bytes):
+        """inotify_event 구조체 배열 해석"""
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            name_bytes = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length]
+            offset += _EVENT_HEADER.size + length
+            
+            directory = self._wd_to_path.get(wd)
+            if mask & IN_Q_OVERFLOW:
+                for path in list(self._path_to_wd):
+                    self._push({"type": "overflow", "path": path, "dest_path": None, "is_directory": True})
+                continue
+            if directory is None or mask & IN_IGNORED:
+                continue
+            
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                self._push({"type": "deleted", "path": directory, "dest_path": None, "is_directory": True})
+                continue
+            
+            path = os.path.join(directory, os.fsdecode(name_bytes.rstrip(b"\0")))
+            is_dir = bool(mask & IN_ISDIR)
+            
+            if mask & IN_MOVED_FROM:
+                # 짝이 되는 IN_MOVED_TO를 cookie로 기다림
+                self._pending_moves[cookie] = {"path": path, "is_directory": is_dir}
+            elif mask & IN_MOVED_TO:
+                source = self._pending_moves.pop(cookie, None)
+                if source is not None:
+                    self._push({"type": "renamed", "path": source["path"], "dest_path": path, "is_directory": is_dir})
+                else:
+                    # 감시하지 않는 곳에서 옮겨옴
+                    self._push({"type": "created", "path": path, "dest_path": None, "is_directory": is_dir})
+            elif mask & IN_CREATE:
+                self._push({"type": "created", "path": path, "dest_path": None, "is_directory": is_dir})
+            elif mask & IN_DELETE:
+                self._push({"type": "deleted", "path": path, "dest_path": None, "is_directory": is_dir})
+            elif mask & (IN_MODIFY | IN_CLOSE_WRITE):
+                self._push({"type": "modified", "path": path, "dest_path": None, "is_directory": is_dir})
+    
+    def _flush_unpaired_moves(self):
+        """짝이 없는 IN_MOVED_FROM은 감시 범위 밖으로 옮겨진 것이므로 삭제로 처리"""
+        for source in self._pending_moves.values():
+            self._push({"type": "deleted", "path": source["path"], "dest_path": None,
+                        "is_directory": source["is_directory"]})
+        self._pending_moves.clear()
+    
+    # ===== polling =====
+    
+    @staticmethod
+    def _snapshot(path: str) -> Dict[str, tuple]:
+        """디렉토리 스냅샷 {이름: (디렉토리 여부, 크기, 수정 시각, inode)}"""
+        snapshot = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    snapshot[entry.name] = (stat.S_ISDIR(st.st_mode), st.st_size, st.st_mtime_ns, st.st_ino)
+        except OSError:
+            return {}
+        return snapshot
+    
+    def _polling_loop(self):
+        """주기적으로 스냅샷을 비교하여 이벤트 생성"""
+        while not self._stop_event.wait(self.poll_interval):
+            with self._lock:
+                paths = list(self._snapshots)
+            
+            for path in paths:
+                if not os.path.isdir(path):
+                    self._push({"type": "deleted", "path": path, "dest_path": None, "is_directory": True})
+                    with self._lock:
+                        self._snapshots.pop(path, None)
+                    continue
+                
+                current = self._snapshot(path)
+                with self._lock:
+                    previous = self._snapshots.get(path)
+                    if previous is None:
+                        continue
+                    self._snapshots[path] = current
+                for event in self._diff_snapshots(path, previous, current):
+                    self._push(event)
+    
+    @staticmethod
+    def _diff_snapshots(directory: str, previous: Dict[str, tuple], current: Dict[str, tuple]) -> List[Dict]:
+        """두 스냅샷의 차이를 이벤트로 변환 (inode가 같으면 이름 변경으로 판단)"""
+        events = []
+        removed = {name: info for name, info in previous.items() if name not in current}
+        added = {name: info for name, info in current.items() if name not in previous}
+        
+        removed_by_inode = {info[3]: name for name, info in removed.items() if info[3]}
+        for name, info in added.items():
+            source = removed_by_inode.pop(info[3], None) if info[3] else None
+            if source is not None:
+                del removed[source]
+                events.append({"type": "renamed", "path": os.path.join(directory, source),
+                               "dest_path": os.path.join(directory, name), "is_directory": info[0]})
+            else:
+                events.append({"type": "created", "path": os.path.join(directory, name),
+                               "dest_path": None, "is_directory": info[0]})
+        
+        for name, info in removed.items():
+            events.append({"type": "deleted", "path": os.path.join(directory, name),
+                           "dest_path": None, "is_directory": info[0]})
+        
+        for name, info in current.items():
+            old = previous.get(name)
+            if old is not None and (old[1], old[2]) != (info[1], info[2]):
+                events.append({"type": "modified", "path": os.path.join(directory, name),
+                               "dest_path": None, "is_directory": info[0]})
+        return events
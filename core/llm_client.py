@@ -4,7 +4,10 @@ Google Gemini API 또는 오프라인 모드를 사용하여 자연어 명령을
 """
 import google.generativeai as genai
 import logging
+import re
+from typing import Iterator, Optional
 from .config import Config
+from .response_cache import ResponseCache
 
 # 로깅 설정 (디버깅용)
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +40,21 @@ class OfflineLLM:
             return f"현재 시간은 {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}입니다."
         else:
             return "오프라인 모드에서는 제한적인 응답만 가능합니다. 온라인 모드로 전환하시면 더 많은 기능을 사용하실 수 있습니다."
+    
+    def generate_response_stream(self, user_message: str) -> Iterator[str]:
+        """
+        규칙 기반 응답을 단어 단위 조각으로 생성 (스트리밍 인터페이스 호환)
+        
+        Args:
+            user_message: 사용자 메시지
+            
+        Yields:
+            응답 텍스트 조각
+        """
+        response = self.generate_response(user_message)
+        # 공백을 보존하여 조각을 이어 붙이면 원래 응답과 같아지도록 분할
+        for match in re.finditer(r"\S+\s*", response):
+            yield match.group(0)
 
 
 class LLMClient:
@@ -51,6 +69,8 @@ class LLMClient:
             self.offline_llm = OfflineLLM()
             self.model = None
             self.chat_session = None
+            # 오프라인 응답은 즉시 생성되고 시간 등에 따라 달라지므로 캐시하지 않음
+            self.response_cache = None
             print("오프라인 모드로 실행 중입니다.")
         else:
             # 온라인 모드 (Gemini API)
@@ -85,6 +105,9 @@ class LLMClient:
             self.temperature = Config.LLM_TEMPERATURE
             self.offline_llm = None
             
+            # 응답 캐시 (같은 요청은 API 할당량을 쓰지 않고 응답)
+            self.response_cache = ResponseCache() if Config.LLM_CACHE_ENABLED else None
+            
             # 채팅 세션 초기화
             self.chat_session = None
         
@@ -126,56 +149,27 @@ class LLMClient:
             # 오프라인 모드
             return self.offline_llm.generate_response(user_message)
         
+        # 캐시된 응답이 있으면 API를 호출하지 않음
+        cache_key = self._cache_key(user_message, conversation_history)
+        cached_response = self._get_cached_response(cache_key, user_message, conversation_history)
+        if cached_response is not None:
+            return cached_response
+        
         # 온라인 모드 (Gemini API)
         try:
-            # 채팅 세션이 없거나 대화 기록이 초기화된 경우 새 세션 시작
-            if self.chat_session is None or not conversation_history:
-                self.chat_session = self.model.start_chat(history=[])
-                # 첫 메시지에 시스템 프롬프트 포함
-                initial_prompt = f"{self.system_prompt}\n\n사용자: {user_message}"
-                # generation_config는 모델 초기화 시 설정되므로 별도로 전달하지 않음
-                response = self.chat_session.send_message(initial_prompt)
-            else:
-                # 기존 대화 기록이 있는 경우, Gemini 형식으로 변환
-                # conversation_history는 OpenAI 형식이므로 Gemini 형식으로 변환 필요
-                # 하지만 Gemini는 자동으로 세션 히스토리를 관리하므로 단순히 메시지만 전송
-                response = self.chat_session.send_message(user_message)
+            response = self._send_message(user_message, conversation_history)
             
             # 응답 처리 - Gemini API는 response.text로 직접 접근 가능
             if response is None:
                 logger.error("API 응답이 None입니다")
                 return "응답을 받을 수 없습니다. 다시 시도해주세요."
             
-            # response.text 속성으로 직접 접근 시도 (가장 일반적인 방법)
-            try:
-                if hasattr(response, 'text'):
-                    response_text = response.text
-                    logger.info(f"response.text로 응답 받음: 길이={len(response_text) if response_text else 0}")
-                    if response_text and response_text.strip():
-                        return response_text.strip()
-                    else:
-                        logger.warning("response.text가 비어있습니다")
-            except Exception as text_error:
-                logger.warning(f"response.text 접근 실패: {text_error}")
-                # text 속성 접근 실패 시 다른 방법 시도
-                pass
-            
-            # response.text가 없는 경우 대체 방법 시도
-            # candidates를 통해 접근
-            try:
-                if hasattr(response, 'candidates') and response.candidates:
-                    for candidate in response.candidates:
-                        if hasattr(candidate, 'content'):
-                            content = candidate.content
-                            if hasattr(content, 'parts') and content.parts:
-                                text_parts = []
-                                for part in content.parts:
-                                    if hasattr(part, 'text') and part.text:
-                                        text_parts.append(part.text)
-                                if text_parts:
-                                    return ''.join(text_parts).strip()
-            except Exception as candidate_error:
-                pass
+            response_text = self._extract_text(response)
+            if response_text and response_text.strip():
+                response_text = response_text.strip()
+                if self.response_cache is not None:
+                    self.response_cache.set(cache_key, response_text)
+                return response_text
             
             # 모든 방법 실패 시 - 실제 응답 객체 정보를 포함한 디버깅 메시지
             response_info = f"응답 타입: {type(response).__name__}"
@@ -187,22 +181,220 @@ class LLMClient:
             return f"응답을 처리할 수 없습니다. {response_info}"
             
         except Exception as e:
-            error_str = str(e)
-            error_type = type(e).__name__
-            logger.error(f"API 호출 중 오류 발생: {error_type} - {error_str}")
+            return self._format_api_error(e)
+    
+    def chat_stream(self, user_message: str, conversation_history: list = None) -> Iterator[str]:
+        """
+        사용자 메시지에 대한 응답을 조각 단위로 생성 (스트리밍)
+        
+        첫 조각이 도착하는 즉시 반환하므로 긴 응답도 바로 표시를 시작할 수 있습니다.
+        오류가 발생하면 chat()과 같은 형식의 오류 메시지를 마지막 조각으로 반환합니다.
+        
+        Args:
+            user_message: 사용자 메시지
+            conversation_history: 대화 기록 (선택적)
             
-            # 할당량 초과 오류인지 확인
-            if "429" in error_str or "quota" in error_str.lower() or "exceeded" in error_str.lower():
-                error_msg = self._format_quota_error_message(error_str)
-                return error_msg
-            # 모델을 찾을 수 없는 오류인지 확인
-            elif "not found" in error_str.lower() or "404" in error_str or "not supported" in error_str.lower():
-                available_models = self._get_available_models()
-                error_msg = self._format_model_error_message(error_str, available_models)
-                return error_msg
+        Yields:
+            응답 텍스트 조각
+        """
+        if self.use_offline:
+            # 오프라인 모드도 같은 인터페이스로 조각 단위 전달
+            yield from self.offline_llm.generate_response_stream(user_message)
+            return
+        
+        # 캐시된 응답은 한 번에 전달
+        cache_key = self._cache_key(user_message, conversation_history)
+        cached_response = self._get_cached_response(cache_key, user_message, conversation_history)
+        if cached_response is not None:
+            yield cached_response
+            return
+        
+        try:
+            response = self._send_message(user_message, conversation_history, stream=True)
+            if response is None:
+                logger.error("API 응답이 None입니다")
+                yield "응답을 받을 수 없습니다. 다시 시도해주세요."
+                return
+            
+            chunks = []
+            for chunk in response:
+                chunk_text = self._extract_text(chunk)
+                if chunk_text:
+                    chunks.append(chunk_text)
+                    yield chunk_text
+            
+            if not chunks:
+                logger.warning("스트리밍 응답이 비어있습니다")
+                yield "응답을 받을 수 없습니다. 다시 시도해주세요."
+            elif self.response_cache is not None:
+                # 끝까지 정상 수신한 응답만 캐시
+                self.response_cache.set(cache_key, "".join(chunks).strip())
+        except Exception as e:
+            yield self._format_api_error(e)
+    
+    def _cache_key(self, user_message: str, conversation_history: list = None) -> str:
+        """
+        응답 캐시 키 생성 (시스템 프롬프트, 대화 기록, 메시지, 모델, 온도 기준)
+        
+        Args:
+            user_message: 사용자 메시지
+            conversation_history: 대화 기록 (선택적)
+            
+        Returns:
+            캐시 키
+        """
+        return ResponseCache.make_key(
+            self.system_prompt,
+            conversation_history,
+            user_message,
+            Config.LLM_MODEL,
+            self.temperature,
+        )
+    
+    def _get_cached_response(self, cache_key: str, user_message: str,
+                             conversation_history: list = None) -> Optional[str]:
+        """
+        캐시된 응답 조회 (적중 시 채팅 세션 기록에도 반영)
+        
+        Args:
+            cache_key: 캐시 키
+            user_message: 사용자 메시지
+            conversation_history: 대화 기록 (선택적)
+            
+        Returns:
+            캐시된 응답 또는 None
+        """
+        if self.response_cache is None:
+            return None
+        
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.debug("캐시된 응답 사용")
+            self._record_cached_turn(user_message, conversation_history, cached_response)
+        return cached_response
+    
+    def _record_cached_turn(self, user_message: str, conversation_history: list, response_text: str):
+        """
+        캐시에서 응답한 대화 턴을 채팅 세션 기록에 추가
+        
+        API를 거치지 않은 턴도 세션에 남겨야 이후 메시지가 같은 맥락에서 이어집니다.
+        """
+        try:
+            if self.chat_session is None or not conversation_history:
+                initial_prompt = f"{self.system_prompt}\n\n사용자: {user_message}"
+                self.chat_session = self.model.start_chat(history=[
+                    {"role": "user", "parts": [initial_prompt]},
+                    {"role": "model", "parts": [response_text]},
+                ])
             else:
-                # 기타 오류 - 간단한 메시지만 반환
-                return f"오류가 발생했습니다 ({error_type}): {error_str}"
+                self.chat_session.history = list(self.chat_session.history) + [
+                    {"role": "user", "parts": [user_message]},
+                    {"role": "model", "parts": [response_text]},
+                ]
+        except Exception as e:
+            logger.warning(f"캐시된 응답을 채팅 세션에 반영하지 못했습니다: {e}")
+    
+    def get_cache_stats(self) -> Optional[dict]:
+        """
+        응답 캐시 통계 조회
+        
+        Returns:
+            캐시 통계 딕셔너리 또는 None (캐시 비활성화)
+        """
+        if self.response_cache is None:
+            return None
+        return self.response_cache.stats()
+    
+    def _send_message(self, user_message: str, conversation_history: list = None, stream: bool = False):
+        """
+        Gemini 채팅 세션으로 메시지 전송
+        
+        Args:
+            user_message: 사용자 메시지
+            conversation_history: 대화 기록 (선택적)
+            stream: 스트리밍 응답 여부
+            
+        Returns:
+            Gemini 응답 객체 (stream=True이면 조각 단위로 순회 가능)
+        """
+        # 채팅 세션이 없거나 대화 기록이 초기화된 경우 새 세션 시작
+        if self.chat_session is None or not conversation_history:
+            self.chat_session = self.model.start_chat(history=[])
+            # 첫 메시지에 시스템 프롬프트 포함
+            initial_prompt = f"{self.system_prompt}\n\n사용자: {user_message}"
+            # generation_config는 모델 초기화 시 설정되므로 별도로 전달하지 않음
+            return self.chat_session.send_message(initial_prompt, stream=stream)
+        
+        # 기존 대화 기록이 있는 경우, Gemini 형식으로 변환
+        # conversation_history는 OpenAI 형식이므로 Gemini 형식으로 변환 필요
+        # 하지만 Gemini는 자동으로 세션 히스토리를 관리하므로 단순히 메시지만 전송
+        return self.chat_session.send_message(user_message, stream=stream)
+    
+    def _extract_text(self, response) -> Optional[str]:
+        """
+        Gemini 응답(또는 스트리밍 조각)에서 텍스트 추출
+        
+        Args:
+            response: Gemini 응답 객체 또는 스트리밍 조각
+            
+        Returns:
+            추출된 텍스트 또는 None
+        """
+        # response.text 속성으로 직접 접근 시도 (가장 일반적인 방법)
+        try:
+            if hasattr(response, 'text'):
+                response_text = response.text
+                logger.debug(f"response.text로 응답 받음: 길이={len(response_text) if response_text else 0}")
+                if response_text:
+                    return response_text
+                logger.debug("response.text가 비어있습니다")
+        except Exception as text_error:
+            logger.debug(f"response.text 접근 실패: {text_error}")
+            # text 속성 접근 실패 시 다른 방법 시도
+        
+        # response.text가 없는 경우 대체 방법 시도
+        # candidates를 통해 접근
+        try:
+            if hasattr(response, 'candidates') and response.candidates:
+                for candidate in response.candidates:
+                    if hasattr(candidate, 'content'):
+                        content = candidate.content
+                        if hasattr(content, 'parts') and content.parts:
+                            text_parts = []
+                            for part in content.parts:
+                                if hasattr(part, 'text') and part.text:
+                                    text_parts.append(part.text)
+                            if text_parts:
+                                return ''.join(text_parts)
+        except Exception:
+            pass
+        
+        return None
+    
+    def _format_api_error(self, error: Exception) -> str:
+        """
+        API 호출 오류를 사용자에게 보여줄 메시지로 변환
+        
+        Args:
+            error: 발생한 예외
+            
+        Returns:
+            포맷팅된 오류 메시지
+        """
+        error_str = str(error)
+        error_type = type(error).__name__
+        logger.error(f"API 호출 중 오류 발생: {error_type} - {error_str}")
+        
+        # 할당량 초과 오류인지 확인
+        if "429" in error_str or "quota" in error_str.lower() or "exceeded" in error_str.lower():
+            return self._format_quota_error_message(error_str)
+        # 모델을 찾을 수 없는 오류인지 확인
+        elif "not found" in error_str.lower() or "404" in error_str or "not supported" in error_str.lower():
+            available_models = self._get_available_models()
+            return self._format_model_error_message(error_str, available_models)
+        else:
+            # 기타 오류 - 간단한 메시지만 반환
+            return f"오류가 발생했습니다 ({error_type}): {error_str}"
     
     def _format_model_error_message(self, error_str: str, available_models: list) -> str:
         """
@@ -312,8 +504,6 @@ API 키를 확인하세요."""
         Returns:
             포맷팅된 오류 메시지
         """
-        import re
-        
         # 재시도 시간 추출
         retry_match = re.search(r'Please retry in ([\d.]+)s', error_str)
         retry_time = retry_match.group(1) if retry_match else None
@@ -2,44 +2,148 @@
 메모 관리 모듈 (core 패키지)
 SQLite를 사용하여 메모를 저장하고 관리합니다.
 """
+import re
 import sqlite3
-import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from .config import Config
+from .db import get_database
+from .migrations import migrate
 
 
 class MemoManager:
     """메모 관리자"""
     
+    # trigram 토크나이저는 3글자 이상 검색어만 색인으로 찾을 수 있음 (2글자는 bigram 색인 사용)
+    TRIGRAM_MIN_LENGTH = 3
+    # bigram 색인에 넣는 단어 (밑줄은 FTS 토크나이저에서 구분자이므로 제외)
+    BIGRAM_WORD_PATTERN = re.compile(r"[^\W_]+")
+    # iter_memos()가 한 번에 DB에서 읽어오는 행 수
+    DEFAULT_BATCH_SIZE = 200
+    
     def __init__(self):
         """메모 관리자 초기화 및 데이터베이스 설정"""
-        # 데이터 디렉토리 생성
-        db_dir = os.path.dirname(Config.DB_PATH)
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-        
         self.db_path = Config.DB_PATH
-        self._init_database()
-    
-    def _init_database(self):
-        """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS memos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                tags TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
+        # 공유 저장소 계층 (스레드별 장기 연결, WAL 모드)
+        self.db = get_database(self.db_path)
+        # 스키마 생성/변경(전문 검색 색인, 태그 테이블 포함)은 마이그레이션에서 처리
+        migrate(self.db)
+        self.fts_tokenizer = self._get_fts_tokenizer()
+    
+    @staticmethod
+    def parse_tags(tags: Optional[str]) -> List[str]:
+        """
+        쉼표로 구분된 태그 문자열을 정규화된 태그 리스트로 변환
+        
+        Args:
+            tags: 태그 문자열 (예: "AI, 업무,ai")
+            
+        Returns:
+            공백 제거/소문자 변환/중복 제거된 태그 리스트 (예: ["ai", "업무"])
+        """
+        if not tags:
+            return []
+        
+        parsed = []
+        for tag in tags.split(","):
+            tag = tag.strip().casefold()
+            if tag and tag not in parsed:
+                parsed.append(tag)
+        return parsed
+    
+    @classmethod
+    def bigram_text(cls, text: Optional[str]) -> str:
+        """
+        bigram 색인에 저장할 토큰 문자열 생성
+        
+        Args:
+            text: 원문 (예: "주간 회의록")
+            
+        Returns:
+            단어별로 연속된 두 글자를 공백으로 이은 문자열 (예: "주간 회의 의록")
+        """
+        if not text:
+            return ""
+        return " ".join(
+            word[i:i + 2] for word in cls.BIGRAM_WORD_PATTERN.findall(text.casefold()) for i in range(len(word) - 1)
+        )
+    
+    def _write_bigrams(self, conn: sqlite3.Connection, memo_id: int):
+        """메모의 bigram 색인 행을 현재 내용 기준으로 다시 기록 (삭제는 트리거에서 처리)"""
+        row = conn.execute("SELECT title, content, tags FROM memos WHERE id = ?", (memo_id,)).fetchone()
+        conn.execute("DELETE FROM memos_bigram WHERE rowid = ?", (memo_id,))
+        if row is not None:
+            conn.execute(
+                "INSERT INTO memos_bigram (rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+                (memo_id, *(self.bigram_text(value) for value in row)),
             )
-        """)
+    
+    def _write_tags(self, conn: sqlite3.Connection, memo_id: int, tags: Optional[str]):
+        """메모의 태그 행을 tags 문자열 기준으로 다시 기록"""
+        conn.execute("DELETE FROM memo_tags WHERE memo_id = ?", (memo_id,))
+        conn.executemany(
+            "INSERT INTO memo_tags (memo_id, tag) VALUES (?, ?)",
+            [(memo_id, tag) for tag in self.parse_tags(tags)],
+        )
+    
+    def _get_fts_tokenizer(self) -> str:
+        """전문 검색 색인에 사용 중인 토크나이저 이름"""
+        row = self.db.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memos_fts'"
+        ).fetchone()
+        if row and "trigram" in row[0]:
+            return "trigram"
+        return "unicode61"
+    
+    def _build_fts_query(self, search_query: str,
+                         columns: str = None) -> Tuple[Optional[str], Optional[str], List[str]]:
+        """
+        검색어를 FTS5 MATCH 식으로 변환
+        
+        Args:
+            search_query: 사용자 검색어 (공백으로 구분된 단어는 모두 포함해야 함)
+            columns: 검색할 컬럼 (예: "title content", None이면 전체)
+            
+        Returns:
+            (memos_fts MATCH 식 또는 None, 2글자 단어의 memos_bigram MATCH 식 또는 None,
+             색인으로 찾을 수 없어 LIKE로 걸러야 하는 단어 리스트 (1글자 또는 기호가 섞인 2글자))
+        """
+        terms = search_query.split()
+        indexed_terms = []
+        bigram_terms = []
+        like_terms = []
+        
+        for term in terms:
+            if self.fts_tokenizer == "trigram" and len(term) < self.TRIGRAM_MIN_LENGTH:
+                if len(term) == 2 and self.BIGRAM_WORD_PATTERN.fullmatch(term):
+                    bigram_terms.append(term.casefold())
+                else:
+                    like_terms.append(term)
+            else:
+                indexed_terms.append(term)
         
-        conn.commit()
-        conn.close()
+        bigram_expression = None
+        if bigram_terms:
+            bigram_expression = " AND ".join(f'"{term}"' for term in bigram_terms)
+            if columns:
+                bigram_expression = f"{{{columns}}} : ({bigram_expression})"
+        
+        if not indexed_terms:
+            return None, bigram_expression, like_terms
+        
+        # 각 단어를 따옴표로 감싸 FTS 문법 문자가 해석되지 않도록 함
+        phrases = []
+        for term in indexed_terms:
+            phrase = '"' + term.replace('"', '""') + '"'
+            if self.fts_tokenizer != "trigram":
+                # unicode61은 토큰 단위이므로 접두어 검색으로 조사가 붙은 단어도 찾음
+                phrase += "*"
+            phrases.append(phrase)
+        
+        match_expression = " AND ".join(phrases)
+        if columns:
+            match_expression = f"{{{columns}}} : ({match_expression})"
+        return match_expression, bigram_expression, like_terms
     
     def add_memo(self, title: str, content: str = "", tags: str = "") -> int:
         """
@@ -53,18 +157,15 @@ class MemoManager:
         Returns:
             생성된 메모의 ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         now = datetime.now().isoformat()
-        cursor.execute("""
-            INSERT INTO memos (title, content, tags, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (title, content, tags, now, now))
-        
-        memo_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO memos (title, content, tags, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (title, content, tags, now, now))
+            memo_id = cursor.lastrowid
+            self._write_tags(conn, memo_id, tags)
+            self._write_bigrams(conn, memo_id)
         
         return memo_id
     
@@ -73,34 +174,240 @@ class MemoManager:
         메모 목록 조회
         
         Args:
-            tag: 태그 필터 (선택적)
+            tag: 태그 필터 (정확히 일치, 대소문자 무시, 선택적)
             search_query: 검색 쿼리 (제목/내용 검색, 선택적)
             
         Returns:
             메모 목록
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        where, params = self._build_memo_filter(tag, search_query)
+        return self.db.fetch_all(
+            f"SELECT * FROM memos WHERE {where} ORDER BY updated_at DESC, id DESC", params
+        )
+    
+    def _build_memo_filter(self, tag: Optional[str], search_query: Optional[str]) -> Tuple[str, List]:
+        """
+        메모 목록 조회용 WHERE 절 생성
         
-        query = "SELECT * FROM memos WHERE 1=1"
+        Args:
+            tag: 태그 필터 (선택적)
+            search_query: 검색 쿼리 (선택적)
+            
+        Returns:
+            (WHERE 절, 바인딩 파라미터 리스트)
+        """
+        query = "1=1"
         params = []
         
         if tag:
-            query += " AND tags LIKE ?"
-            params.append(f"%{tag}%")
+            # 태그 인덱스 조회 (부분 문자열이 아닌 정확한 태그 일치)
+            query += " AND id IN (SELECT memo_id FROM memo_tags WHERE tag = ?)"
+            params.append(tag.strip().casefold())
         
         if search_query:
-            query += " AND (title LIKE ? OR content LIKE ?)"
-            params.extend([f"%{search_query}%", f"%{search_query}%"])
+            match_expression, bigram_expression, like_terms = self._build_fts_query(search_query, "title content")
+            if match_expression:
+                query += " AND id IN (SELECT rowid FROM memos_fts WHERE memos_fts MATCH ?)"
+                params.append(match_expression)
+            if bigram_expression:
+                query += " AND id IN (SELECT rowid FROM memos_bigram WHERE memos_bigram MATCH ?)"
+                params.append(bigram_expression)
+            for term in like_terms:
+                query += " AND (title LIKE ? OR content LIKE ?)"
+                params.extend([f"%{term}%", f"%{term}%"])
+        
+        return query, params
+    
+    @staticmethod
+    def page_cursor(memo: Dict) -> Tuple[str, int]:
+        """
+        메모 행의 페이지 커서 (다음 페이지의 after 인자로 사용)
+        
+        Args:
+            memo: 메모 딕셔너리
+            
+        Returns:
+            (updated_at, id) 튜플
+        """
+        return (memo["updated_at"], memo["id"])
+    
+    def get_memos_page(self, tag: Optional[str] = None, search_query: Optional[str] = None,
+                       after: Optional[Tuple[str, int]] = None, limit: int = 50) -> List[Dict]:
+        """
+        메모 목록 한 페이지 조회 (키셋 페이지네이션, 최근 수정순)
+        
+        Args:
+            tag: 태그 필터 (선택적)
+            search_query: 검색 쿼리 (제목/내용 검색, 선택적)
+            after: 이전 페이지 마지막 행의 page_cursor() (None이면 첫 페이지)
+            limit: 최대 행 수
+            
+        Returns:
+            메모 목록
+        """
+        where, params = self._build_memo_filter(tag, search_query)
+        
+        if after is not None:
+            where += " AND (updated_at, id) < (?, ?)"
+            params.extend(after)
+        
+        params.append(limit)
+        return self.db.fetch_all(
+            f"SELECT * FROM memos WHERE {where} ORDER BY updated_at DESC, id DESC LIMIT ?", params
+        )
+    
+    def iter_memos(self, tag: Optional[str] = None, search_query: Optional[str] = None,
+                   after: Optional[Tuple[str, int]] = None, limit: Optional[int] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+        """
+        메모를 최근 수정순으로 하나씩 생성 (전체 목록을 메모리에 올리지 않음)
+        
+        batch_size 단위로 get_memos_page()를 호출하며, 배치 사이에 DB 커서를 열어두지 않습니다.
+        
+        Args:
+            tag: 태그 필터 (선택적)
+            search_query: 검색 쿼리 (선택적)
+            after: 시작 커서 (None이면 처음부터)
+            limit: 최대 개수 (None이면 끝까지)
+            batch_size: 한 번에 읽을 행 수
+            
+        Yields:
+            메모 딕셔너리
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            page = self.get_memos_page(tag, search_query, after, page_size)
+            yield from page
+            
+            if len(page) < page_size:
+                return
+            after = self.page_cursor(page[-1])
+            if remaining is not None:
+                remaining -= len(page)
+    
+    def search_memos(self, query: str, limit: int = 50, offset: int = 0,
+                     highlight: Tuple[str, str] = ("<b>", "</b>")) -> List[Dict]:
+        """
+        메모 전문 검색 (bm25 관련도 순)
+        
+        3글자 이상 단어는 trigram 색인, 2글자 단어는 bigram 색인으로 찾습니다.
+        2글자 단어만 있으면 미리보기는 원문에서 직접 만들며, 색인으로 찾을 수 없는 1글자 단어
+        (또는 기호가 섞인 2글자 단어)는 LIKE로 거르므로, 이런 단어만으로 검색하면 전체 메모를 훑고
+        관련도 없이(rank None) 최근 수정 순으로 반환합니다.
+        
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함해야 함)
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수 (페이지 처리용)
+            highlight: 일치 부분을 감쌀 (시작, 끝) 문자열
+            
+        Returns:
+            메모 목록 (각 항목에 snippet, rank 포함, rank가 작을수록 관련도 높음)
+        """
+        query = query.strip()
+        if not query:
+            return []
+        
+        match_expression, bigram_expression, like_terms = self._build_fts_query(query)
+        
+        if match_expression is None and bigram_expression is None:
+            # 색인으로 찾을 수 없는 1글자 검색어만 있는 경우 LIKE로 검색
+            return self._search_memos_like(like_terms, limit, offset, highlight)
         
-        query += " ORDER BY updated_at DESC"
+        if match_expression is not None:
+            sql = """
+                SELECT memos.*,
+                       snippet(memos_fts, -1, ?, ?, '…', 16) AS snippet,
+                       bm25(memos_fts, 10.0, 1.0, 5.0) AS rank
+                FROM memos_fts
+                JOIN memos ON memos.id = memos_fts.rowid
+                WHERE memos_fts MATCH ?
+            """
+            params = [highlight[0], highlight[1], match_expression]
+            if bigram_expression:
+                sql += " AND memos.id IN (SELECT rowid FROM memos_bigram WHERE memos_bigram MATCH ?)"
+                params.append(bigram_expression)
+        else:
+            # 2글자 단어만 있는 경우 bigram 색인의 관련도 사용 (색인에는 원문이 없으므로 미리보기는 따로 생성)
+            sql = """
+                SELECT memos.*,
+                       bm25(memos_bigram, 10.0, 1.0, 5.0) AS rank
+                FROM memos_bigram
+                JOIN memos ON memos.id = memos_bigram.rowid
+                WHERE memos_bigram MATCH ?
+            """
+            params = [bigram_expression]
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        for term in like_terms:
+            sql += " AND (memos.title LIKE ? OR memos.content LIKE ? OR memos.tags LIKE ?)"
+            params.extend([f"%{term}%"] * 3)
         
-        return [dict(row) for row in rows]
+        sql += " ORDER BY rank LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        memos = self.db.fetch_all(sql, params)
+        if match_expression is None:
+            for memo in memos:
+                memo["snippet"] = self._make_snippet(memo, query.split()[0], highlight)
+        return memos
+    
+    def iter_search_memos(self, query: str, batch_size: int = DEFAULT_BATCH_SIZE,
+                          highlight: Tuple[str, str] = ("<b>", "</b>")) -> Iterator[Dict]:
+        """
+        전문 검색 결과를 관련도 순으로 하나씩 생성
+        
+        Args:
+            query: 검색어
+            batch_size: 한 번에 가져올 결과 수
+            highlight: 일치 부분을 감쌀 (시작, 끝) 문자열
+            
+        Yields:
+            search_memos()와 같은 형식의 메모 딕셔너리
+        """
+        offset = 0
+        while True:
+            page = self.search_memos(query, limit=batch_size, offset=offset, highlight=highlight)
+            yield from page
+            if len(page) < batch_size:
+                return
+            offset += len(page)
+    
+    def _search_memos_like(self, terms: List[str], limit: int, offset: int,
+                           highlight: Tuple[str, str]) -> List[Dict]:
+        """짧은 검색어용 LIKE 검색 (최근 수정 순)"""
+        sql = "SELECT * FROM memos WHERE 1=1"
+        params = []
+        for term in terms:
+            sql += " AND (title LIKE ? OR content LIKE ? OR tags LIKE ?)"
+            params.extend([f"%{term}%"] * 3)
+        sql += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+        
+        memos = self.db.fetch_all(sql, params)
+        for memo in memos:
+            memo["snippet"] = self._make_snippet(memo, terms[0], highlight)
+            memo["rank"] = None
+        return memos
+    
+    def _make_snippet(self, memo: Dict, term: str, highlight: Tuple[str, str],
+                      context: int = 20) -> str:
+        """검색어 주변 텍스트를 잘라 강조 표시한 미리보기 생성"""
+        for column in ("title", "content", "tags"):
+            text = memo.get(column) or ""
+            index = text.lower().find(term.lower())
+            if index < 0:
+                continue
+            start = max(0, index - context)
+            end = min(len(text), index + len(term) + context)
+            return (
+                ("…" if start > 0 else "")
+                + text[start:index]
+                + highlight[0] + text[index:index + len(term)] + highlight[1]
+                + text[index + len(term):end]
+                + ("…" if end < len(text) else "")
+            )
+        return ""
     
     def get_memo(self, memo_id: int) -> Optional[Dict]:
         """
@@ -112,15 +419,7 @@ class MemoManager:
         Returns:
             메모 딕셔너리 또는 None
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM memos WHERE id = ?", (memo_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        return dict(row) if row else None
+        return self.db.fetch_one("SELECT * FROM memos WHERE id = ?", (memo_id,))
     
     def update_memo(self, memo_id: int, title: str = None, 
                    content: str = None, tags: str = None) -> bool:
@@ -136,9 +435,6 @@ class MemoManager:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         updates = []
         params = []
         
@@ -155,25 +451,48 @@ class MemoManager:
             params.append(tags)
         
         if not updates:
-            conn.close()
             return False
         
         updates.append("updated_at = ?")
         params.append(datetime.now().isoformat())
         params.append(memo_id)
         
-        cursor.execute(f"""
-            UPDATE memos 
-            SET {', '.join(updates)}
-            WHERE id = ?
-        """, params)
-        
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            cursor = conn.execute(f"""
+                UPDATE memos 
+                SET {', '.join(updates)}
+                WHERE id = ?
+            """, params)
+            success = cursor.rowcount > 0
+            if success and tags is not None:
+                self._write_tags(conn, memo_id, tags)
+            if success:
+                self._write_bigrams(conn, memo_id)
         
         return success
     
+    def tag_counts(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        태그별 메모 개수 조회 (태그 클라우드용)
+        
+        Args:
+            limit: 최대 태그 수 (None이면 전체)
+            
+        Returns:
+            [{"tag": 태그, "count": 메모 수}, ...] (개수 많은 순)
+        """
+        sql = """
+            SELECT tag, COUNT(*) AS count
+            FROM memo_tags
+            GROUP BY tag
+            ORDER BY count DESC, tag ASC
+        """
+        params = []
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self.db.fetch_all(sql, params)
+    
     def delete_memo(self, memo_id: int) -> bool:
         """
         메모 삭제
@@ -184,15 +503,7 @@ class MemoManager:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM memos WHERE id = ?", (memo_id,))
-        success = cursor.rowcount > 0
-        
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            cursor = conn.execute("DELETE FROM memos WHERE id = ?", (memo_id,))
         
-        return success
-
-
+        return cursor.rowcount > 0
@@ -0,0 +1,248 @@
+"""
+데이터베이스 스키마 마이그레이션 모듈 (core 패키지)
+PRAGMA user_version으로 스키마 버전을 관리하며, 시작 시 한 번만 필요한 마이그레이션을 적용합니다.
+
+새 스키마 변경은 MIGRATIONS 끝에 (버전, 설명, 함수) 항목을 추가하세요.
+이미 배포된 마이그레이션은 수정하지 않습니다.
+"""
+import re
+import sqlite3
+import threading
+from typing import Callable, List, Set, Tuple
+from .db import Database
+
+
+def _create_base_tables(conn: sqlite3.Connection):
+    """할 일/메모 기본 테이블"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS todos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            completed INTEGER DEFAULT 0,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS memos (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            content TEXT,
+            tags TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+
+def _create_memo_search_index(conn: sqlite3.Connection):
+    """메모 전문 검색(FTS5) 색인 및 동기화 트리거"""
+    # trigram은 띄어쓰기/조사와 무관하게 한국어 부분 문자열을 찾을 수 있음
+    # (SQLite 3.34 미만이면 unicode61로 대체)
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5(
+                title, content, tags,
+                content='memos', content_rowid='id',
+                tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS memos_fts USING fts5(
+                title, content, tags,
+                content='memos', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+    
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS memos_fts_insert AFTER INSERT ON memos BEGIN
+            INSERT INTO memos_fts (rowid, title, content, tags)
+            VALUES (new.id, new.title, new.content, new.tags);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS memos_fts_delete AFTER DELETE ON memos BEGIN
+            INSERT INTO memos_fts (memos_fts, rowid, title, content, tags)
+            VALUES ('delete', old.id, old.title, old.content, old.tags);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS memos_fts_update AFTER UPDATE ON memos BEGIN
+            INSERT INTO memos_fts (memos_fts, rowid, title, content, tags)
+            VALUES ('delete', old.id, old.title, old.content, old.tags);
+            INSERT INTO memos_fts (rowid, title, content, tags)
+            VALUES (new.id, new.title, new.content, new.tags);
+        END
+    """)
+    
+    # 기존 메모 색인
+    conn.execute("INSERT INTO memos_fts (memos_fts) VALUES ('rebuild')")
+
+
+def _create_memo_tags(conn: sqlite3.Connection):
+    """정규화된 메모 태그 테이블 및 기존 tags 컬럼 이전"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS memo_tags (
+            memo_id INTEGER NOT NULL REFERENCES memos(id) ON DELETE CASCADE,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (memo_id, tag)
+        ) WITHOUT ROWID
+    """)
+    # 태그로 메모를 찾는 조회용 인덱스
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_memo_tags_tag ON memo_tags (tag, memo_id)")
+    
+    # 기존 태그 이전 (배포된 마이그레이션 결과가 바뀌지 않도록 MemoManager.parse_tags 대신 규칙을 이 함수 안에 고정)
+    def parse_tags(tags):
+        parsed = []
+        for tag in tags.split(","):
+            tag = tag.strip().casefold()
+            if tag and tag not in parsed:
+                parsed.append(tag)
+        return parsed
+    
+    rows = conn.execute(
+        "SELECT id, tags FROM memos WHERE tags IS NOT NULL AND tags != ''"
+    ).fetchall()
+    conn.executemany(
+        "INSERT OR IGNORE INTO memo_tags (memo_id, tag) VALUES (?, ?)",
+        [(memo_id, tag) for memo_id, tags in rows for tag in parse_tags(tags)],
+    )
+
+
+def _create_list_indexes(conn: sqlite3.Connection):
+    """목록 조회 정렬/필터 컬럼 인덱스"""
+    # get_todos(completed=...) ORDER BY created_at DESC
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_todos_completed_created
+        ON todos (completed, created_at)
+    """)
+    # get_todos() ORDER BY created_at DESC
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_todos_created ON todos (created_at)")
+    # get_memos() ORDER BY updated_at DESC
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_memos_updated ON memos (updated_at)")
+
+
+def _create_transcriptions(conn: sqlite3.Connection):
+    """음성 파일 일괄 인식 상태 테이블 (중단된 작업 이어서 처리)"""
+    # status: pending (인식 대기/중단됨), done, failed
+    # memo_id: 메모로 가져온 경우 그 메모 ID (메모가 삭제되어도 다시 가져오지 않도록 외래 키 없이 보관)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS transcriptions (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            model TEXT,
+            text TEXT,
+            error TEXT,
+            duration REAL,
+            memo_id INTEGER,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_transcriptions_status ON transcriptions (status)")
+
+
+def _create_memo_bigram_index(conn: sqlite3.Connection):
+    """2글자 검색어용 메모 bigram 색인 (trigram 색인은 3글자 이상 검색어만 찾을 수 있음)"""
+    # 각 컬럼에는 원문 대신 연속된 두 글자 토큰을 공백으로 이어 저장 (메모 추가/수정 시 MemoManager가 기록)
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS memos_bigram USING fts5(
+            title, content, tags,
+            tokenize='unicode61'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS memos_bigram_delete AFTER DELETE ON memos BEGIN
+            DELETE FROM memos_bigram WHERE rowid = old.id;
+        END
+    """)
+    
+    # 기존 메모 색인 (배포된 마이그레이션 결과가 바뀌지 않도록 토큰 분리 규칙은 이 함수 안에 고정)
+    word_pattern = re.compile(r"[^\W_]+")
+    
+    def bigrams(text):
+        if not text:
+            return ""
+        return " ".join(
+            word[i:i + 2] for word in word_pattern.findall(text.casefold()) for i in range(len(word) - 1)
+        )
+    
+    rows = conn.execute("SELECT id, title, content, tags FROM memos").fetchall()
+    conn.executemany(
+        "INSERT INTO memos_bigram (rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+        [(memo_id, bigrams(title), bigrams(content), bigrams(tags)) for memo_id, title, content, tags in rows],
+    )
+
+
+# (버전, 설명, 마이그레이션 함수) - 버전 순서대로 적용
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "할 일/메모 기본 테이블", _create_base_tables),
+    (2, "메모 전문 검색 색인", _create_memo_search_index),
+    (3, "메모 태그 테이블", _create_memo_tags),
+    (4, "목록 정렬 인덱스", _create_list_indexes),
+    (5, "음성 일괄 인식 상태 테이블", _create_transcriptions),
+    (6, "메모 2글자 검색 색인", _create_memo_bigram_index),
+]
+
+# 이번 실행에서 이미 마이그레이션을 확인한 DB 경로
+_migrated_paths: Set[str] = set()
+_migrate_lock = threading.Lock()
+
+
+def get_schema_version(db: Database) -> int:
+    """
+    현재 스키마 버전 조회
+    
+    Args:
+        db: 대상 데이터베이스
+    
+    Returns:
+        PRAGMA user_version 값
+    """
+    return db.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(db: Database) -> int:
+    """
+    적용되지 않은 마이그레이션 실행 (프로세스당 DB별로 한 번만 확인)
+    
+    각 마이그레이션은 버전 갱신과 함께 하나의 트랜잭션으로 적용되므로
+    중간에 실패해도 해당 버전부터 다시 시도할 수 있습니다.
+    
+    Args:
+        db: 대상 데이터베이스
+    
+    Returns:
+        적용 후 스키마 버전
+    """
+    with _migrate_lock:
+        if db.db_path in _migrated_paths:
+            return get_schema_version(db)
+        
+        conn = db.connection()
+        version = get_schema_version(db)
+        
+        for target_version, description, apply in MIGRATIONS:
+            if target_version <= version:
+                continue
+            
+            try:
+                # 다른 프로세스와 동시에 마이그레이션하지 않도록 쓰기 잠금 획득
+                conn.execute("BEGIN IMMEDIATE")
+                apply(conn)
+                conn.execute(f"PRAGMA user_version = {int(target_version)}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                print(f"DB 마이그레이션 실패: v{target_version} ({description})")
+                raise
+            
+            version = target_version
+            print(f"DB 마이그레이션 적용: v{target_version} ({description})")
+        
+        _migrated_paths.add(db.db_path)
+        return version
@@ -0,0 +1,170 @@
+"""
+플러그인 명령 라우팅 모듈 (core 패키지)
+플러그인이 get_commands()로 선언한 키워드를 Aho-Corasick 오토마톤 하나로 묶어
+메시지를 한 번만 훑고도 호출할 플러그인을 고를 수 있게 합니다.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class KeywordMatcher:
+    """여러 키워드를 한 번의 문자열 탐색으로 찾는 Aho-Corasick 오토마톤"""
+    
+    def __init__(self, keywords: Iterable[Tuple[str, int]]):
+        """
+        오토마톤 생성
+        
+        Args:
+            keywords: (키워드, 값) 쌍 목록 - 키워드는 대소문자 구분 없이 부분 문자열로 찾음
+        """
+        # 상태별 전이, 실패 링크, 출력 값 (상태 0이 루트)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[int]] = [set()]
+        
+        for keyword, value in keywords:
+            keyword = keyword.casefold()
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(set())
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._output[state].add(value)
+        
+        self._build_failure_links()
+    
+    def _build_failure_links(self):
+        """너비 우선으로 실패 링크를 만들고, 실패 링크의 출력을 미리 합쳐 둠"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+    
+    def match(self, text: str) -> Set[int]:
+        """
+        text에 포함된 키워드의 값 집합 반환 (text 길이에 비례하는 시간)
+        
+        Args:
+            text: 검사할 문자열
+        
+        Returns:
+            찾은 키워드들의 값 집합
+        """
+        found: Set[int] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text.casefold():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+class PluginDispatcher:
+    """키워드 기반 플러그인 라우팅 테이블"""
+    
+    def __init__(self):
+        """빈 라우팅 테이블 생성"""
+        self._names: List[str] = []
+        self._fallback: List[int] = []
+        self._matcher = KeywordMatcher([])
+    
+    def build(self, commands: Dict[str, List[str]]):
+        """
+        플러그인별 명령 키워드로 라우팅 테이블 재구성
+        
+        Args:
+            commands: {플러그인 키: 키워드 리스트} (순서가 호출 우선순위)
+        """
+        names = list(commands)
+        keywords = []
+        fallback = []
+        for index, name in enumerate(names):
+            plugin_keywords = [keyword for keyword in commands[name] if keyword]
+            if plugin_keywords:
+                keywords.extend((keyword, index) for keyword in plugin_keywords)
+            else:
+                # 키워드를 선언하지 않은 플러그인은 모든 메시지를 받음
+                fallback.append(index)
+        
+        self._names = names
+        self._fallback = fallback
+        self._matcher = KeywordMatcher(keywords)
+    
+    def route(self, message: str) -> List[str]:
+        """
+        메시지를 처리할 후보 플러그인 목록
+        
+        Args:
+            message: 사용자 메시지
+        
+        Returns:
+            키워드가 일치한 플러그인과 키워드 없는 플러그인의 키 (등록 순서)
+        """
+        indexes = self._matcher.match(message)
+        indexes.update(self._fallback)
+        return [self._names[index] for index in sorted(indexes)]
+
+
+@dataclass
+class PluginOutcome:
+    """플러그인 하나의 처리 결과"""
+    # 플러그인 키 (파일명에서 .py 제외)
+    plugin_name: str
+    # 플러그인 표시 이름
+    display_name: str
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    # "first" 전략에서 다른 플러그인이 먼저 응답하여 취소됨
+    cancelled: bool = False
+    # 시간 초과/취소 후에도 스레드(또는 작업 프로세스)에서 계속 실행 중 (스레드는 강제 종료할 수 없음)
+    still_running: bool = False
+    elapsed: float = 0.0
+
+
+@dataclass
+class PluginDispatchResult:
+    """여러 플러그인에 동시에 전달한 명령의 종합 결과"""
+    # "first" 또는 "gather"
+    strategy: str
+    # 후보 플러그인별 결과 (라우팅 순서)
+    outcomes: List[PluginOutcome] = field(default_factory=list)
+    # "first" 전략에서 가장 먼저 결과를 돌려준 플러그인
+    winner: Optional[PluginOutcome] = None
+    elapsed: float = 0.0
+    
+    @property
+    def results(self) -> List[Dict]:
+        """처리 결과가 있는 플러그인의 결과 (라우팅 순서)"""
+        return [outcome.result for outcome in self.outcomes if outcome.result is not None]
+    
+    @property
+    def first(self) -> Optional[Dict]:
+        """대표 결과 ("first" 전략이면 가장 먼저 도착한 결과, "gather"면 라우팅 순서상 첫 결과)"""
+        if self.winner is not None:
+            return self.winner.result
+        results = self.results
+        return results[0] if results else None
+    
+    @property
+    def errors(self) -> List[PluginOutcome]:
+        """오류 또는 시간 초과로 끝난 플러그인"""
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
@@ -3,11 +3,20 @@
 플러그인 기반 확장 구조를 제공합니다.
 """
 import os
+import time
+import asyncio
 import importlib
 import importlib.util
 import inspect
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Optional, Any
 from .config import Config
+from .plugin_dispatch import PluginDispatcher, PluginDispatchResult, PluginOutcome
+from .plugin_manifest import PluginManifest
+from .plugin_metrics import PluginMetrics
+from .plugin_sandbox import PluginSandbox, PluginTimeoutError
+from .fs_watcher import DirectoryWatcher
 
 
 class PluginBase:
@@ -46,23 +55,109 @@ class PluginBase:
         """
         return None
     
+    async def handle_command_async(self, command: str, context: Dict = None) -> Optional[Dict]:
+        """
+        명령 비동기 처리 (PluginManager.handle_command_async에서 사용)
+        
+        기본 구현은 handle_command를 스레드 풀에서 실행합니다 (handle_command가 async def이면 그대로 await).
+        네트워크/DB 등 I/O를 기다리는 플러그인은 이 메서드를 async def로 재정의하면
+        다른 플러그인과 대기 시간이 겹쳐 전체 응답이 빨라집니다.
+        
+        Args:
+            command: 사용자 명령
+            context: 컨텍스트 정보
+            
+        Returns:
+            처리 결과 또는 None (처리하지 않음)
+        """
+        if inspect.iscoroutinefunction(self.handle_command):
+            return await self.handle_command(command, context)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.handle_command, command, context)
+    
     def get_commands(self) -> List[str]:
         """
         지원하는 명령 목록 반환
         
+        메시지에 키워드 중 하나가 포함될 때만 handle_command가 호출됩니다 (대소문자 구분 없음).
+        빈 리스트를 반환하면 모든 메시지에 대해 호출됩니다.
+        
         Returns:
             명령 키워드 리스트
         """
         return []
 
 
+def is_async_plugin(plugin: PluginBase) -> bool:
+    """handle_command_async를 재정의했거나 handle_command가 async def인 플러그인인지 여부"""
+    return (
+        type(plugin).handle_command_async is not PluginBase.handle_command_async
+        or inspect.iscoroutinefunction(plugin.handle_command)
+    )
+
+
+def run_plugin_command(plugin: PluginBase, command: str, context: Dict = None) -> Optional[Dict]:
+    """
+    플러그인 명령을 동기적으로 실행 (async 플러그인은 새 이벤트 루프에서 실행)
+    
+    Args:
+        plugin: 플러그인 인스턴스
+        command: 사용자 명령
+        context: 컨텍스트 정보
+        
+    Returns:
+        처리 결과 또는 None
+    """
+    if is_async_plugin(plugin):
+        return asyncio.run(plugin.handle_command_async(command, context))
+    return plugin.handle_command(command, context)
+
+
 class PluginManager:
     """플러그인 관리자"""
     
+    # 파일 저장 직후 여러 이벤트를 한 번의 리로드로 묶는 대기 시간 (초)
+    RELOAD_DEBOUNCE = 0.3
+    # 비동기 처리에서 동시 처리 슬롯이 빌 때까지 확인하는 간격 (초)
+    SLOT_POLL_INTERVAL = 0.01
+    
     def __init__(self):
         """플러그인 관리자 초기화"""
+        # 로드(import)된 플러그인 인스턴스
         self.plugins: Dict[str, PluginBase] = {}
         self.plugin_dir = Config.PLUGIN_DIR
+        # 설치된 플러그인 정보 캐시 (로드되지 않은 플러그인도 포함)
+        self.manifest = PluginManifest(self.plugin_dir)
+        # 로드에 실패한 플러그인 키 -> 실패한 파일 해시 (파일이 바뀔 때까지 다시 시도하지 않음)
+        self._failed_plugins: Dict[str, str] = {}
+        # 키워드 라우팅 테이블 (플러그인 목록이 바뀌면 다음 명령 처리 때 재구성)
+        self.dispatcher = PluginDispatcher()
+        self._dispatch_dirty = True
+        # 여러 스레드에서 명령을 처리할 때 로드/라우팅 테이블 재구성을 한 번에 하나씩
+        self._load_lock = threading.RLock()
+        
+        # 실행 방식: inline (호출한 스레드), thread (백그라운드 스레드), process (작업 프로세스)
+        self.execution_mode = Config.PLUGIN_EXECUTION_MODE
+        self.timeout = Config.PLUGIN_TIMEOUT
+        # 플러그인별 호출 수/지연 시간/오류/로드 시간
+        self.metrics = PluginMetrics()
+        self.sandbox = (
+            PluginSandbox(self.plugin_dir, metrics=self.metrics)
+            if self.execution_mode == "process" else None
+        )
+        # 명령 처리(라우팅) 스레드와 thread 방식의 플러그인 호출 스레드 (서로 기다리다 막히지 않도록 분리)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=4, thread_name_prefix="plugin-dispatch")
+            if self.execution_mode != "inline" else None
+        )
+        self._call_executor = (
+            ThreadPoolExecutor(max_workers=8, thread_name_prefix="plugin")
+            if self.execution_mode == "thread" else None
+        )
+        # thread 방식의 플러그인별 동시 처리 수 제한
+        self._plugin_slots: Dict[str, threading.Semaphore] = {}
+        # 핫 리로드용 플러그인 디렉토리 감시 (start_watching() 호출 시 생성)
+        self._watcher = None
         self._ensure_plugin_dir()
     
     def _ensure_plugin_dir(self):
@@ -75,23 +170,67 @@ class PluginManager:
                 with open(init_file, "w", encoding="utf-8") as f:
                     f.write("# ZiTTA 플러그인 디렉토리\n")
     
-    def load_plugins(self):
-        """모든 플러그인 로드"""
+    def load_plugins(self) -> List[str]:
+        """
+        플러그인 매니페스트 갱신 및 변경된 플러그인 다시 로드
+        
+        바뀐 파일만 다시 분석합니다. 아직 로드되지 않은 플러그인은 명령이 처음 라우팅될 때 import되고,
+        이미 로드된 플러그인은 새 모듈로 다시 import하여 인스턴스를 교체합니다 (핫 리로드).
+        
+        Returns:
+            추가/변경된 플러그인 이름 리스트
+        """
         if not os.path.exists(self.plugin_dir):
-            return
+            return []
+        
+        if not self.manifest.entries:
+            self.manifest.load()
+        # 이번 갱신 중 분석을 위해 만든 인스턴스 (다시 import하지 않고 그대로 사용)
+        prepared: Dict[str, PluginBase] = {}
+        
+        def describe(plugin_name: str) -> Optional[Dict]:
+            if self.sandbox is not None:
+                # process 방식은 정보 조회를 위한 import도 작업 프로세스에서
+                return self.sandbox.describe(plugin_name)
+            plugin = self._instantiate_plugin(plugin_name)
+            if plugin is None:
+                return None
+            prepared[plugin_name] = plugin
+            return {
+                "class_name": type(plugin).__name__,
+                "name": plugin.name,
+                "version": plugin.version,
+                "keywords": self._plugin_commands(plugin_name, plugin),
+            }
         
-        # 플러그인 디렉토리의 모든 Python 파일 검색
-        for filename in os.listdir(self.plugin_dir):
-            if filename.endswith(".py") and filename != "__init__.py":
-                plugin_name = filename[:-3]  # .py 제거
-                try:
-                    self.load_plugin(plugin_name)
-                except Exception as e:
-                    print(f"플러그인 '{plugin_name}' 로드 실패: {e}")
+        with self._load_lock:
+            changed = self.manifest.refresh(describe)
+            
+            for plugin_name in list(self.plugins):
+                if plugin_name not in self.manifest.entries:
+                    self.unload_plugin(plugin_name)
+                    self._reset_worker(plugin_name)
+            
+            for plugin_name in changed:
+                self._failed_plugins.pop(plugin_name, None)
+                self._reset_worker(plugin_name)
+                if self.sandbox is not None:
+                    # process 방식은 작업 프로세스에서만 플러그인을 실행
+                    continue
+                if plugin_name in prepared:
+                    self._swap_plugin(plugin_name, prepared[plugin_name])
+                elif plugin_name in self.plugins:
+                    plugin = self._instantiate_plugin(plugin_name)
+                    if plugin is not None:
+                        self._swap_plugin(plugin_name, plugin)
+            
+            # 라우팅 테이블도 즉시 교체 (다음 명령부터 새 키워드로 라우팅)
+            self._rebuild_dispatch()
+        return changed
     
     def load_plugin(self, plugin_name: str) -> bool:
         """
-        플러그인 로드
+        플러그인 로드 (모듈 import 및 인스턴스 생성, 이미 로드되어 있으면 새 모듈로 교체)
         
         Args:
             plugin_name: 플러그인 이름 (파일명에서 .py 제외)
@@ -99,36 +238,188 @@ class PluginManager:
         Returns:
             성공 여부
         """
+        plugin = self._instantiate_plugin(plugin_name)
+        if plugin is None:
+            return False
+        with self._load_lock:
+            return self._swap_plugin(plugin_name, plugin)
+    
+    def reload_plugin(self, plugin_name: str) -> bool:
+        """
+        플러그인 모듈을 다시 실행하여 교체 (파일이 바뀌지 않았어도 강제로)
+        
+        새 모듈 로드에 실패하면 기존 인스턴스를 그대로 유지합니다.
+        
+        Args:
+            plugin_name: 플러그인 이름
+            
+        Returns:
+            성공 여부
+        """
+        self._reset_worker(plugin_name)
+        return self.load_plugin(plugin_name)
+    
+    def _instantiate_plugin(self, plugin_name: str) -> Optional[PluginBase]:
+        """
+        플러그인 모듈을 새로 실행하고 플러그인 인스턴스 생성 (등록하지 않음)
+        
+        Args:
+            plugin_name: 플러그인 이름 (파일명에서 .py 제외)
+            
+        Returns:
+            플러그인 인스턴스 또는 None (실패)
+        """
+        start = time.perf_counter()
         try:
-            # 플러그인 모듈 import
+            # 플러그인 모듈 import (sys.modules에 등록하지 않으므로 매번 새로 실행됨)
             spec = importlib.util.spec_from_file_location(
                 plugin_name,
                 os.path.join(self.plugin_dir, f"{plugin_name}.py")
             )
             
             if spec is None or spec.loader is None:
-                return False
+                return None
             
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
             
-            # PluginBase를 상속한 클래스 찾기
-            for name, obj in inspect.getmembers(module):
-                if (
-                    inspect.isclass(obj)
-                    and issubclass(obj, PluginBase)
-                    and obj is not PluginBase
-                ):
-                    plugin_instance = obj()
-                    self.plugins[plugin_name] = plugin_instance
-                    plugin_instance.on_load()
-                    print(f"플러그인 '{plugin_name}' 로드 완료")
-                    return True
+            # 매니페스트에 기록된 클래스를 우선 사용하고, 없으면 PluginBase를 상속한 클래스 찾기
+            entry = self.manifest.entries.get(plugin_name)
+            plugin_class = getattr(module, entry["class_name"], None) if entry else None
+            if not (inspect.isclass(plugin_class) and issubclass(plugin_class, PluginBase)):
+                plugin_class = next(
+                    (
+                        obj for _, obj in inspect.getmembers(module)
+                        if inspect.isclass(obj) and issubclass(obj, PluginBase) and obj is not PluginBase
+                    ),
+                    None
+                )
+            if plugin_class is None:
+                self.metrics.record_load(plugin_name, time.perf_counter() - start, success=False)
+                return None
+            plugin = plugin_class()
+            self.metrics.record_load(plugin_name, time.perf_counter() - start)
+            return plugin
+        except Exception as e:
+            print(f"플러그인 '{plugin_name}' 로드 오류: {e}")
+            self.metrics.record_load(plugin_name, time.perf_counter() - start, success=False)
+            return None
+    
+    def _swap_plugin(self, plugin_name: str, plugin: PluginBase) -> bool:
+        """
+        새 인스턴스를 준비(on_load)한 뒤 기존 인스턴스와 교체하고 기존 인스턴스 정리(on_unload)
+        
+        Args:
+            plugin_name: 플러그인 이름
+            plugin: 새 플러그인 인스턴스
             
-            return False
+        Returns:
+            성공 여부 (on_load 실패 시 기존 인스턴스 유지)
+        """
+        try:
+            plugin.on_load()
         except Exception as e:
             print(f"플러그인 '{plugin_name}' 로드 오류: {e}")
             return False
+        
+        old_plugin = self.plugins.get(plugin_name)
+        self.plugins[plugin_name] = plugin
+        self._dispatch_dirty = True
+        
+        if old_plugin is not None:
+            try:
+                old_plugin.on_unload()
+            except Exception as e:
+                print(f"플러그인 '{plugin_name}' 언로드 오류: {e}")
+            print(f"플러그인 '{plugin_name}' 다시 로드 완료")
+        else:
+            print(f"플러그인 '{plugin_name}' 로드 완료")
+        return True
+    
+    def _reset_worker(self, plugin_name: str):
+        """process 방식이면 플러그인 작업 프로세스 재시작 (다음 호출 때 새 코드로 시작)"""
+        if self.sandbox is not None:
+            self.sandbox.reset(plugin_name)
+    
+    def start_watching(self, on_reload=None) -> bool:
+        """
+        플러그인 디렉토리 감시 시작 (파일이 바뀌면 load_plugins()로 핫 리로드)
+        
+        Args:
+            on_reload: 다시 로드된 플러그인 이름 리스트를 받을 콜백 (감시 스레드에서 호출됨)
+            
+        Returns:
+            감시 시작 여부
+        """
+        if self._watcher is None:
+            def handle_events(events):
+                if not any(self._is_plugin_event(event) for event in events):
+                    return
+                changed = self.load_plugins()
+                if changed and on_reload:
+                    on_reload(changed)
+            
+            self._watcher = DirectoryWatcher(handle_events, debounce=self.RELOAD_DEBOUNCE)
+        return self._watcher.watch(self.plugin_dir)
+    
+    def _is_plugin_event(self, event: Dict) -> bool:
+        """플러그인 파일(.py)에 대한 이벤트인지 확인 (편집기 임시 파일 등 제외)"""
+        if event["type"] == "overflow":
+            return True
+        paths = [event["path"], event.get("dest_path")]
+        return any(
+            path and path.endswith(".py") and os.path.basename(path) != "__init__.py"
+            and os.path.dirname(path) == os.path.abspath(self.plugin_dir)
+            for path in paths
+        )
+    
+    def _get_plugin(self, plugin_name: str) -> Optional[PluginBase]:
+        """
+        플러그인 인스턴스 반환 (아직 로드되지 않았으면 이때 로드)
+        
+        Args:
+            plugin_name: 플러그인 이름
+            
+        Returns:
+            플러그인 인스턴스 또는 None (로드 실패)
+        """
+        plugin = self.plugins.get(plugin_name)
+        if plugin is not None:
+            return plugin
+        
+        with self._load_lock:
+            plugin = self.plugins.get(plugin_name)
+            if plugin is not None:
+                return plugin
+            entry = self.manifest.entries.get(plugin_name)
+            file_hash = entry["sha256"] if entry else None
+            if plugin_name in self._failed_plugins and self._failed_plugins[plugin_name] == file_hash:
+                return None
+            if not self.load_plugin(plugin_name):
+                self._failed_plugins[plugin_name] = file_hash
+                return None
+            self._failed_plugins.pop(plugin_name, None)
+            return self.plugins[plugin_name]
+    
+    def _plugin_commands(self, plugin_name: str, plugin: PluginBase) -> List[str]:
+        """플러그인 명령 키워드 조회 (오류 시 빈 리스트)"""
+        try:
+            return list(plugin.get_commands())
+        except Exception as e:
+            print(f"플러그인 '{plugin_name}' 명령 목록 조회 오류: {e}")
+            return []
+    
+    def _rebuild_dispatch(self):
+        """매니페스트와 로드된 플러그인으로 라우팅 테이블 재구성"""
+        commands = {
+            plugin_name: entry["keywords"]
+            for plugin_name, entry in self.manifest.entries.items()
+        }
+        # 로드된 플러그인은 실제 get_commands() 결과 사용
+        for plugin_name, plugin in self.plugins.items():
+            commands[plugin_name] = self._plugin_commands(plugin_name, plugin)
+        self.dispatcher.build(commands)
+        self._dispatch_dirty = False
     
     def unload_plugin(self, plugin_name: str) -> bool:
         """
@@ -144,6 +435,7 @@ class PluginManager:
             try:
                 self.plugins[plugin_name].on_unload()
                 del self.plugins[plugin_name]
+                self._dispatch_dirty = True
                 print(f"플러그인 '{plugin_name}' 언로드 완료")
                 return True
             except Exception as e:
@@ -153,7 +445,7 @@ class PluginManager:
     
     def handle_command(self, command: str, context: Dict = None) -> Optional[Dict]:
         """
-        명령을 플러그인에 전달하여 처리
+        명령을 플러그인에 전달하여 처리 (완료까지 대기)
         
         Args:
             command: 사용자 명령
@@ -161,31 +453,311 @@ class PluginManager:
             
         Returns:
             처리 결과 또는 None
+            (플러그인이 오류/시간 초과로 처리하지 못하면 {"type": "plugin_error", "plugin", "response"})
         """
-        for plugin in self.plugins.values():
-            if plugin.enabled:
-                try:
-                    result = plugin.handle_command(command, context)
-                    if result is not None:
-                        return result
-                except Exception as e:
-                    print(f"플러그인 '{plugin.name}' 명령 처리 오류: {e}")
-        return None
+        with self._load_lock:
+            if self._dispatch_dirty:
+                self._rebuild_dispatch()
+            candidates = self.dispatcher.route(command)
+        
+        # 키워드가 일치한 플러그인(과 키워드 없는 플러그인)만 등록 순서대로 호출 (필요 시 이때 로드)
+        error_result = None
+        for plugin_name in candidates:
+            start = time.perf_counter()
+            try:
+                result = self._call_plugin(plugin_name, command, context)
+                self.metrics.record_call(plugin_name, time.perf_counter() - start, handled=result is not None)
+                if result is not None:
+                    return result
+            except Exception as e:
+                self.metrics.record_call(
+                    plugin_name, time.perf_counter() - start, error=str(e),
+                    timed_out=isinstance(e, PluginTimeoutError)
+                )
+                display_name = self._display_name(plugin_name)
+                print(f"플러그인 '{display_name}' 명령 처리 오류: {e}")
+                if error_result is None:
+                    error_result = {
+                        "type": "plugin_error",
+                        "plugin": display_name,
+                        "response": str(e),
+                    }
+        return error_result
+    
+    def submit_command(self, command: str, context: Dict = None) -> Future:
+        """
+        명령 처리 시작 (inline 방식이 아니면 즉시 반환)
+        
+        Args:
+            command: 사용자 명령
+            context: 컨텍스트 정보
+            
+        Returns:
+            handle_command() 결과를 담을 Future
+        """
+        if self._executor is None:
+            future = Future()
+            future.set_result(self.handle_command(command, context))
+            return future
+        return self._executor.submit(self.handle_command, command, context)
+    
+    def _call_plugin(self, plugin_name: str, command: str, context: Optional[Dict]) -> Optional[Dict]:
+        """
+        실행 방식에 따라 플러그인 하나 호출
+        
+        Raises:
+            PluginTimeoutError: 제한 시간 초과 또는 동시 처리 한도 초과
+            PluginCrashError: 작업 프로세스 충돌 (process 방식)
+            Exception: 플러그인 handle_command 오류
+        """
+        if self.sandbox is not None:
+            entry = self.manifest.entries.get(plugin_name)
+            return self.sandbox.call(
+                plugin_name, command, context,
+                class_name=entry["class_name"] if entry else None
+            )
+        
+        plugin = self._get_plugin(plugin_name)
+        if plugin is None or not plugin.enabled:
+            return None
+        if self._call_executor is None:
+            return run_plugin_command(plugin, command, context)
+        
+        # thread 방식: 제한 시간이 지나면 결과를 기다리지 않음 (스레드는 강제 종료할 수 없음)
+        # 슬롯 대기와 처리 대기를 합쳐 제한 시간 안에 끝나도록 하나의 마감 시각 사용
+        deadline = time.monotonic() + self.timeout
+        slots = self._plugin_slot(plugin_name)
+        if not slots.acquire(timeout=self.timeout):
+            raise PluginTimeoutError("동시 처리 한도를 초과했습니다")
+        
+        try:
+            future = self._submit_call(slots, plugin, command, context)
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            raise PluginTimeoutError(f"명령 처리 시간 초과 ({self.timeout:g}초)")
+    
+    def _plugin_slot(self, plugin_name: str) -> threading.Semaphore:
+        """thread 방식의 플러그인별 동시 처리 수 제한"""
+        slots = self._plugin_slots.get(plugin_name)
+        if slots is None:
+            slots = self._plugin_slots.setdefault(plugin_name, threading.Semaphore(Config.PLUGIN_MAX_CONCURRENCY))
+        return slots
+    
+    def _submit_call(self, slots: threading.Semaphore, plugin: PluginBase, command: str,
+                     context: Optional[Dict]) -> Future:
+        """
+        슬롯을 얻은 상태에서 플러그인 호출을 스레드 풀에 등록
+        
+        호출이 끝나거나 실행되기 전에 취소되면 슬롯을 반환합니다.
+        
+        Returns:
+            플러그인 처리 결과를 담을 Future
+        """
+        def run():
+            try:
+                return run_plugin_command(plugin, command, context)
+            finally:
+                slots.release()
+        
+        try:
+            future = self._call_executor.submit(run)
+        except RuntimeError:
+            slots.release()
+            raise
+        future.add_done_callback(lambda done: slots.release() if done.cancelled() else None)
+        return future
+    
+    async def handle_command_async(self, command: str, context: Dict = None, strategy: str = "first",
+                                   timeout: float = None) -> PluginDispatchResult:
+        """
+        후보 플러그인에 명령을 동시에 전달
+        
+        Args:
+            command: 사용자 명령
+            context: 컨텍스트 정보
+            strategy: "first" (가장 먼저 도착한 결과를 사용하고 나머지는 취소) 또는
+                      "gather" (모든 플러그인의 결과를 수집)
+            timeout: 플러그인별 제한 시간(초, 기본값: Config.PLUGIN_TIMEOUT)
+            
+        Returns:
+            PluginDispatchResult (플러그인별 결과, 대표 결과 first, 오류 목록 errors)
+        """
+        if strategy not in ("first", "gather"):
+            raise ValueError(f"지원하지 않는 전략입니다: {strategy}")
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        
+        with self._load_lock:
+            if self._dispatch_dirty:
+                self._rebuild_dispatch()
+            candidates = self.dispatcher.route(command)
+        
+        # 플러그인별 스레드/작업 프로세스 호출 (취소 후에도 계속 실행 중인지 확인용)
+        calls: Dict[str, Future] = {}
+        tasks = {
+            asyncio.ensure_future(self._run_plugin_async(plugin_name, command, context, timeout, calls)): plugin_name
+            for plugin_name in candidates
+        }
+        outcomes: Dict[str, PluginOutcome] = {}
+        winner = None
+        
+        if strategy == "gather":
+            for outcome in await asyncio.gather(*tasks):
+                outcomes[outcome.plugin_name] = outcome
+        else:
+            pending = set(tasks)
+            try:
+                while pending and winner is None:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # 같은 순간에 끝난 결과는 라우팅 순서로 우선순위 결정
+                    for task in sorted(done, key=lambda task: candidates.index(tasks[task])):
+                        outcome = task.result()
+                        outcomes[outcome.plugin_name] = outcome
+                        if winner is None and outcome.result is not None:
+                            winner = outcome
+            finally:
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+            for task in pending:
+                plugin_name = tasks[task]
+                # 스레드에서 실행 중인 동기 플러그인은 취소되지 않고 끝까지 실행됨
+                still_running = plugin_name in calls and not calls[plugin_name].done()
+                outcomes[plugin_name] = PluginOutcome(
+                    plugin_name, self._display_name(plugin_name),
+                    cancelled=not still_running, still_running=still_running
+                )
+        
+        return PluginDispatchResult(
+            strategy=strategy,
+            outcomes=[outcomes[plugin_name] for plugin_name in candidates],
+            winner=winner,
+            elapsed=time.perf_counter() - start,
+        )
+    
+    async def _run_plugin_async(self, plugin_name: str, command: str, context: Optional[Dict],
+                                timeout: float, calls: Dict[str, Future]) -> PluginOutcome:
+        """플러그인 하나를 제한 시간 안에서 실행 (취소 외의 예외는 결과에 기록)"""
+        outcome = PluginOutcome(plugin_name, self._display_name(plugin_name))
+        start = time.perf_counter()
+        try:
+            outcome.result = await asyncio.wait_for(
+                self._invoke_plugin_async(plugin_name, command, context, timeout, calls), timeout
+            )
+        except asyncio.TimeoutError:
+            outcome.timed_out = True
+            outcome.error = f"명령 처리 시간 초과 ({timeout:g}초)"
+            outcome.still_running = plugin_name in calls and not calls[plugin_name].done()
+        except Exception as e:
+            outcome.error = str(e)
+            outcome.timed_out = isinstance(e, PluginTimeoutError)
+            print(f"플러그인 '{outcome.display_name}' 명령 처리 오류: {e}")
+        outcome.elapsed = time.perf_counter() - start
+        self.metrics.record_call(
+            plugin_name, outcome.elapsed, handled=outcome.result is not None,
+            error=outcome.error, timed_out=outcome.timed_out
+        )
+        return outcome
+    
+    async def _invoke_plugin_async(self, plugin_name: str, command: str, context: Optional[Dict],
+                                   timeout: float, calls: Dict[str, Future]) -> Optional[Dict]:
+        """실행 방식에 따라 플러그인 하나를 비동기 호출 (스레드/작업 프로세스 호출은 calls에 기록)"""
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        if self.sandbox is not None:
+            entry = self.manifest.entries.get(plugin_name)
+            calls[plugin_name] = self.sandbox.submit(
+                plugin_name, command, context, entry["class_name"] if entry else None, timeout
+            )
+            return await asyncio.wrap_future(calls[plugin_name])
+        
+        # 처음 호출되는 플러그인의 import가 이벤트 루프를 막지 않도록 스레드에서 로드
+        plugin = self.plugins.get(plugin_name)
+        if plugin is None:
+            plugin = await loop.run_in_executor(None, self._get_plugin, plugin_name)
+        if plugin is None or not plugin.enabled:
+            return None
+        if self._call_executor is None or is_async_plugin(plugin):
+            return await plugin.handle_command_async(command, context)
+        
+        # thread 방식의 동기 플러그인: _call_plugin과 같은 플러그인별 동시 처리 제한과 스레드 풀 사용
+        # (이벤트 루프를 막지 않도록 슬롯은 기다리지 않고 확인, 취소되면 슬롯을 얻지 않음)
+        slots = self._plugin_slot(plugin_name)
+        while not slots.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise PluginTimeoutError("동시 처리 한도를 초과했습니다")
+            await asyncio.sleep(self.SLOT_POLL_INTERVAL)
+        calls[plugin_name] = self._submit_call(slots, plugin, command, context)
+        return await asyncio.wrap_future(calls[plugin_name])
+    
+    def _display_name(self, plugin_name: str) -> str:
+        """플러그인 표시 이름 (로드 전이면 매니페스트 정보)"""
+        plugin = self.plugins.get(plugin_name)
+        if plugin is not None:
+            return plugin.name
+        entry = self.manifest.entries.get(plugin_name)
+        return entry["name"] if entry else plugin_name
+    
+    def shutdown(self):
+        """지표 저장, 디렉토리 감시/작업 프로세스/스레드 종료 및 플러그인 언로드"""
+        self.dump_metrics()
+        if self._watcher is not None:
+            self._watcher.stop()
+        if self.sandbox is not None:
+            self.sandbox.shutdown()
+        for executor in (self._executor, self._call_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        for plugin_name in list(self.plugins):
+            self.unload_plugin(plugin_name)
     
     def get_plugin_list(self) -> List[Dict[str, Any]]:
         """
-        로드된 플러그인 목록 반환
+        설치된 플러그인 목록 반환 (아직 로드되지 않은 플러그인은 매니페스트 정보 사용)
         
         Returns:
             플러그인 정보 리스트
+            (각 항목의 "metrics"는 호출 수, 지연 시간 p50/p95/p99, 오류 수, 로드 시간 등 - PluginMetrics.snapshot 참고)
         """
-        return [
-            {
-                "name": plugin.name,
-                "version": plugin.version,
-                "enabled": plugin.enabled,
-            }
-            for plugin in self.plugins.values()
-        ]
+        plugin_list = []
+        for plugin_name in dict.fromkeys([*self.manifest.entries, *self.plugins]):
+            plugin = self.plugins.get(plugin_name)
+            if plugin is not None:
+                info = {
+                    "name": plugin.name,
+                    "version": plugin.version,
+                    "enabled": plugin.enabled,
+                    "loaded": True,
+                }
+            else:
+                entry = self.manifest.entries[plugin_name]
+                info = {
+                    "name": entry["name"],
+                    "version": entry["version"],
+                    "enabled": True,
+                    "loaded": False,
+                }
+            info["plugin_name"] = plugin_name
+            info["metrics"] = self.metrics.snapshot(plugin_name)
+            plugin_list.append(info)
+        return plugin_list
+    
+    def dump_metrics(self, path: str = None) -> str:
+        """
+        플러그인 지표를 JSON 파일로 저장
+        
+        Args:
+            path: 저장할 파일 경로 (기본값: Config.PLUGIN_METRICS_PATH)
+            
+        Returns:
+            저장한 파일 경로
+        """
+        path = path or Config.PLUGIN_METRICS_PATH
+        extra = {"execution_mode": self.execution_mode}
+        if self.sandbox is not None:
+            extra["workers"] = self.sandbox.stats()
+        self.metrics.dump(path, extra)
+        return path
 
 
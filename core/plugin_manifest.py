@@ -0,0 +1,208 @@
+"""
+플러그인 매니페스트 모듈 (core 패키지)
+플러그인 파일별 클래스 이름, 이름/버전, 명령 키워드를 파일 수정 시각/크기/해시와 함께 JSON으로 캐시하여
+시작 시 플러그인 모듈을 import하지 않고도 라우팅 테이블을 만들 수 있게 합니다.
+"""
+import os
+import ast
+import json
+import hashlib
+from typing import Callable, Dict, List, Optional
+from .config import Config
+
+
+class PluginManifest:
+    """플러그인 매니페스트 캐시 (data/plugin_manifest.json)"""
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, plugin_dir: str, manifest_path: str = None):
+        """
+        매니페스트 초기화
+        
+        Args:
+            plugin_dir: 플러그인 디렉토리
+            manifest_path: 매니페스트 파일 경로 (기본값: Config.PLUGIN_MANIFEST_PATH)
+        """
+        self.plugin_dir = plugin_dir
+        self.manifest_path = manifest_path or Config.PLUGIN_MANIFEST_PATH
+        # 플러그인 키(파일명에서 .py 제외) -> 항목 딕셔너리
+        self.entries: Dict[str, Dict] = {}
+    
+    def load(self):
+        """매니페스트 파일 읽기 (없거나 형식이 다르면 빈 매니페스트)"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+            return
+        
+        if data.get("format") != self.FORMAT_VERSION or data.get("plugin_dir") != os.path.abspath(self.plugin_dir):
+            self.entries = {}
+            return
+        self.entries = data.get("plugins", {})
+    
+    def save(self):
+        """매니페스트 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        data = {
+            "format": self.FORMAT_VERSION,
+            "plugin_dir": os.path.abspath(self.plugin_dir),
+            "plugins": self.entries,
+        }
+        temp_path = f"{self.manifest_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.manifest_path)
+        except OSError as e:
+            print(f"플러그인 매니페스트 저장 오류: {e}")
+    
+    def refresh(self, describe: Callable[[str], Optional[Dict]]) -> List[str]:
+        """
+        플러그인 디렉토리와 매니페스트 비교 후 바뀐 파일만 다시 분석
+        
+        수정 시각과 크기가 같으면 파일을 읽지 않고, 다르면 해시를 비교하여
+        내용이 같으면 메타데이터만 갱신합니다. 내용이 바뀐 파일은 소스 분석(import 없음)으로
+        클래스/키워드를 추출하고, 소스만으로 알 수 없으면 describe(키)로 import하여 얻습니다.
+        
+        Args:
+            describe: 플러그인을 import하여 항목 정보({"class_name", "name", "version", "keywords"})를
+                      반환하는 함수 (실패 시 None)
+        
+        Returns:
+            새로 분석한(추가/변경된) 플러그인 키 목록
+        """
+        try:
+            filenames = sorted(
+                filename for filename in os.listdir(self.plugin_dir)
+                if filename.endswith(".py") and filename != "__init__.py"
+            )
+        except OSError:
+            filenames = []
+        
+        changed = []
+        entries = {}
+        dirty = False
+        for filename in filenames:
+            plugin_key = filename[:-3]  # .py 제거
+            path = os.path.join(self.plugin_dir, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            
+            entry = self.entries.get(plugin_key)
+            if entry is not None and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                entries[plugin_key] = entry
+                continue
+            
+            try:
+                with open(path, "rb") as f:
+                    source = f.read()
+            except OSError as e:
+                print(f"플러그인 '{plugin_key}' 읽기 오류: {e}")
+                continue
+            digest = hashlib.sha256(source).hexdigest()
+            dirty = True
+            
+            if entry is not None and entry["sha256"] == digest:
+                # 내용은 그대로이고 수정 시각만 바뀜 (touch, 복사 등)
+                entry = dict(entry, mtime_ns=st.st_mtime_ns, size=st.st_size)
+                entries[plugin_key] = entry
+                continue
+            
+            info = self._inspect_source(source)
+            if info is None:
+                info = describe(plugin_key)
+            if info is None:
+                # PluginBase 구현이 없거나 import 실패: 기존 항목이 있으면 유지하고 다음 갱신 때 다시 분석
+                if entry is not None:
+                    entries[plugin_key] = entry
+                continue
+            
+            entries[plugin_key] = {
+                "file": filename,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": digest,
+                **info,
+            }
+            changed.append(plugin_key)
+        
+        if dirty or set(entries) != set(self.entries):
+            self.entries = entries
+            self.save()
+        return changed
+    
+    @staticmethod
+    def _inspect_source(source: bytes) -> Optional[Dict]:
+        """
+        소스 코드만으로 플러그인 항목 정보 추출 (모듈을 실행하지 않음)
+        
+        PluginBase 하위 클래스의 super().__init__(이름, 버전) 인자와 get_commands()의
+        반환값이 리터럴일 때만 성공합니다.
+        
+        Returns:
+            {"class_name", "name", "version", "keywords"} 또는 None (추출 불가)
+        """
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return None
+        
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            base_names = [
+                base.id if isinstance(base, ast.Name) else getattr(base, "attr", None)
+                for base in node.bases
+            ]
+            if "PluginBase" not in base_names:
+                continue
+            
+            methods = {item.name: item for item in node.body if isinstance(item, ast.FunctionDef)}
+            
+            # 이름/버전: __init__의 super().__init__("이름", "버전") 호출
+            init_args = None
+            for statement in ast.walk(methods["__init__"]) if "__init__" in methods else []:
+                if (
+                    isinstance(statement, ast.Call)
+                    and isinstance(statement.func, ast.Attribute)
+                    and statement.func.attr == "__init__"
+                ):
+                    init_args = statement.args
+                    break
+            if not init_args:
+                return None
+            try:
+                values = [ast.literal_eval(arg) for arg in init_args[:2]]
+            except (ValueError, TypeError, SyntaxError):
+                return None
+            name = values[0]
+            version = values[1] if len(values) > 1 else "1.0.0"
+            
+            # 키워드: get_commands()가 리터럴 리스트/튜플을 반환하는 경우만
+            keywords: List[str] = []
+            if "get_commands" in methods:
+                body = [
+                    statement for statement in methods["get_commands"].body
+                    if not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant))
+                ]
+                if len(body) != 1 or not isinstance(body[0], ast.Return) or body[0].value is None:
+                    return None
+                try:
+                    keywords = list(ast.literal_eval(body[0].value))
+                except (ValueError, TypeError, SyntaxError):
+                    return None
+            
+            if not all(isinstance(value, str) for value in [name, version, *keywords]):
+                return None
+            return {
+                "class_name": node.name,
+                "name": name,
+                "version": version,
+                "keywords": keywords,
+            }
+        return None
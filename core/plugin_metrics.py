@@ -0,0 +1,197 @@
+"""
+플러그인 지표 모듈 (core 패키지)
+플러그인별 호출 수, 지연 시간 분포(p50/p95/p99), 오류/시간 초과 수, 로드 시간을 기록합니다.
+지연 시간은 로그 스케일 구간 히스토그램으로 집계하므로 호출 수와 관계없이 메모리 사용량이 일정합니다.
+"""
+import os
+import json
+import time
+import bisect
+import threading
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """로그 스케일 구간 지연 시간 히스토그램"""
+    
+    # 가장 작은 구간 상한 (초) 및 구간 간 배율 (약 ±12% 오차)
+    MIN_BOUND = 0.0001
+    GROWTH = 1.25
+    BUCKET_COUNT = 80  # 0.1ms ~ 약 5분
+    
+    def __init__(self):
+        # 마지막 구간은 상한 초과분
+        self.counts = [0] * (self.BUCKET_COUNT + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def add(self, seconds: float):
+        """지연 시간 하나 기록"""
+        self.counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        백분위 지연 시간 추정 (해당 구간의 상한, 최댓값을 넘지 않음)
+        
+        Args:
+            percent: 백분위 (0~100)
+        
+        Returns:
+            지연 시간(초) 또는 None (기록 없음)
+        """
+        if self.total == 0:
+            return None
+        rank = max(1, int(round(self.total * percent / 100.0)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = self._bounds[index] if index < self.BUCKET_COUNT else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+# 구간 상한 목록 (클래스 본문의 컴프리헨션에서는 클래스 변수를 참조할 수 없어 정의 후 설정)
+LatencyHistogram._bounds = [
+    LatencyHistogram.MIN_BOUND * LatencyHistogram.GROWTH ** index
+    for index in range(LatencyHistogram.BUCKET_COUNT)
+]
+
+
+class PluginMetrics:
+    """플러그인별 지표 저장소 (스레드 안전)"""
+    
+    def __init__(self):
+        """빈 지표 저장소 생성"""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict] = {}
+        self.started_at = time.time()
+    
+    def _get(self, plugin_name: str) -> Dict:
+        stats = self._stats.get(plugin_name)
+        if stats is None:
+            stats = {
+                "calls": 0,
+                "handled": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "latency": LatencyHistogram(),
+                "loads": 0,
+                "load_failures": 0,
+                "load_time": None,
+                "last_error": None,
+            }
+            self._stats[plugin_name] = stats
+        return stats
+    
+    def record_call(self, plugin_name: str, elapsed: float, handled: bool = False,
+                    error: str = None, timed_out: bool = False):
+        """
+        명령 처리 한 번 기록
+        
+        Args:
+            plugin_name: 플러그인 이름
+            elapsed: 처리 시간(초)
+            handled: 결과를 돌려주었는지 여부
+            error: 오류 메시지 (오류로 끝난 경우)
+            timed_out: 시간 초과 여부
+        """
+        with self._lock:
+            stats = self._get(plugin_name)
+            stats["calls"] += 1
+            stats["latency"].add(elapsed)
+            if handled:
+                stats["handled"] += 1
+            if timed_out:
+                stats["timeouts"] += 1
+            if error is not None:
+                stats["errors"] += 1
+                stats["last_error"] = error
+    
+    def record_load(self, plugin_name: str, elapsed: float, success: bool = True):
+        """
+        플러그인 로드(import 및 인스턴스 생성 또는 작업 프로세스 시작) 기록
+        
+        Args:
+            plugin_name: 플러그인 이름
+            elapsed: 로드 시간(초)
+            success: 성공 여부
+        """
+        with self._lock:
+            stats = self._get(plugin_name)
+            stats["loads"] += 1
+            stats["load_time"] = elapsed
+            if not success:
+                stats["load_failures"] += 1
+    
+    def snapshot(self, plugin_name: str) -> Dict:
+        """
+        플러그인 하나의 지표 (시간은 밀리초)
+        
+        Returns:
+            {"calls", "handled", "errors", "timeouts", "error_rate", "avg_ms", "p50_ms", "p95_ms", "p99_ms",
+             "max_ms", "loads", "load_failures", "load_time_ms", "last_error"}
+        """
+        with self._lock:
+            stats = self._get(plugin_name)
+            latency = stats["latency"]
+            
+            def ms(seconds):
+                return round(seconds * 1000, 2) if seconds is not None else None
+            
+            return {
+                "calls": stats["calls"],
+                "handled": stats["handled"],
+                "errors": stats["errors"],
+                "timeouts": stats["timeouts"],
+                "error_rate": round(stats["errors"] / stats["calls"], 4) if stats["calls"] else 0.0,
+                "avg_ms": ms(latency.sum / latency.total) if latency.total else None,
+                "p50_ms": ms(latency.percentile(50)),
+                "p95_ms": ms(latency.percentile(95)),
+                "p99_ms": ms(latency.percentile(99)),
+                "max_ms": ms(latency.max) if latency.total else None,
+                "loads": stats["loads"],
+                "load_failures": stats["load_failures"],
+                "load_time_ms": ms(stats["load_time"]),
+                "last_error": stats["last_error"],
+            }
+    
+    def snapshot_all(self) -> Dict[str, Dict]:
+        """모든 플러그인의 지표 {플러그인 이름: snapshot()}"""
+        with self._lock:
+            plugin_names = list(self._stats)
+        return {plugin_name: self.snapshot(plugin_name) for plugin_name in plugin_names}
+    
+    def dump(self, path: str, extra: Dict = None):
+        """
+        지표를 JSON 파일로 저장 (임시 파일에 쓴 뒤 교체)
+        
+        Args:
+            path: 저장할 파일 경로
+            extra: 함께 저장할 추가 정보 (플러그인 목록 등)
+        """
+        data = {
+            "generated_at": time.time(),
+            "started_at": self.started_at,
+            "plugins": self.snapshot_all(),
+        }
+        if extra:
+            data.update(extra)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"플러그인 지표 저장 오류: {e}")
+    
+    def reset(self):
+        """모든 지표 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
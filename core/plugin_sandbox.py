@@ -0,0 +1,366 @@
+"""
+플러그인 격리 실행 모듈 (core 패키지)
+플러그인마다 상주 작업 프로세스를 두고 파이프로 명령을 주고받아,
+느리거나 멈춘 플러그인, 충돌하는 플러그인이 애플리케이션 전체에 영향을 주지 않도록 합니다.
+"""
+import os
+import time
+import queue
+import threading
+import traceback
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from .config import Config
+
+
+class PluginTimeoutError(RuntimeError):
+    """플러그인이 제한 시간 안에 응답하지 않음"""
+
+
+class PluginCrashError(RuntimeError):
+    """플러그인 작업 프로세스가 비정상 종료되었거나 시작하지 못함"""
+
+
+def _worker_main(conn, plugin_path: str, plugin_name: str, class_name: Optional[str]):
+    """
+    작업 프로세스 진입점: 플러그인을 로드한 뒤 명령 요청을 순서대로 처리
+    
+    프로토콜 (부모 -> 작업): ("call", 명령, 컨텍스트) | ("describe",) | ("stop",)
+    프로토콜 (작업 -> 부모): ("ready", None) | ("ok", 결과) | ("error", 메시지)
+    """
+    import importlib.util
+    import inspect
+    from core.plugin_manager import PluginBase, run_plugin_command
+    
+    try:
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        plugin_class = getattr(module, class_name, None) if class_name else None
+        if not (inspect.isclass(plugin_class) and issubclass(plugin_class, PluginBase)):
+            plugin_class = next(
+                obj for _, obj in inspect.getmembers(module)
+                if inspect.isclass(obj) and issubclass(obj, PluginBase) and obj is not PluginBase
+            )
+        plugin = plugin_class()
+        plugin.on_load()
+    except Exception as e:
+        conn.send(("error", f"플러그인 로드 오류: {type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", None))
+    
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message[0] == "stop":
+            break
+        if message[0] == "describe":
+            try:
+                keywords = list(plugin.get_commands())
+            except Exception as e:
+                print(f"플러그인 '{plugin_name}' 명령 목록 조회 오류: {e}")
+                keywords = []
+            conn.send(("ok", {
+                "class_name": type(plugin).__name__,
+                "name": plugin.name,
+                "version": plugin.version,
+                "keywords": keywords,
+            }))
+            continue
+        _, command, context = message
+        try:
+            result = run_plugin_command(plugin, command, context)
+            conn.send(("ok", result))
+        except Exception as e:
+            traceback.print_exc()
+            try:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+            except Exception:
+                break
+    
+    try:
+        plugin.on_unload()
+    except Exception:
+        pass
+
+
+class _PluginWorker:
+    """플러그인 작업 프로세스 하나 (한 번에 요청 하나 처리)"""
+    
+    def __init__(self, context, plugin_path: str, plugin_name: str, class_name: Optional[str]):
+        self._context = context
+        self.plugin_path = plugin_path
+        self.plugin_name = plugin_name
+        self.class_name = class_name
+        self.process = None
+        self.conn = None
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+    
+    def start(self, timeout: float):
+        """작업 프로세스 시작 후 플러그인 로드 완료까지 대기"""
+        parent_conn, child_conn = self._context.Pipe()
+        self.process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.plugin_path, self.plugin_name, self.class_name),
+            name=f"plugin-{self.plugin_name}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        
+        status, payload = self._receive(timeout, "로드")
+        if status != "ready":
+            self.kill()
+            raise PluginCrashError(payload)
+    
+    def call(self, command: str, context: Optional[Dict], timeout: float):
+        """명령 처리 요청 (제한 시간 초과 시 프로세스를 종료하고 예외 발생)"""
+        try:
+            self.conn.send(("call", command, context))
+        except (OSError, ValueError) as e:
+            self.kill()
+            raise PluginCrashError(f"작업 프로세스에 요청을 보낼 수 없습니다: {e}")
+        
+        status, payload = self._receive(timeout, "명령 처리")
+        if status == "error":
+            raise RuntimeError(payload)
+        return payload
+    
+    def describe(self, timeout: float) -> Dict:
+        """로드된 플러그인의 매니페스트 정보 요청"""
+        try:
+            self.conn.send(("describe",))
+        except (OSError, ValueError) as e:
+            self.kill()
+            raise PluginCrashError(f"작업 프로세스에 요청을 보낼 수 없습니다: {e}")
+        
+        status, payload = self._receive(timeout, "정보 조회")
+        if status == "error":
+            raise RuntimeError(payload)
+        return payload
+    
+    def _receive(self, timeout: float, action: str) -> Tuple[str, object]:
+        try:
+            if not self.conn.poll(timeout):
+                # 멈춘 플러그인은 다음 요청에 재사용하지 않음
+                self.kill()
+                raise PluginTimeoutError(f"{action} 시간 초과 ({timeout:g}초)")
+            return self.conn.recv()
+        except (EOFError, OSError):
+            exitcode = None
+            if self.process is not None:
+                self.process.join(0.5)
+                exitcode = self.process.exitcode
+            self.kill()
+            raise PluginCrashError(f"작업 프로세스가 비정상 종료되었습니다 (종료 코드 {exitcode})")
+    
+    def stop(self):
+        """정상 종료 요청 (응답이 없으면 강제 종료)"""
+        if self.alive:
+            try:
+                self.conn.send(("stop",))
+                self.process.join(1.0)
+            except (OSError, ValueError):
+                pass
+        self.kill()
+    
+    def kill(self):
+        """작업 프로세스 강제 종료"""
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+
+class _WorkerPool:
+    """플러그인 하나의 작업 프로세스 묶음 (동시 처리 수 제한)"""
+    
+    def __init__(self, max_concurrency: int):
+        self.slots = threading.Semaphore(max_concurrency)
+        self.idle: "queue.LifoQueue[_PluginWorker]" = queue.LifoQueue()
+        # 연속 충돌 횟수 (성공하면 0으로 초기화)
+        self.consecutive_crashes = 0
+        self.restarts = 0
+
+
+class PluginSandbox:
+    """플러그인별 상주 작업 프로세스 풀"""
+    
+    # 플러그인 로드(작업 프로세스 시작) 제한 시간 (초)
+    LOAD_TIMEOUT = 30.0
+    # 연속으로 이 횟수만큼 충돌하면 reset() 전까지 실행하지 않음
+    MAX_CONSECUTIVE_CRASHES = 3
+    
+    def __init__(self, plugin_dir: str, timeout: float = None, max_concurrency: int = None, metrics=None):
+        """
+        샌드박스 초기화 (작업 프로세스는 플러그인이 처음 호출될 때 시작)
+        
+        Args:
+            plugin_dir: 플러그인 디렉토리
+            timeout: 명령 처리 제한 시간(초, 기본값: Config.PLUGIN_TIMEOUT)
+            max_concurrency: 플러그인별 최대 동시 처리 수 (기본값: Config.PLUGIN_MAX_CONCURRENCY)
+            metrics: 작업 프로세스 시작(플러그인 로드) 시간을 기록할 PluginMetrics (선택적)
+        """
+        self.plugin_dir = plugin_dir
+        self.metrics = metrics
+        self.timeout = timeout if timeout is not None else Config.PLUGIN_TIMEOUT
+        self.max_concurrency = max_concurrency or Config.PLUGIN_MAX_CONCURRENCY
+        # GUI 프로세스를 fork하지 않도록 spawn 방식 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._pools: Dict[str, _WorkerPool] = {}
+        self._lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="plugin-sandbox")
+    
+    def _get_pool(self, plugin_name: str) -> _WorkerPool:
+        with self._lock:
+            pool = self._pools.get(plugin_name)
+            if pool is None:
+                pool = _WorkerPool(self.max_concurrency)
+                self._pools[plugin_name] = pool
+            return pool
+    
+    def call(self, plugin_name: str, command: str, context: Dict = None,
+             class_name: str = None, timeout: float = None) -> Optional[Dict]:
+        """
+        플러그인 명령 처리 (작업 프로세스에서 실행, 완료까지 대기)
+        
+        Args:
+            plugin_name: 플러그인 이름 (파일명에서 .py 제외)
+            command: 사용자 명령
+            context: 컨텍스트 정보 (pickle 가능해야 함)
+            class_name: 플러그인 클래스 이름 (매니페스트 정보, 없으면 모듈에서 검색)
+            timeout: 제한 시간(초, 기본값: 샌드박스 설정)
+        
+        Returns:
+            플러그인 처리 결과 또는 None
+        
+        Raises:
+            PluginTimeoutError: 제한 시간 초과 (해당 작업 프로세스는 종료됨)
+            PluginCrashError: 작업 프로세스 충돌 또는 로드 실패
+            RuntimeError: 플러그인 handle_command에서 발생한 오류
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        pool = self._get_pool(plugin_name)
+        if pool.consecutive_crashes >= self.MAX_CONSECUTIVE_CRASHES:
+            raise PluginCrashError(f"연속 {pool.consecutive_crashes}회 충돌하여 실행이 중지되었습니다")
+        
+        with pool.slots:
+            try:
+                worker = pool.idle.get_nowait()
+            except queue.Empty:
+                worker = None
+            try:
+                if worker is None or not worker.alive:
+                    if worker is not None:
+                        pool.restarts += 1
+                    worker = _PluginWorker(
+                        self._context, os.path.join(self.plugin_dir, f"{plugin_name}.py"),
+                        plugin_name, class_name
+                    )
+                    start = time.perf_counter()
+                    try:
+                        worker.start(self.LOAD_TIMEOUT)
+                    finally:
+                        if self.metrics is not None:
+                            self.metrics.record_load(plugin_name, time.perf_counter() - start, success=worker.alive)
+                result = worker.call(command, context, timeout)
+            except (PluginTimeoutError, PluginCrashError):
+                pool.consecutive_crashes += 1
+                raise
+            finally:
+                # 시간 초과/충돌로 종료된 작업 프로세스는 다음 호출 때 다시 시작됨
+                if worker is not None:
+                    pool.idle.put(worker)
+            pool.consecutive_crashes = 0
+            return result
+    
+    def describe(self, plugin_name: str) -> Optional[Dict]:
+        """
+        플러그인 정보 조회 (일회용 작업 프로세스에서 import하여 GUI 프로세스는 플러그인 코드를 실행하지 않음)
+        
+        Args:
+            plugin_name: 플러그인 이름 (파일명에서 .py 제외)
+        
+        Returns:
+            {"class_name", "name", "version", "keywords"} 또는 None (로드 실패)
+        """
+        worker = _PluginWorker(
+            self._context, os.path.join(self.plugin_dir, f"{plugin_name}.py"), plugin_name, None
+        )
+        try:
+            worker.start(self.LOAD_TIMEOUT)
+            return worker.describe(self.LOAD_TIMEOUT)
+        except (PluginTimeoutError, PluginCrashError, RuntimeError) as e:
+            print(f"플러그인 '{plugin_name}' 정보 조회 오류: {e}")
+            return None
+        finally:
+            worker.stop()
+    
+    def submit(self, plugin_name: str, command: str, context: Dict = None,
+               class_name: str = None, timeout: float = None) -> Future:
+        """
+        플러그인 명령 처리 시작 (즉시 반환)
+        
+        Returns:
+            결과(또는 예외)를 담을 Future
+        """
+        return self.executor.submit(self.call, plugin_name, command, context, class_name, timeout)
+    
+    def stats(self) -> Dict[str, Dict]:
+        """
+        플러그인별 작업 프로세스 상태
+        
+        Returns:
+            {플러그인 이름: {"workers", "restarts", "consecutive_crashes"}}
+        """
+        with self._lock:
+            pools = dict(self._pools)
+        return {
+            plugin_name: {
+                "workers": sum(1 for worker in list(pool.idle.queue) if worker.alive),
+                "restarts": pool.restarts,
+                "consecutive_crashes": pool.consecutive_crashes,
+            }
+            for plugin_name, pool in pools.items()
+        }
+    
+    def reset(self, plugin_name: str):
+        """
+        플러그인 작업 프로세스 모두 종료 및 충돌 기록 초기화 (플러그인 파일이 바뀐 경우 등)
+        
+        Args:
+            plugin_name: 플러그인 이름
+        """
+        with self._lock:
+            pool = self._pools.pop(plugin_name, None)
+        if pool is not None:
+            self._stop_pool(pool)
+    
+    def shutdown(self):
+        """모든 작업 프로세스 종료"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            self._stop_pool(pool)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _stop_pool(self, pool: _WorkerPool):
+        while True:
+            try:
+                pool.idle.get_nowait().stop()
+            except queue.Empty:
+                break
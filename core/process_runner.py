@@ -0,0 +1,339 @@
+"""
+외부 명령 실행 모듈 (core 패키지)
+명령을 백그라운드 스레드에서 실행하고 stdout/stderr를 줄 단위로 스트리밍합니다.
+동시 실행 수 제한, 취소, 시간 제한, 출력 링 버퍼(최근 N줄만 보관)를 지원합니다.
+"""
+import os
+import time
+import signal
+import asyncio
+import threading
+import subprocess
+from collections import deque
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+
+class ProcessHandle:
+    """실행 중인 명령의 출력 스트림 및 취소 핸들"""
+    
+    def __init__(self, command: Union[str, Sequence[str]], max_output_lines: int,
+                 on_line: Callable[[str, str], None] = None,
+                 on_exit: Callable[["ProcessHandle"], None] = None):
+        """
+        명령 핸들 초기화
+        
+        Args:
+            command: 실행할 명령
+            max_output_lines: 보관할 최대 출력 줄 수 (초과 시 오래된 줄부터 버림)
+            on_line: 출력 줄마다 호출할 콜백 (스트림 이름 "stdout"/"stderr", 줄) - 읽기 스레드에서 호출됨
+            on_exit: 종료 시 호출할 콜백 (핸들) - 실행 스레드에서 호출됨
+        """
+        self.command = command
+        self.on_line = on_line
+        self.on_exit = on_exit
+        # 최근 출력 [(스트림 이름, 줄), ...]
+        self.output: deque = deque(maxlen=max_output_lines)
+        self.line_count = 0
+        self.returncode: Optional[int] = None
+        self.timed_out = False
+        # 실행하지 못한 경우의 오류 메시지
+        self.error: Optional[str] = None
+        self.process: Optional[subprocess.Popen] = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._cancel_event.is_set()
+    
+    @property
+    def done(self) -> bool:
+        """종료 여부 (정상 종료, 실패, 취소 포함)"""
+        return self._done_event.is_set()
+    
+    @property
+    def dropped_lines(self) -> int:
+        """링 버퍼에서 밀려나 보관되지 않은 줄 수"""
+        return self.line_count - len(self.output)
+    
+    def cancel(self):
+        """명령 취소 (대기 중이면 실행하지 않고, 실행 중이면 프로세스 그룹 종료)"""
+        self._cancel_event.set()
+        with self._lock:
+            process = self.process
+        if process is not None and process.poll() is None:
+            _terminate(process)
+    
+    def wait(self, timeout: float = None) -> Optional[int]:
+        """
+        명령 종료 대기
+        
+        Args:
+            timeout: 최대 대기 시간(초)
+        
+        Returns:
+            반환 코드 (시간 초과 시 None)
+        """
+        self._done_event.wait(timeout)
+        return self.returncode
+    
+    def output_text(self) -> str:
+        """보관된 출력 전체를 하나의 문자열로 반환"""
+        return "".join(line for _, line in self.output)
+    
+    def _add_line(self, stream: str, line: str):
+        with self._lock:
+            self.output.append((stream, line))
+            self.line_count += 1
+        if self.on_line:
+            try:
+                self.on_line(stream, line)
+            except Exception as e:
+                print(f"명령 출력 콜백 오류: {e}")
+    
+    def _finish(self, returncode: int):
+        self.returncode = returncode
+        self._done_event.set()
+        if self.on_exit:
+            try:
+                self.on_exit(self)
+            except Exception as e:
+                print(f"명령 종료 콜백 오류: {e}")
+
+
+class ProcessRunner:
+    """동시 실행 수가 제한된 비동기 명령 실행기"""
+    
+    DEFAULT_MAX_CONCURRENT = 4
+    DEFAULT_MAX_OUTPUT_LINES = 1000
+    # 취소 시 종료 요청 후 강제 종료까지 기다리는 시간 (초)
+    TERMINATE_GRACE = 2.0
+    # 종료/취소 확인 간격 (초)
+    POLL_INTERVAL = 0.1
+    
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 max_output_lines: int = DEFAULT_MAX_OUTPUT_LINES):
+        """
+        명령 실행기 초기화
+        
+        Args:
+            max_concurrent: 동시에 실행할 최대 명령 수 (초과분은 대기)
+            max_output_lines: 명령마다 보관할 최대 출력 줄 수
+        """
+        self.max_output_lines = max_output_lines
+        self._slots = threading.Semaphore(max_concurrent)
+        self._handles: List[ProcessHandle] = []
+        self._lock = threading.Lock()
+    
+    def run(self, command: Union[str, Sequence[str]], shell: bool = True, cwd: str = None,
+            timeout: float = None, on_line: Callable[[str, str], None] = None,
+            on_exit: Callable[[ProcessHandle], None] = None) -> ProcessHandle:
+        """
+        명령 실행 시작 (즉시 반환)
+        
+        Args:
+            command: 실행할 명령
+            shell: 셸 사용 여부
+            cwd: 작업 디렉토리
+            timeout: 최대 실행 시간(초, None이면 제한 없음)
+            on_line: 출력 줄마다 호출할 콜백 (스트림 이름, 줄)
+            on_exit: 종료 시 호출할 콜백 (핸들)
+        
+        Returns:
+            ProcessHandle (wait()로 종료 대기, cancel()로 취소)
+        """
+        handle = ProcessHandle(command, self.max_output_lines, on_line, on_exit)
+        with self._lock:
+            self._handles.append(handle)
+        thread = threading.Thread(
+            target=self._run_process, args=(handle, shell, cwd, timeout),
+            name="process-runner", daemon=True
+        )
+        thread.start()
+        return handle
+    
+    async def run_async(self, command: Union[str, Sequence[str]], shell: bool = True, cwd: str = None,
+                        timeout: float = None,
+                        on_line: Callable[[str, str], None] = None) -> Tuple[str, int]:
+        """
+        asyncio용 명령 실행 (이벤트 루프를 막지 않음)
+        
+        Args:
+            command: 실행할 명령
+            shell: 셸 사용 여부
+            cwd: 작업 디렉토리
+            timeout: 최대 실행 시간(초)
+            on_line: 출력 줄마다 이벤트 루프 스레드에서 호출할 콜백 (스트림 이름, 줄)
+        
+        Returns:
+            (보관된 출력, 반환 코드) 튜플
+        """
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        
+        def forward_line(stream, line):
+            loop.call_soon_threadsafe(on_line, stream, line)
+        
+        def resolve(finished_handle):
+            if not done.done():
+                done.set_result(finished_handle)
+        
+        handle = self.run(
+            command, shell=shell, cwd=cwd, timeout=timeout,
+            on_line=forward_line if on_line else None,
+            on_exit=lambda finished: loop.call_soon_threadsafe(resolve, finished)
+        )
+        try:
+            await done
+        except asyncio.CancelledError:
+            handle.cancel()
+            raise
+        return (handle.output_text(), handle.returncode)
+    
+    def spawn_detached(self, args: Sequence[str]) -> bool:
+        """
+        종료를 기다리지 않는 프로그램 실행 (파일 열기 등)
+        
+        Args:
+            args: 실행할 명령과 인자
+        
+        Returns:
+            실행 성공 여부
+        """
+        try:
+            subprocess.Popen(
+                list(args),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_session_options()
+            )
+            return True
+        except Exception as e:
+            print(f"프로그램 실행 오류: {e}")
+            return False
+    
+    def running(self) -> List[ProcessHandle]:
+        """아직 종료되지 않은 명령 핸들 목록"""
+        with self._lock:
+            return [handle for handle in self._handles if not handle.done]
+    
+    def cancel_all(self):
+        """대기/실행 중인 모든 명령 취소"""
+        for handle in self.running():
+            handle.cancel()
+    
+    def _run_process(self, handle: ProcessHandle, shell: bool, cwd: Optional[str], timeout: Optional[float]):
+        """명령 하나 실행 (실행 슬롯을 얻을 때까지 대기)"""
+        returncode = -1
+        acquired = False
+        try:
+            while not handle.cancelled:
+                if self._slots.acquire(timeout=self.POLL_INTERVAL):
+                    acquired = True
+                    break
+            if handle.cancelled:
+                return
+            
+            try:
+                process = subprocess.Popen(
+                    handle.command,
+                    shell=shell,
+                    cwd=cwd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    errors="replace",
+                    bufsize=1,
+                    **_session_options()
+                )
+            except Exception as e:
+                handle.error = f"명령 실행 오류: {str(e)}"
+                return
+            
+            with handle._lock:
+                handle.process = process
+            # 핸들을 넘기기 전에 취소된 경우
+            if handle.cancelled:
+                _terminate(process)
+            
+            readers = [
+                threading.Thread(target=self._read_stream, args=(handle, process.stdout, "stdout"), daemon=True),
+                threading.Thread(target=self._read_stream, args=(handle, process.stderr, "stderr"), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            
+            returncode = self._wait_process(handle, process, timeout)
+            
+            for reader in readers:
+                reader.join()
+        finally:
+            if acquired:
+                self._slots.release()
+            with self._lock:
+                if handle in self._handles:
+                    self._handles.remove(handle)
+            handle._finish(returncode)
+    
+    def _wait_process(self, handle: ProcessHandle, process: subprocess.Popen, timeout: Optional[float]) -> int:
+        """프로세스 종료 대기 (취소/시간 초과 시 종료 요청 후 유예 시간이 지나면 강제 종료)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return process.wait(timeout=self.POLL_INTERVAL)
+            except subprocess.TimeoutExpired:
+                pass
+            if deadline is not None and time.monotonic() >= deadline:
+                handle.timed_out = True
+            if handle.cancelled or handle.timed_out:
+                break
+        
+        _terminate(process)
+        try:
+            return process.wait(timeout=self.TERMINATE_GRACE)
+        except subprocess.TimeoutExpired:
+            _kill(process)
+            return process.wait()
+    
+    def _read_stream(self, handle: ProcessHandle, stream, name: str):
+        """출력 스트림을 줄 단위로 읽어 핸들에 전달"""
+        try:
+            for line in stream:
+                handle._add_line(name, line)
+        except (OSError, ValueError):
+            pass
+        finally:
+            stream.close()
+
+
+def _session_options() -> dict:
+    """자식 프로세스를 별도 프로세스 그룹으로 실행하는 Popen 옵션 (취소 시 하위 프로세스까지 종료)"""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _terminate(process: subprocess.Popen):
+    """프로세스 그룹 종료 요청"""
+    try:
+        if os.name == "nt":
+            process.terminate()
+        else:
+            os.killpg(process.pid, signal.SIGTERM)
+    except (OSError, ProcessLookupError):
+        pass
+
+
+def _kill(process: subprocess.Popen):
+    """프로세스 그룹 강제 종료"""
+    try:
+        if os.name == "nt":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, ProcessLookupError):
+        pass
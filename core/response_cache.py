@@ -0,0 +1,221 @@
+"""
+LLM 응답 캐시 모듈 (core 패키지)
+SQLite를 사용하여 LLM 응답을 디스크에 캐시합니다.
+같은 프롬프트/대화 기록/모델/온도 조합의 요청은 API를 호출하지 않고 캐시에서 응답합니다.
+"""
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from .config import Config
+from .db import get_database
+
+
+class ResponseCache:
+    """TTL과 LRU 크기 제한을 지원하는 LLM 응답 캐시"""
+    
+    # 최근 응답을 DB 조회 없이 돌려주기 위한 메모리 캐시 크기
+    MEMORY_CACHE_SIZE = 128
+    
+    def __init__(self, db_path: str = None, ttl: int = None, max_entries: int = None):
+        """
+        응답 캐시 초기화
+        
+        Args:
+            db_path: 캐시 DB 경로 (기본값: Config.LLM_CACHE_PATH)
+            ttl: 캐시 유효 시간(초, 기본값: Config.LLM_CACHE_TTL, 0 이하면 만료 없음)
+            max_entries: 최대 저장 개수 (기본값: Config.LLM_CACHE_MAX_ENTRIES)
+        """
+        self.db_path = db_path or Config.LLM_CACHE_PATH
+        self.ttl = Config.LLM_CACHE_TTL if ttl is None else ttl
+        self.max_entries = Config.LLM_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        
+        # 캐시 적중/실패 횟수
+        self.hits = 0
+        self.misses = 0
+        
+        # LLM 워커 스레드에서 호출되므로 메모리 캐시와 카운터를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        # 메모리 캐시 적중 시 last_accessed 갱신을 모아두었다가 한 번에 기록
+        self._pending_touches: Dict[str, float] = {}
+        # 공유 저장소 계층 (스레드별 장기 연결, WAL 모드)
+        self.db = get_database(self.db_path)
+        self._init_database()
+    
+    def _init_database(self):
+        """캐시 테이블 초기화 및 만료 항목 정리"""
+        with self.db.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_response_cache_last_accessed
+                ON response_cache (last_accessed)
+            """)
+            if self.ttl > 0:
+                conn.execute("DELETE FROM response_cache WHERE created_at < ?",
+                             (time.time() - self.ttl,))
+    
+    @staticmethod
+    def make_key(system_prompt: str, history: Optional[List[Dict]], message: str,
+                 model: str, temperature: float) -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+            history: 대화 기록 창 (role/content 딕셔너리 리스트)
+            message: 사용자 메시지
+            model: LLM 모델 이름
+            temperature: 생성 온도
+            
+        Returns:
+            SHA-256 해시 문자열
+        """
+        payload = json.dumps(
+            {
+                "system_prompt": system_prompt,
+                "history": history or [],
+                "message": message,
+                "model": model,
+                "temperature": temperature,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """TTL 만료 여부"""
+        return self.ttl > 0 and created_at < now - self.ttl
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답 조회
+        
+        Args:
+            key: make_key()로 생성한 캐시 키
+            
+        Returns:
+            캐시된 응답 또는 None
+        """
+        now = time.time()
+        with self._lock:
+            # 1) 메모리 캐시
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._pending_touches[key] = now
+                    self.hits += 1
+                    return response
+                del self._memory[key]
+            
+            # 2) 디스크 캐시
+            row = self.db.execute(
+                "SELECT response, created_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            
+            response, created_at = row
+            if self._is_expired(created_at, now):
+                with self.db.transaction() as conn:
+                    conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            
+            with self.db.transaction() as conn:
+                conn.execute(
+                    "UPDATE response_cache SET last_accessed = ? WHERE key = ?", (now, key)
+                )
+            self._remember(key, response, created_at)
+            self.hits += 1
+            return response
+    
+    def set(self, key: str, response: str):
+        """
+        응답 저장 (최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 제거)
+        
+        Args:
+            key: make_key()로 생성한 캐시 키
+            response: 저장할 응답
+        """
+        now = time.time()
+        with self._lock, self.db.transaction() as conn:
+            self._flush_touches(conn)
+            conn.execute("""
+                INSERT OR REPLACE INTO response_cache (key, response, created_at, last_accessed)
+                VALUES (?, ?, ?, ?)
+            """, (key, response, now, now))
+            
+            if self.max_entries > 0:
+                count = conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    evicted = conn.execute("""
+                        SELECT key FROM response_cache
+                        ORDER BY last_accessed ASC
+                        LIMIT ?
+                    """, (overflow,)).fetchall()
+                    evicted_keys = [row[0] for row in evicted]
+                    conn.executemany("DELETE FROM response_cache WHERE key = ?",
+                                     [(evicted_key,) for evicted_key in evicted_keys])
+                    for evicted_key in evicted_keys:
+                        self._memory.pop(evicted_key, None)
+            
+            self._remember(key, response, now)
+    
+    def _remember(self, key: str, response: str, created_at: float):
+        """메모리 캐시에 저장 (잠금을 잡은 상태에서 호출)"""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.MEMORY_CACHE_SIZE:
+            self._memory.popitem(last=False)
+    
+    def _flush_touches(self, conn):
+        """모아둔 last_accessed 갱신을 기록 (잠금을 잡은 상태에서 호출)"""
+        if self._pending_touches:
+            conn.executemany(
+                "UPDATE response_cache SET last_accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._pending_touches.items()],
+            )
+            self._pending_touches.clear()
+    
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock, self.db.transaction() as conn:
+            conn.execute("DELETE FROM response_cache")
+            self._memory.clear()
+            self._pending_touches.clear()
+    
+    def stats(self) -> Dict:
+        """
+        캐시 통계 조회
+        
+        Returns:
+            적중/실패 횟수, 적중률, 저장된 항목 수
+        """
+        entries = self.db.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+        }
+    
+    def flush(self):
+        """보류 중인 last_accessed 갱신 기록"""
+        with self._lock, self.db.transaction() as conn:
+            self._flush_touches(conn)
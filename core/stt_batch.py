@@ -0,0 +1,261 @@
+"""
+음성 파일 일괄 인식 모듈 (core 패키지)
+여러 음성 파일을 모델 하나로 차례로 인식하면서 다음 파일들의 오디오 디코딩을 스레드 풀에서 미리 진행하고,
+파일별 상태를 SQLite(transcriptions 테이블)에 기록하여 중단된 작업을 이어서 처리할 수 있게 합니다.
+"""
+import os
+import time
+import threading
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+from .config import Config
+from .db import get_database
+from .migrations import migrate
+
+
+class BatchTranscriber:
+    """음성 파일 일괄 인식기 (디코딩 병렬, 인식은 모델 하나로 순차)"""
+    
+    # 폴더를 지정했을 때 인식 대상으로 볼 확장자
+    AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".aac", ".ogg", ".oga", ".opus", ".flac", ".webm", ".mp4")
+    
+    def __init__(self, decode: Callable[[str], object], transcribe: Callable[[object], Optional[str]],
+                 model_name: str, db_path: str = None, decode_workers: int = None, prefetch: int = None):
+        """
+        일괄 인식기 초기화
+        
+        Args:
+            decode: 파일 경로 -> 오디오 데이터 함수 (디코딩 스레드에서 호출)
+            transcribe: 오디오 데이터 -> 인식 텍스트 함수 (호출한 스레드에서 순서대로 호출)
+            model_name: 모델 이름 (모델이 바뀌면 이미 인식한 파일도 다시 인식)
+            db_path: 상태를 기록할 DB 경로 (기본값: Config.DB_PATH)
+            decode_workers: 디코딩 스레드 수 (기본값: CPU 수 기반, 최대 4)
+            prefetch: 미리 디코딩해 둘 최대 파일 수 (기본값: 디코딩 스레드 수 + 1, 메모리 사용량 제한)
+        """
+        self.decode = decode
+        self.transcribe = transcribe
+        self.model_name = model_name
+        self.db = get_database(db_path or Config.DB_PATH)
+        migrate(self.db)
+        self.decode_workers = decode_workers or max(1, min(4, (os.cpu_count() or 1) // 2))
+        self.prefetch = prefetch or self.decode_workers + 1
+    
+    @classmethod
+    def collect_paths(cls, paths: Iterable[str]) -> List[str]:
+        """
+        인식할 파일 목록 (폴더는 하위 폴더까지 음성 파일 확장자로 검색)
+        
+        Args:
+            paths: 파일 또는 폴더 경로 목록
+        
+        Returns:
+            중복 없는 절대 경로 목록 (입력 순서, 폴더 안은 이름순)
+        """
+        files: Dict[str, None] = {}
+        for path in paths:
+            path = os.path.abspath(path)
+            if os.path.isdir(path):
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    for filename in sorted(filenames):
+                        if filename.lower().endswith(cls.AUDIO_EXTENSIONS):
+                            files[os.path.join(dirpath, filename)] = None
+            elif os.path.isfile(path):
+                files[path] = None
+        return list(files)
+    
+    def run(self, paths: Iterable[str], memo_manager=None, memo_tags: str = "음성메모",
+            progress: Callable[[Dict], None] = None, cancel_event: threading.Event = None) -> Dict:
+        """
+        일괄 인식 실행 (완료까지 대기)
+        
+        같은 모델로 이미 인식했고 크기/수정 시각이 그대로인 파일은 건너뛰며,
+        중단된 작업(상태가 pending인 파일)과 실패한 파일은 다시 인식합니다.
+        
+        Args:
+            paths: 파일 또는 폴더 경로 목록
+            memo_manager: 지정하면 인식 결과를 메모로 추가 (파일당 한 번만, 제목은 파일 이름,
+                          모델이 바뀌어 다시 인식하면 새로 추가하지 않고 기존 메모 내용을 갱신)
+            memo_tags: 추가할 메모의 태그
+            progress: 파일 하나가 끝날 때마다 호출 ({"done", "total", "path", "status"})
+            cancel_event: 설정되면 진행 중인 파일까지만 처리하고 중단
+        
+        Returns:
+            {"total", "transcribed", "skipped", "failed", "imported", "updated", "cancelled", "elapsed",
+             "results": [{"path", "status", "text", "error", "memo_id"}, ...]}
+        """
+        start = time.perf_counter()
+        files = self.collect_paths(paths)
+        summary = {
+            "total": len(files),
+            "transcribed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "imported": 0,
+            "updated": 0,
+            "cancelled": False,
+            "elapsed": 0.0,
+            "results": [],
+        }
+        
+        # 이전 실행 기록과 비교하여 인식할 파일 선택
+        pending = []
+        stats = {}
+        for path in files:
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                self._record_failure(summary, path, None, f"파일 정보를 읽을 수 없습니다: {e}")
+                continue
+            stats[path] = st
+            row = self.db.fetch_one("SELECT * FROM transcriptions WHERE path = ?", (path,))
+            if (
+                row is not None and row["status"] == "done" and row["model"] == self.model_name
+                and row["size"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns
+            ):
+                summary["skipped"] += 1
+                result = self._make_result(row)
+                if memo_manager is not None and row["memo_id"] is None:
+                    self._import_memo(summary, result, memo_manager, memo_tags)
+                summary["results"].append(result)
+            else:
+                pending.append(path)
+        
+        now = datetime.now().isoformat()
+        with self.db.transaction() as conn:
+            conn.executemany("""
+                INSERT INTO transcriptions (path, size, mtime_ns, status, model, updated_at)
+                VALUES (?, ?, ?, 'pending', ?, ?)
+                ON CONFLICT (path) DO UPDATE SET
+                    size = excluded.size, mtime_ns = excluded.mtime_ns, status = 'pending',
+                    model = excluded.model, text = NULL, error = NULL, updated_at = excluded.updated_at
+            """, [
+                (path, stats[path].st_size, stats[path].st_mtime_ns, self.model_name, now)
+                for path in pending
+            ])
+        
+        # 디코딩은 최대 prefetch개까지 미리 진행하고, 인식은 순서대로 하나씩
+        done_count = summary["skipped"] + summary["failed"]
+        queue = deque(pending)
+        in_flight = deque()
+        executor = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="stt-decode")
+        try:
+            while queue or in_flight:
+                while queue and len(in_flight) < self.prefetch and not (cancel_event and cancel_event.is_set()):
+                    path = queue.popleft()
+                    in_flight.append((path, executor.submit(self.decode, path)))
+                if cancel_event is not None and cancel_event.is_set():
+                    summary["cancelled"] = True
+                    break
+                if not in_flight:
+                    break
+                
+                path, future = in_flight.popleft()
+                try:
+                    audio = future.result()
+                except Exception as e:
+                    self._record_failure(summary, path, stats[path], f"오디오 디코딩 오류: {e}")
+                else:
+                    item_start = time.perf_counter()
+                    try:
+                        text = (self.transcribe(audio) or "").strip()
+                    except Exception as e:
+                        self._record_failure(summary, path, stats[path], f"음성 인식 오류: {e}")
+                    else:
+                        del audio
+                        self._record_success(summary, path, text, time.perf_counter() - item_start)
+                        if memo_manager is not None and text:
+                            self._import_memo(summary, summary["results"][-1], memo_manager, memo_tags)
+                
+                done_count += 1
+                if progress is not None:
+                    progress({
+                        "done": done_count,
+                        "total": summary["total"],
+                        "path": path,
+                        "status": summary["results"][-1]["status"],
+                    })
+        finally:
+            # 중단된 경우 남은 파일은 pending 상태로 남아 다음 실행 때 이어서 처리됨
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        summary["elapsed"] = time.perf_counter() - start
+        return summary
+    
+    def status(self, paths: Iterable[str] = None) -> List[Dict]:
+        """
+        기록된 파일별 인식 상태
+        
+        Args:
+            paths: 조회할 파일/폴더 경로 목록 (None이면 전체)
+        
+        Returns:
+            transcriptions 행 딕셔너리 목록
+        """
+        if paths is None:
+            return self.db.fetch_all("SELECT * FROM transcriptions ORDER BY path")
+        return [
+            row for row in (
+                self.db.fetch_one("SELECT * FROM transcriptions WHERE path = ?", (path,))
+                for path in self.collect_paths(paths)
+            )
+            if row is not None
+        ]
+    
+    @staticmethod
+    def _make_result(row: Dict) -> Dict:
+        return {
+            "path": row["path"],
+            "status": row["status"],
+            "text": row["text"],
+            "error": row["error"],
+            "memo_id": row["memo_id"],
+        }
+    
+    def _record_success(self, summary: Dict, path: str, text: str, duration: float):
+        with self.db.transaction() as conn:
+            conn.execute("""
+                UPDATE transcriptions SET status = 'done', text = ?, error = NULL, duration = ?, updated_at = ?
+                WHERE path = ?
+            """, (text, duration, datetime.now().isoformat(), path))
+            # 이전 실행에서 추가한 메모 (다시 인식해도 memo_id는 유지됨)
+            row = conn.execute("SELECT memo_id FROM transcriptions WHERE path = ?", (path,)).fetchone()
+        summary["transcribed"] += 1
+        summary["results"].append({
+            "path": path, "status": "done", "text": text, "error": None, "memo_id": row[0] if row else None
+        })
+    
+    def _record_failure(self, summary: Dict, path: str, st: Optional[os.stat_result], error: str):
+        print(f"음성 일괄 인식 실패 ({path}): {error}")
+        if st is not None:
+            with self.db.transaction() as conn:
+                conn.execute("""
+                    UPDATE transcriptions SET status = 'failed', text = NULL, error = ?, updated_at = ?
+                    WHERE path = ?
+                """, (error, datetime.now().isoformat(), path))
+        summary["failed"] += 1
+        summary["results"].append({"path": path, "status": "failed", "text": None, "error": error, "memo_id": None})
+    
+    def _import_memo(self, summary: Dict, result: Dict, memo_manager, memo_tags: str):
+        """
+        인식 결과를 메모로 추가하고 메모 ID 기록 (다음 실행 때 중복 추가 방지)
+        
+        이미 메모로 추가한 파일이면 새로 추가하지 않고 그 메모의 내용만 갱신합니다.
+        (사용자가 메모를 삭제했으면 다시 추가하지 않음)
+        """
+        if not result["text"]:
+            return
+        if result["memo_id"] is not None:
+            if memo_manager.update_memo(result["memo_id"], content=result["text"]):
+                summary["updated"] += 1
+            return
+        title = os.path.splitext(os.path.basename(result["path"]))[0]
+        memo_id = memo_manager.add_memo(title, result["text"], memo_tags)
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE transcriptions SET memo_id = ? WHERE path = ?", (memo_id, result["path"]))
+        result["memo_id"] = memo_id
+        summary["imported"] += 1
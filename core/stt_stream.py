@@ -0,0 +1,391 @@
+"""
+스트리밍 음성 인식 모듈 (core 패키지)
+PCM 프레임(16비트 모노)을 에너지 기반 음성 구간 검출(VAD)로 나누고,
+말하는 도중에는 부분 결과를, 구간이 끝나면 최종 결과를 작업 스레드에서 차례로 인식합니다.
+인식 함수는 주입식이므로 Whisper 없이도 WAV 파일로 동작을 확인할 수 있습니다.
+"""
+import math
+import time
+import wave
+import array
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def iter_wav_frames(path: str, frame_ms: int = 30) -> Tuple[int, Iterator[bytes]]:
+    """
+    WAV 파일을 고정 길이 PCM 프레임으로 읽기 (여러 채널이면 첫 채널만 사용)
+    
+    Args:
+        path: WAV 파일 경로 (16비트 PCM)
+        frame_ms: 프레임 길이 (밀리초)
+    
+    Returns:
+        (샘플레이트, 16비트 모노 프레임 이터레이터)
+    
+    Raises:
+        ValueError: 16비트 PCM이 아닌 파일
+        OSError, wave.Error: 파일을 읽을 수 없음
+    """
+    wav = wave.open(path, "rb")
+    if wav.getsampwidth() != 2:
+        wav.close()
+        raise ValueError("16비트 PCM WAV 파일만 지원합니다.")
+    sample_rate = wav.getframerate()
+    channels = wav.getnchannels()
+    frame_samples = max(1, sample_rate * frame_ms // 1000)
+    
+    def frames():
+        try:
+            while True:
+                data = wav.readframes(frame_samples)
+                if not data:
+                    break
+                if channels > 1:
+                    samples = array.array("h", data)
+                    data = samples[::channels].tobytes()
+                yield data
+        finally:
+            wav.close()
+    
+    return sample_rate, frames()
+
+
+class EnergyVAD:
+    """프레임 에너지(RMS)와 배경 소음 추정치를 비교하는 음성 구간 검출기"""
+    
+    def __init__(self, threshold_ratio: float = 3.0, min_rms: float = 300.0, noise_adapt: float = 0.05):
+        """
+        검출기 초기화
+        
+        Args:
+            threshold_ratio: 배경 소음 대비 음성으로 볼 에너지 배율
+            min_rms: 음성으로 볼 최소 RMS (16비트 기준, 조용한 환경에서 잡음 오검출 방지)
+            noise_adapt: 배경 소음 추정치 갱신 비율 (음성이 아닌 프레임에서만 갱신)
+        """
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.noise_adapt = noise_adapt
+        self.noise_rms: Optional[float] = None
+    
+    @staticmethod
+    def frame_rms(frame: bytes) -> float:
+        """16비트 PCM 프레임의 RMS"""
+        samples = array.array("h", frame[:len(frame) - len(frame) % 2])
+        if not samples:
+            return 0.0
+        return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+    
+    def is_speech(self, frame: bytes) -> bool:
+        """
+        프레임이 음성인지 판정 (배경 소음 추정치 갱신 포함)
+        
+        Args:
+            frame: 16비트 모노 PCM 프레임
+        
+        Returns:
+            음성 여부
+        """
+        rms = self.frame_rms(frame)
+        if self.noise_rms is None:
+            # 첫 프레임은 배경 소음으로 가정 (최소 기준 이하로만)
+            self.noise_rms = min(rms, self.min_rms)
+        threshold = max(self.min_rms, self.noise_rms * self.threshold_ratio)
+        speech = rms >= threshold
+        if not speech:
+            self.noise_rms += (rms - self.noise_rms) * self.noise_adapt
+        return speech
+
+
+@dataclass
+class SpeechSegment:
+    """인식할 음성 구간"""
+    # 구간 번호 (0부터)
+    index: int
+    # 스트림 시작 기준 시작/끝 시각 (초)
+    start: float
+    end: float
+    # 16비트 모노 PCM
+    audio: bytes
+    # True면 구간이 끝난 최종본, False면 말하는 중의 부분본
+    final: bool
+
+
+class SpeechSegmenter:
+    """VAD 결과로 프레임을 음성 구간으로 묶음"""
+    
+    def __init__(self, sample_rate: int, vad: EnergyVAD = None, start_ms: int = 90, silence_ms: int = 600,
+                 pre_roll_ms: int = 200, partial_interval: float = 1.0, max_segment: float = 20.0,
+                 min_speech_ms: int = 250):
+        """
+        구간 분할기 초기화
+        
+        Args:
+            sample_rate: 샘플레이트 (Hz)
+            vad: 음성 검출기 (기본값: EnergyVAD())
+            start_ms: 음성 구간 시작으로 볼 연속 음성 길이
+            silence_ms: 구간 끝으로 볼 연속 무음 길이
+            pre_roll_ms: 구간 앞에 붙일 직전 오디오 길이 (첫 음절 잘림 방지)
+            partial_interval: 부분 결과를 만들 간격 (초, 구간 길이 기준)
+            max_segment: 최대 구간 길이 (초, 넘으면 강제로 끊음)
+            min_speech_ms: 이보다 짧은 구간은 잡음으로 보고 버림
+        """
+        self.sample_rate = sample_rate
+        self.vad = vad or EnergyVAD()
+        self.start_bytes = self._ms_to_bytes(start_ms)
+        self.silence_bytes = self._ms_to_bytes(silence_ms)
+        self.pre_roll_bytes = self._ms_to_bytes(pre_roll_ms)
+        self.partial_bytes = self._ms_to_bytes(partial_interval * 1000)
+        self.max_bytes = self._ms_to_bytes(max_segment * 1000)
+        self.min_speech_bytes = self._ms_to_bytes(min_speech_ms)
+        
+        self._position = 0  # 지금까지 받은 바이트 수
+        self._index = 0
+        self._pre_roll: deque = deque()
+        self._pre_roll_size = 0
+        self._candidate: List[bytes] = []  # 음성 시작 확인 전 연속 음성 프레임
+        self._candidate_size = 0
+        self._segment: Optional[bytearray] = None
+        self._segment_start = 0
+        self._silence_size = 0
+        self._speech_size = 0
+        self._last_partial_size = 0
+    
+    def _ms_to_bytes(self, ms: float) -> int:
+        return int(self.sample_rate * ms / 1000) * 2
+    
+    def _seconds(self, position: int) -> float:
+        return position / 2 / self.sample_rate
+    
+    def feed(self, frame: bytes) -> List[SpeechSegment]:
+        """
+        프레임 하나 처리
+        
+        Args:
+            frame: 16비트 모노 PCM 프레임
+        
+        Returns:
+            새로 만들어진 부분/최종 구간 목록 (대부분 비어 있음)
+        """
+        speech = self.vad.is_speech(frame)
+        self._position += len(frame)
+        
+        if self._segment is None:
+            if not speech:
+                self._candidate.clear()
+                self._candidate_size = 0
+                self._push_pre_roll(frame)
+                return []
+            self._candidate.append(frame)
+            self._candidate_size += len(frame)
+            if self._candidate_size < self.start_bytes:
+                return []
+            # 음성 시작: 직전 오디오 + 후보 프레임으로 구간 생성
+            self._segment = bytearray(b"".join(self._pre_roll))
+            for candidate in self._candidate:
+                self._segment += candidate
+            self._segment_start = self._position - len(self._segment)
+            self._speech_size = self._candidate_size
+            self._silence_size = 0
+            self._last_partial_size = 0
+            self._candidate.clear()
+            self._candidate_size = 0
+            self._pre_roll.clear()
+            self._pre_roll_size = 0
+            return []
+        
+        self._segment += frame
+        if speech:
+            self._speech_size += len(frame)
+            self._silence_size = 0
+        else:
+            self._silence_size += len(frame)
+        
+        if self._silence_size >= self.silence_bytes or len(self._segment) >= self.max_bytes:
+            segment = self._finish()
+            return [segment] if segment is not None else []
+        if len(self._segment) - self._last_partial_size >= self.partial_bytes:
+            self._last_partial_size = len(self._segment)
+            return [self._make_segment(final=False)]
+        return []
+    
+    def flush(self) -> List[SpeechSegment]:
+        """스트림 끝: 진행 중인 구간을 최종 구간으로 반환"""
+        if self._segment is None:
+            return []
+        segment = self._finish()
+        return [segment] if segment is not None else []
+    
+    def _push_pre_roll(self, frame: bytes):
+        self._pre_roll.append(frame)
+        self._pre_roll_size += len(frame)
+        while self._pre_roll and self._pre_roll_size - len(self._pre_roll[0]) >= self.pre_roll_bytes:
+            self._pre_roll_size -= len(self._pre_roll.popleft())
+    
+    def _make_segment(self, final: bool) -> SpeechSegment:
+        return SpeechSegment(
+            index=self._index,
+            start=self._seconds(self._segment_start),
+            end=self._seconds(self._segment_start + len(self._segment)),
+            audio=bytes(self._segment),
+            final=final,
+        )
+    
+    def _finish(self) -> Optional[SpeechSegment]:
+        """진행 중인 구간 종료 (짧은 잡음 구간은 버림)"""
+        segment = None
+        if self._speech_size >= self.min_speech_bytes:
+            # 끝의 무음은 인식에 필요 없으므로 잘라냄 (구간 간 겹침 방지용으로 일부만 남김)
+            trailing = max(0, self._silence_size - self.pre_roll_bytes)
+            if trailing:
+                del self._segment[len(self._segment) - trailing:]
+            segment = self._make_segment(final=True)
+            self._index += 1
+        self._segment = None
+        self._silence_size = 0
+        self._speech_size = 0
+        return segment
+
+
+class STTStreamHandle:
+    """실행 중인 스트리밍 인식 작업"""
+    
+    def __init__(self):
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self.finals: List[Dict] = []
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+    
+    @property
+    def text(self) -> str:
+        """지금까지 확정된 최종 결과 전체"""
+        return " ".join(result["text"] for result in self.finals if result["text"])
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+    
+    def is_running(self) -> bool:
+        return not self._done_event.is_set()
+    
+    def cancel(self):
+        """인식 중단 (남은 프레임과 대기 중인 구간은 버림)"""
+        self._cancel_event.set()
+    
+    def wait(self, timeout: float = None) -> bool:
+        """
+        작업 종료까지 대기
+        
+        Returns:
+            시간 안에 끝났는지 여부
+        """
+        return self._done_event.wait(timeout)
+
+
+class StreamingTranscriber:
+    """프레임 읽기/VAD 스레드와 인식 스레드로 구성된 스트리밍 인식기"""
+    
+    def __init__(self, transcribe: Callable[[bytes, int], Optional[str]], **segmenter_options):
+        """
+        인식기 초기화
+        
+        Args:
+            transcribe: (16비트 모노 PCM, 샘플레이트) -> 인식 텍스트 함수 (인식 스레드에서 호출)
+            **segmenter_options: SpeechSegmenter 옵션 (silence_ms, partial_interval 등)
+        """
+        self.transcribe = transcribe
+        self.segmenter_options = segmenter_options
+    
+    def start(self, frames: Iterable[bytes], sample_rate: int,
+              on_result: Callable[[Dict], None] = None,
+              on_finish: Callable[[STTStreamHandle], None] = None) -> STTStreamHandle:
+        """
+        스트리밍 인식 시작 (즉시 반환)
+        
+        결과는 {"type": "partial"|"final", "segment", "text", "start", "end"} 딕셔너리로
+        on_result에 전달됩니다 (인식 스레드에서 호출). 인식이 밀리면 같은 구간의 오래된 부분 결과는
+        건너뛰고 최신 부분본만 인식하며, 최종본은 항상 인식합니다.
+        
+        Args:
+            frames: 16비트 모노 PCM 프레임 이터러블 (제너레이터, 파일 스트림 등)
+            sample_rate: 샘플레이트 (Hz)
+            on_result: 부분/최종 결과 콜백
+            on_finish: 종료 콜백 (취소/오류 포함)
+        
+        Returns:
+            작업 핸들
+        """
+        handle = STTStreamHandle()
+        segmenter = SpeechSegmenter(sample_rate, **self.segmenter_options)
+        pending: deque = deque()
+        condition = threading.Condition()
+        state = {"reading": True}
+        
+        def read_frames():
+            try:
+                for frame in frames:
+                    if handle.cancelled:
+                        break
+                    for segment in segmenter.feed(frame):
+                        enqueue(segment)
+                if not handle.cancelled:
+                    for segment in segmenter.flush():
+                        enqueue(segment)
+            except Exception as e:
+                handle.error = f"오디오 읽기 오류: {e}"
+                print(f"STT 스트림 {handle.error}")
+            finally:
+                with condition:
+                    state["reading"] = False
+                    condition.notify()
+        
+        def enqueue(segment: SpeechSegment):
+            with condition:
+                # 아직 인식하지 않은 같은 구간의 부분본은 새 구간으로 대체
+                while pending and pending[-1].index == segment.index and not pending[-1].final:
+                    pending.pop()
+                pending.append(segment)
+                condition.notify()
+        
+        def decode():
+            start = time.perf_counter()
+            try:
+                while True:
+                    with condition:
+                        while not pending and state["reading"] and not handle.cancelled:
+                            condition.wait(0.1)
+                        if handle.cancelled or not pending:
+                            if handle.cancelled or not state["reading"]:
+                                break
+                            continue
+                        segment = pending.popleft()
+                    try:
+                        text = self.transcribe(segment.audio, sample_rate)
+                    except Exception as e:
+                        print(f"STT 오류: {e}")
+                        text = None
+                    if handle.cancelled:
+                        break
+                    result = {
+                        "type": "final" if segment.final else "partial",
+                        "segment": segment.index,
+                        "text": (text or "").strip(),
+                        "start": segment.start,
+                        "end": segment.end,
+                    }
+                    if segment.final:
+                        handle.finals.append(result)
+                    if on_result is not None:
+                        on_result(result)
+            finally:
+                handle.elapsed = time.perf_counter() - start
+                handle._done_event.set()
+                if on_finish is not None:
+                    on_finish(handle)
+        
+        threading.Thread(target=read_frames, name="stt-reader", daemon=True).start()
+        threading.Thread(target=decode, name="stt-decoder", daemon=True).start()
+        return handle
@@ -2,44 +2,26 @@
 할 일 관리 모듈 (core 패키지)
 SQLite를 사용하여 할 일을 저장하고 관리합니다.
 """
-import sqlite3
-import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from .config import Config
+from .db import get_database
+from .migrations import migrate
 
 
 class TodoManager:
     """할 일 관리자"""
     
+    # iter_todos()가 한 번에 DB에서 읽어오는 행 수
+    DEFAULT_BATCH_SIZE = 200
+    
     def __init__(self):
         """할 일 관리자 초기화 및 데이터베이스 설정"""
-        # 데이터 디렉토리 생성
-        db_dir = os.path.dirname(Config.DB_PATH)
-        if not os.path.exists(db_dir):
-            os.makedirs(db_dir)
-        
         self.db_path = Config.DB_PATH
-        self._init_database()
-    
-    def _init_database(self):
-        """데이터베이스 초기화"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS todos (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                completed INTEGER DEFAULT 0,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        # 공유 저장소 계층 (스레드별 장기 연결, WAL 모드)
+        self.db = get_database(self.db_path)
+        # 스키마 생성/변경은 마이그레이션에서 처리
+        migrate(self.db)
     
     def add_todo(self, title: str, description: str = "") -> int:
         """
@@ -52,20 +34,14 @@ class TodoManager:
         Returns:
             생성된 할 일의 ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         now = datetime.now().isoformat()
-        cursor.execute("""
-            INSERT INTO todos (title, description, created_at, updated_at)
-            VALUES (?, ?, ?, ?)
-        """, (title, description, now, now))
+        with self.db.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO todos (title, description, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+            """, (title, description, now, now))
         
-        todo_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return todo_id
+        return cursor.lastrowid
     
     def get_todos(self, completed: Optional[bool] = None) -> List[Dict]:
         """
@@ -77,23 +53,100 @@ class TodoManager:
         Returns:
             할 일 목록
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
         if completed is None:
-            cursor.execute("SELECT * FROM todos ORDER BY created_at DESC")
-        else:
-            cursor.execute("""
-                SELECT * FROM todos 
-                WHERE completed = ? 
-                ORDER BY created_at DESC
-            """, (1 if completed else 0,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+            return self.db.fetch_all("SELECT * FROM todos ORDER BY created_at DESC, id DESC")
+        
+        return self.db.fetch_all("""
+            SELECT * FROM todos 
+            WHERE completed = ? 
+            ORDER BY created_at DESC, id DESC
+        """, (1 if completed else 0,))
+    
+    def get_todo(self, todo_id: int) -> Optional[Dict]:
+        """
+        특정 할 일 조회
+        
+        Args:
+            todo_id: 할 일 ID
+            
+        Returns:
+            할 일 딕셔너리 또는 None
+        """
+        return self.db.fetch_one("SELECT * FROM todos WHERE id = ?", (todo_id,))
+    
+    @staticmethod
+    def page_cursor(todo: Dict) -> Tuple[str, int]:
+        """
+        할 일 행의 페이지 커서 (다음 페이지의 after 인자로 사용)
+        
+        Args:
+            todo: 할 일 딕셔너리
+            
+        Returns:
+            (created_at, id) 튜플
+        """
+        return (todo["created_at"], todo["id"])
+    
+    def get_todos_page(self, completed: Optional[bool] = None,
+                       after: Optional[Tuple[str, int]] = None, limit: int = 50) -> List[Dict]:
+        """
+        할 일 목록 한 페이지 조회 (키셋 페이지네이션, 최신순)
+        
+        OFFSET 없이 마지막 행의 (created_at, id) 이후부터 인덱스로 바로 읽으므로
+        전체 기록이 많아도 페이지 조회 비용이 일정합니다.
+        
+        Args:
+            completed: 완료 여부 필터 (None이면 전체)
+            after: 이전 페이지 마지막 행의 page_cursor() (None이면 첫 페이지)
+            limit: 최대 행 수
+            
+        Returns:
+            할 일 목록
+        """
+        query = "SELECT * FROM todos WHERE 1=1"
+        params = []
+        
+        if completed is not None:
+            query += " AND completed = ?"
+            params.append(1 if completed else 0)
+        
+        if after is not None:
+            query += " AND (created_at, id) < (?, ?)"
+            params.extend(after)
+        
+        query += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        
+        return self.db.fetch_all(query, params)
+    
+    def iter_todos(self, completed: Optional[bool] = None,
+                   after: Optional[Tuple[str, int]] = None, limit: Optional[int] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+        """
+        할 일을 최신순으로 하나씩 생성 (전체 목록을 메모리에 올리지 않음)
+        
+        batch_size 단위로 get_todos_page()를 호출하며, 배치 사이에 DB 커서를 열어두지 않습니다.
+        
+        Args:
+            completed: 완료 여부 필터 (None이면 전체)
+            after: 시작 커서 (None이면 처음부터)
+            limit: 최대 개수 (None이면 끝까지)
+            batch_size: 한 번에 읽을 행 수
+            
+        Yields:
+            할 일 딕셔너리
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            page = self.get_todos_page(completed, after, page_size)
+            yield from page
+            
+            if len(page) < page_size:
+                return
+            after = self.page_cursor(page[-1])
+            if remaining is not None:
+                remaining -= len(page)
     
     def update_todo(self, todo_id: int, title: str = None, 
                    description: str = None, completed: bool = None) -> bool:
@@ -109,9 +162,6 @@ class TodoManager:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         updates = []
         params = []
         
@@ -128,24 +178,20 @@ class TodoManager:
             params.append(1 if completed else 0)
         
         if not updates:
-            conn.close()
             return False
         
         updates.append("updated_at = ?")
         params.append(datetime.now().isoformat())
         params.append(todo_id)
         
-        cursor.execute(f"""
-            UPDATE todos 
-            SET {', '.join(updates)}
-            WHERE id = ?
-        """, params)
-        
-        success = cursor.rowcount > 0
-        conn.commit()
-        conn.close()
+        with self.db.transaction() as conn:
+            cursor = conn.execute(f"""
+                UPDATE todos 
+                SET {', '.join(updates)}
+                WHERE id = ?
+            """, params)
         
-        return success
+        return cursor.rowcount > 0
     
     def delete_todo(self, todo_id: int) -> bool:
         """
@@ -157,15 +203,7 @@ class TodoManager:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
-        success = cursor.rowcount > 0
+        with self.db.transaction() as conn:
+            cursor = conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
         
-        conn.commit()
-        conn.close()
-        
-        return success
-
-
+        return cursor.rowcount > 0
@@ -0,0 +1,233 @@
+"""
+합성 음성 캐시 모듈 (core 패키지)
+자주 읽는 문장을 WAV 파일로 한 번만 합성해 두고, 다음부터는 합성 없이 바로 재생합니다.
+캐시 키는 문장/음성/속도/볼륨이며, 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다.
+"""
+import os
+import sys
+import wave
+import shutil
+import hashlib
+import threading
+import subprocess
+from typing import Dict, List, Optional
+from .config import Config
+
+# Windows 기본 WAV 재생 모듈 (다른 OS에는 없음)
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+
+class TTSCache:
+    """크기 제한이 있는 합성 음성 WAV 파일 캐시 (파일 수정 시각 기준 LRU)"""
+    
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        """
+        캐시 초기화
+        
+        Args:
+            cache_dir: WAV 파일을 저장할 디렉토리 (기본값: Config.TTS_CACHE_DIR)
+            max_bytes: 최대 전체 크기 (기본값: Config.TTS_CACHE_MAX_MB)
+        """
+        self.cache_dir = cache_dir or Config.TTS_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.TTS_CACHE_MAX_MB * 1024 * 1024
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(text: str, voice, rate, volume) -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            text: 읽을 문장
+            voice: 음성 ID
+            rate: 속도
+            volume: 볼륨
+        
+        Returns:
+            키 (16진수 해시)
+        """
+        raw = "\0".join(str(part) for part in (text, voice, rate, volume))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.wav")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 WAV 파일 경로 (사용 시각 갱신)
+        
+        Returns:
+            파일 경로 또는 None (없음)
+        """
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+    
+    def temp_path(self, key: str) -> str:
+        """합성 중인 파일을 쓸 임시 경로 (완성 후 put()으로 등록)"""
+        return os.path.join(self.cache_dir, f"{key}.{threading.get_ident()}.tmp.wav")
+    
+    def put(self, key: str, temp_path: str) -> Optional[str]:
+        """
+        합성한 임시 파일을 캐시에 등록하고 크기 한도 초과분 정리
+        
+        Args:
+            key: 캐시 키
+            temp_path: temp_path()에 합성한 WAV 파일
+        
+        Returns:
+            캐시된 파일 경로 또는 None (파일이 비어 있거나 등록 실패)
+        """
+        path = self._path(key)
+        try:
+            if os.path.getsize(temp_path) <= 44:  # WAV 헤더만 있는 빈 파일
+                os.remove(temp_path)
+                return None
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"TTS 캐시 저장 오류: {e}")
+            return None
+        
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size
+            over_limit = self._total_bytes is None or self._total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+        return path
+    
+    def evict(self):
+        """전체 크기가 한도 이하가 될 때까지 가장 오래 사용하지 않은 파일 삭제"""
+        with self._lock:
+            entries = []
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(".wav") and ".tmp." not in entry.name:
+                            st = entry.stat()
+                            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            except OSError:
+                return
+            total = sum(size for _, size, _ in entries)
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._total_bytes = total
+    
+    def clear(self):
+        """캐시 파일 모두 삭제"""
+        with self._lock:
+            try:
+                names = os.listdir(self.cache_dir)
+            except OSError:
+                names = []
+            for name in names:
+                if name.endswith(".wav"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+            self._total_bytes = 0
+    
+    def stats(self) -> Dict:
+        """
+        캐시 상태
+        
+        Returns:
+            {"files", "bytes", "max_bytes", "hits", "misses"}
+        """
+        files = 0
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".wav") and ".tmp." not in entry.name:
+                        files += 1
+                        total += entry.stat().st_size
+        except OSError:
+            pass
+        return {"files": files, "bytes": total, "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+
+class WavPlayer:
+    """운영체제 기본 도구로 WAV 파일 재생 (Windows: winsound, macOS: afplay, Linux: aplay/paplay)"""
+    
+    def __init__(self):
+        self._command: Optional[List[str]] = None
+        if winsound is None:
+            if sys.platform == "darwin":
+                candidates = [["afplay"]]
+            else:
+                candidates = [["aplay", "-q"], ["paplay"], ["pw-play"]]
+            for command in candidates:
+                if shutil.which(command[0]):
+                    self._command = command
+                    break
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        # winsound 동기 재생은 중단할 수 없으므로 비동기 재생 후 재생 시간만큼 대기
+        self._stop_event = threading.Event()
+    
+    @property
+    def available(self) -> bool:
+        """재생 가능 여부"""
+        return winsound is not None or self._command is not None
+    
+    def play(self, path: str) -> bool:
+        """
+        WAV 파일 재생 (끝나거나 stop()이 호출될 때까지 대기)
+        
+        Returns:
+            재생 성공 여부
+        """
+        try:
+            if winsound is not None:
+                with wave.open(path, "rb") as wav:
+                    duration = wav.getnframes() / float(wav.getframerate())
+                self._stop_event.clear()
+                winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+                if self._stop_event.wait(duration + 0.05):
+                    winsound.PlaySound(None, 0)
+                return True
+            if self._command is None:
+                return False
+            with self._lock:
+                self._process = subprocess.Popen(
+                    self._command + [path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+                process = self._process
+            returncode = process.wait()
+            with self._lock:
+                self._process = None
+            return returncode == 0 or returncode < 0  # 음수: stop()으로 중단됨
+        except (OSError, RuntimeError, wave.Error) as e:
+            print(f"음성 재생 오류: {e}")
+            return False
+    
+    def stop(self):
+        """재생 중인 소리 중단 (다른 스레드에서 호출 가능)"""
+        if winsound is not None:
+            self._stop_event.set()
+            return
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
@@ -0,0 +1,374 @@
+"""
+음성 합성 대기열 모듈 (core 패키지)
+TTS 엔진 하나를 전용 작업 스레드에서만 사용하고, 긴 응답은 문장 단위로 나누어 차례로 읽습니다.
+첫 문장이 준비되는 즉시 읽기 시작하며, 새 메시지가 오면 남은 문장을 버리고 바로 멈출 수 있습니다.
+캐시가 설정되면 반복되는 문장은 WAV로 한 번 합성해 두고 다음부터 바로 재생합니다.
+"""
+import os
+import re
+import html
+import queue
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+from .tts_cache import TTSCache, WavPlayer
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표(연속 가능, 닫는 따옴표/괄호 포함) 뒤 공백, 또는 줄바꿈
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？…])[\"'”’)\]]*\s+|\n+")
+# 읽을 필요 없는 HTML 태그, 마크다운 기호, 링크 주소
+_MARKUP = re.compile(r"<[^>]+>|```[^\n]*|[*_`#>|~]+|\[([^\]]*)\]\([^)]*\)|https?://\S+")
+
+
+def clean_text_for_speech(text: str) -> str:
+    """
+    읽기 전에 HTML 태그/마크다운 기호/URL 제거
+    
+    Args:
+        text: 원문
+    
+    Returns:
+        읽을 텍스트
+    """
+    text = _MARKUP.sub(lambda match: match.group(1) or " ", text)
+    return html.unescape(text)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    텍스트를 문장 단위로 나누기
+    
+    Args:
+        text: 원문
+    
+    Returns:
+        빈 문장을 제외한 문장 목록
+    """
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence and sentence.strip()]
+
+
+class SentenceBuffer:
+    """스트리밍 텍스트 조각을 모아 완성된 문장만 꺼내는 버퍼"""
+    
+    def __init__(self, max_chars: int = 200):
+        """
+        Args:
+            max_chars: 문장 끝이 나오지 않아도 이 길이를 넘으면 공백 기준으로 끊어서 내보냄
+        """
+        self.max_chars = max_chars
+        self._pending = ""
+    
+    def feed(self, chunk: str) -> List[str]:
+        """
+        조각 추가
+        
+        Args:
+            chunk: 스트리밍 응답 조각
+        
+        Returns:
+            완성된 문장 목록 (대부분 비어 있음)
+        """
+        self._pending += chunk
+        parts = _SENTENCE_END.split(self._pending)
+        # 마지막 부분은 아직 끝나지 않은 문장
+        self._pending = parts.pop()
+        sentences = [part.strip() for part in parts if part and part.strip()]
+        while len(self._pending) > self.max_chars:
+            cut = self._pending.rfind(" ", 0, self.max_chars)
+            cut = cut if cut > 0 else self.max_chars
+            sentences.append(self._pending[:cut].strip())
+            self._pending = self._pending[cut:].lstrip()
+        return sentences
+    
+    def flush(self) -> List[str]:
+        """남은 텍스트를 마지막 문장으로 꺼냄"""
+        rest, self._pending = self._pending.strip(), ""
+        return [rest] if rest else []
+    
+    def clear(self):
+        self._pending = ""
+
+
+class TTSQueue:
+    """TTS 엔진 하나를 소유한 전용 작업 스레드와 문장 대기열"""
+    
+    # 캐시 여부 자동 판단 시 기억할 최대 문장 수 (넘으면 초기화)
+    MAX_SEEN_SENTENCES = 2000
+    
+    def __init__(self, engine_factory: Callable[[], object], max_queue: int = 64,
+                 cache: TTSCache = None, player: WavPlayer = None):
+        """
+        대기열 초기화 (작업 스레드와 엔진은 처음 읽을 때 생성)
+        
+        Args:
+            engine_factory: TTS 엔진 생성 함수 (작업 스레드에서 호출, pyttsx3 엔진 인터페이스)
+            max_queue: 대기 중인 최대 문장 수 (넘으면 새 문장은 버림)
+            cache: 합성 음성 캐시 (선택적, player와 함께 지정)
+            player: 캐시된 WAV 재생기
+        """
+        self.engine_factory = engine_factory
+        self.cache = cache if player is not None and player.available else None
+        self.player = player
+        # 이번 실행에서 읽은 문장 키별 횟수 (두 번째부터 캐시에 합성)
+        self._seen: Dict[str, int] = {}
+        # 미리 합성할 문장 (대기열이 비어 있을 때 처리)
+        self._prewarm: deque = deque()
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_queue)
+        self._properties: Dict[str, object] = {}
+        self._properties_dirty = False
+        self._lock = threading.Lock()
+        # cancel()마다 증가, 이전 세대의 문장은 읽지 않음
+        self._generation = 0
+        self._buffer = SentenceBuffer()
+        self._engine = None
+        self._thread: Optional[threading.Thread] = None
+        self._speaking = threading.Event()
+        # 대기열에 넣었지만 아직 처리하지 않은 문장 수 (0이면 _idle 설정)
+        self._pending = 0
+        self._idle = threading.Event()
+        self._idle.set()
+        self.available = True
+    
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+                self._thread.start()
+    
+    def set_property(self, name: str, value):
+        """엔진 속성 설정 (다음 문장부터 작업 스레드에서 적용)"""
+        with self._lock:
+            self._properties[name] = value
+            self._properties_dirty = True
+    
+    def speak(self, text: str, cache: Optional[bool] = None) -> int:
+        """
+        텍스트를 문장 단위로 나누어 대기열에 추가 (즉시 반환)
+        
+        Args:
+            text: 읽을 텍스트
+            cache: True면 캐시에 합성 후 재생, False면 캐시 사용 안 함,
+                   None이면 캐시에 있으면 재생하고 없으면 두 번째로 읽을 때부터 캐시에 합성
+        
+        Returns:
+            추가한 문장 수
+        """
+        return self._enqueue(split_sentences(clean_text_for_speech(text)), cache)
+    
+    def prewarm(self, phrases: Iterable[str]) -> int:
+        """
+        자주 쓰는 문구를 미리 캐시에 합성 (읽지 않음, 대기열이 비어 있을 때 처리)
+        
+        Args:
+            phrases: 문구 목록 (문장 단위로 나누어 합성)
+        
+        Returns:
+            합성 예약한 문장 수
+        """
+        if self.cache is None or not self.available:
+            return 0
+        sentences = [
+            sentence for phrase in phrases for sentence in split_sentences(clean_text_for_speech(phrase))
+        ]
+        with self._lock:
+            self._prewarm.extend(sentences)
+        if sentences:
+            self._ensure_started()
+        return len(sentences)
+    
+    def feed(self, chunk: str) -> int:
+        """
+        스트리밍 응답 조각 추가 (문장이 완성될 때마다 대기열에 추가)
+        
+        Returns:
+            추가한 문장 수
+        """
+        with self._lock:
+            sentences = self._buffer.feed(chunk)
+        return self._enqueue([clean_text_for_speech(sentence).strip() for sentence in sentences])
+    
+    def end_feed(self) -> int:
+        """스트리밍 응답 끝: 남은 텍스트를 마지막 문장으로 추가"""
+        with self._lock:
+            sentences = self._buffer.flush()
+        return self._enqueue([clean_text_for_speech(sentence).strip() for sentence in sentences])
+    
+    def _enqueue(self, sentences: List[str], cache: Optional[bool] = None) -> int:
+        if not self.available:
+            return 0
+        sentences = [sentence for sentence in sentences if sentence]
+        if not sentences:
+            return 0
+        self._ensure_started()
+        added = 0
+        with self._lock:
+            generation = self._generation
+            for sentence in sentences:
+                try:
+                    self._queue.put_nowait((generation, sentence, cache))
+                except queue.Full:
+                    print("⚠️ TTS 대기열이 가득 차 일부 문장을 건너뜁니다.")
+                    break
+                self._pending += 1
+                self._idle.clear()
+                added += 1
+        return added
+    
+    def cancel(self):
+        """읽는 중인 문장을 멈추고 대기 중인 문장과 스트리밍 버퍼 모두 버림 (끼어들기)"""
+        with self._lock:
+            self._generation += 1
+            self._buffer.clear()
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self._done_one()
+        if self._speaking.is_set():
+            if self.player is not None:
+                self.player.stop()
+            if self._engine is not None:
+                try:
+                    self._engine.stop()
+                except Exception as e:
+                    print(f"TTS 중지 오류: {e}")
+    
+    @property
+    def is_speaking(self) -> bool:
+        """읽는 중이거나 읽을 문장이 남아 있는지 여부"""
+        return not self._idle.is_set()
+    
+    def wait(self, timeout: float = None) -> bool:
+        """
+        대기열의 문장을 모두 읽을 때까지 대기
+        
+        Returns:
+            시간 안에 끝났는지 여부
+        """
+        return self._idle.wait(timeout)
+    
+    def shutdown(self):
+        """읽기 중단 및 작업 스레드 종료"""
+        self.cancel()
+        if self._thread is not None:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                pass
+            self._thread.join(1.0)
+    
+    def _done_one(self):
+        """문장 하나 처리 완료 (self._lock 보유 상태에서 호출)"""
+        self._pending -= 1
+        if self._pending <= 0:
+            self._pending = 0
+            self._idle.set()
+    
+    def _run(self):
+        try:
+            self._engine = self.engine_factory()
+        except Exception as e:
+            print(f"TTS 엔진 초기화 실패: {e}")
+            self._engine = None
+        if self._engine is None:
+            self.available = False
+            with self._lock:
+                while True:
+                    try:
+                        self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._pending = 0
+                self._idle.set()
+            return
+        
+        while True:
+            with self._lock:
+                prewarm_pending = bool(self._prewarm)
+            try:
+                item = self._queue.get(timeout=0.1 if prewarm_pending else None)
+            except queue.Empty:
+                self._prewarm_one()
+                continue
+            if item is None:
+                break
+            generation, sentence, cache = item
+            with self._lock:
+                # cancel()과 겹치지 않도록 세대 확인과 읽기 시작 표시를 함께 처리
+                current = generation == self._generation
+                if current:
+                    properties = dict(self._properties) if self._properties_dirty else None
+                    self._properties_dirty = False
+                    self._speaking.set()
+            if current:
+                try:
+                    for name, value in (properties or {}).items():
+                        self._engine.setProperty(name, value)
+                    self._say(sentence, cache)
+                except Exception as e:
+                    print(f"TTS 오류: {e}")
+                finally:
+                    self._speaking.clear()
+            with self._lock:
+                self._done_one()
+    
+    def _say(self, sentence: str, cache: Optional[bool]):
+        """문장 하나 읽기 (캐시에 있거나 캐시할 문장이면 WAV 재생, 아니면 엔진으로 바로 읽기)"""
+        if self.cache is not None and cache is not False:
+            key = self._cache_key(sentence)
+            path = self.cache.get(key)
+            if path is None:
+                seen = self._seen.get(key, 0)
+                if cache or seen:
+                    path = self._render(sentence, key)
+                else:
+                    if len(self._seen) >= self.MAX_SEEN_SENTENCES:
+                        self._seen.clear()
+                    self._seen[key] = seen + 1
+            if path is not None and self.player.play(path):
+                return
+        self._engine.say(sentence)
+        self._engine.runAndWait()
+    
+    def _cache_key(self, sentence: str) -> str:
+        """현재 음성/속도/볼륨 기준 캐시 키"""
+        return self.cache.make_key(
+            sentence,
+            self._engine.getProperty("voice"),
+            self._engine.getProperty("rate"),
+            self._engine.getProperty("volume"),
+        )
+    
+    def _render(self, sentence: str, key: str) -> Optional[str]:
+        """문장을 WAV로 합성하여 캐시에 저장 (엔진이 파일 저장을 지원하지 않으면 캐시 사용 중지)"""
+        temp_path = self.cache.temp_path(key)
+        try:
+            self._engine.save_to_file(sentence, temp_path)
+            self._engine.runAndWait()
+            return self.cache.put(key, temp_path)
+        except Exception as e:
+            print(f"TTS 캐시 합성 실패, 캐시를 사용하지 않습니다: {e}")
+            self.cache = None
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return None
+    
+    def _prewarm_one(self):
+        """미리 합성할 문장 하나 처리 (작업 스레드)"""
+        with self._lock:
+            sentence = self._prewarm.popleft() if self._prewarm else None
+            properties = dict(self._properties) if self._properties_dirty else None
+            self._properties_dirty = False
+        if sentence is None or self.cache is None:
+            return
+        try:
+            for name, value in (properties or {}).items():
+                self._engine.setProperty(name, value)
+            key = self._cache_key(sentence)
+            if self.cache.get(key) is None:
+                self._render(sentence, key)
+        except Exception as e:
+            print(f"TTS 미리 합성 오류: {e}")
@@ -1,17 +1,22 @@
 """
 음성 인식(STT) 및 음성 합성(TTS) 모듈 (core 패키지)
 Whisper를 사용한 STT와 pyttsx3를 사용한 TTS를 제공합니다.
+Whisper는 import와 모델 로드가 느리므로 처음 필요할 때(또는 백그라운드 스레드에서) 로드하며,
+로드한 모델은 프로세스 전체에서 모델 크기별로 한 번만 로드하여 공유합니다.
 """
-from typing import Optional
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, Optional
+import importlib.util
 import threading
+from .config import Config
+from .stt_batch import BatchTranscriber
+from .stt_stream import STTStreamHandle, StreamingTranscriber, iter_wav_frames
+from .tts_cache import TTSCache, WavPlayer
+from .tts_queue import TTSQueue
 
-# 선택적 의존성 import
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
-    whisper = None
+# 선택적 의존성 확인 (whisper는 torch까지 불러오므로 설치 여부만 확인하고 import는 모델 로드 시)
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+whisper = None
 
 try:
     import pyttsx3
@@ -20,87 +25,338 @@ except ImportError:
     TTS_AVAILABLE = False
     pyttsx3 = None
 
+# 프로세스 전체 Whisper 모델 캐시 {모델 크기: 로드 결과(모델)를 담을 Future}
+_whisper_models: Dict[str, Future] = {}
+_whisper_lock = threading.Lock()
+# 모델별 인식 잠금 (공유 모델의 디코딩 상태는 스레드 안전하지 않으므로 한 번에 하나씩 인식)
+_whisper_inference_locks: Dict[str, threading.Lock] = {}
+
+# Whisper 입력 샘플레이트
+WHISPER_SAMPLE_RATE = 16000
+
+
+def load_whisper_model(model_size: str = None) -> Future:
+    """
+    Whisper 모델 로드 시작 (이미 로드했거나 로드 중이면 같은 Future 반환)
+    
+    모델은 데몬 스레드에서 로드되며, 로드에 실패한 경우 다음 호출 때 다시 시도합니다.
+    
+    Args:
+        model_size: 모델 크기 (tiny/base/small/medium/large 등, 기본값: Config.WHISPER_MODEL_SIZE)
+    
+    Returns:
+        로드된 모델(또는 예외)을 담을 Future
+    """
+    model_size = model_size or Config.WHISPER_MODEL_SIZE
+    with _whisper_lock:
+        future = _whisper_models.get(model_size)
+        if future is not None and not (future.done() and future.exception() is not None):
+            return future
+        future = Future()
+        future.set_running_or_notify_cancel()
+        _whisper_models[model_size] = future
+        _whisper_inference_locks.setdefault(model_size, threading.Lock())
+    
+    thread = threading.Thread(
+        target=_load_whisper_model, args=(model_size, future),
+        name=f"whisper-load-{model_size}", daemon=True
+    )
+    thread.start()
+    return future
+
+
+def _load_whisper_model(model_size: str, future: Future):
+    """Whisper import 및 모델 로드 (백그라운드 스레드)"""
+    global whisper
+    try:
+        if whisper is None:
+            import whisper as whisper_module
+            whisper = whisper_module
+        future.set_result(whisper.load_model(model_size))
+    except Exception as e:
+        print(f"Whisper 모델 로드 실패: {e}")
+        future.set_exception(e)
+
 
 class VoiceHandler:
     """음성 인식 및 합성 핸들러"""
     
-    def __init__(self):
-        """VoiceHandler 초기화"""
-        # Whisper 모델 로드 (base 모델 사용, 필요시 변경 가능)
-        self.whisper_model = None
-        if WHISPER_AVAILABLE:
-            try:
-                self.whisper_model = whisper.load_model("base")
-            except Exception as e:
-                print(f"Whisper 모델 로드 실패: {e}")
-        else:
+    def __init__(self, preload: bool = False):
+        """
+        VoiceHandler 초기화 (Whisper 모델은 처음 음성 인식할 때 로드)
+        
+        Args:
+            preload: True이면 Whisper 모델을 백그라운드에서 바로 로드 시작
+        """
+        self.whisper_model_size = Config.WHISPER_MODEL_SIZE
+        self._whisper_future: Optional[Future] = None
+        if not WHISPER_AVAILABLE:
             print("⚠️ Whisper가 설치되지 않았습니다. STT 기능을 사용할 수 없습니다.")
+        elif preload:
+            self.load_whisper_model()
         
-        # TTS 엔진 초기화
-        self.tts_engine = None
+        # TTS: 엔진은 전용 작업 스레드에서 처음 읽을 때 생성 (엔진을 여러 스레드에서 쓰지 않음)
+        self.tts: Optional[TTSQueue] = None
         if TTS_AVAILABLE:
-            try:
-                self.tts_engine = pyttsx3.init()
-                # 한국어 음성 설정 (시스템에 한국어 음성이 설치되어 있어야 함)
-                voices = self.tts_engine.getProperty('voices')
-                for voice in voices:
-                    if 'korean' in voice.name.lower() or 'ko' in voice.id.lower():
-                        self.tts_engine.setProperty('voice', voice.id)
-                        break
-                # 속도 설정 (기본값: 200)
-                self.tts_engine.setProperty('rate', 150)
-            except Exception as e:
-                print(f"TTS 엔진 초기화 실패: {e}")
+            cache, player = None, None
+            if Config.TTS_CACHE_ENABLED:
+                player = WavPlayer()
+                if player.available:
+                    cache = TTSCache()
+            self.tts = TTSQueue(self._create_tts_engine, cache=cache, player=player)
         else:
             print("⚠️ pyttsx3가 설치되지 않았습니다. TTS 기능을 사용할 수 없습니다.")
     
+    @staticmethod
+    def _create_tts_engine():
+        """TTS 엔진 생성 (TTS 작업 스레드에서 호출)"""
+        engine = pyttsx3.init()
+        # 한국어 음성 설정 (시스템에 한국어 음성이 설치되어 있어야 함)
+        voices = engine.getProperty('voices')
+        for voice in voices:
+            if 'korean' in voice.name.lower() or 'ko' in voice.id.lower():
+                engine.setProperty('voice', voice.id)
+                break
+        # 속도 설정 (기본값: 200)
+        engine.setProperty('rate', 150)
+        return engine
+    
+    def load_whisper_model(self) -> Optional[Future]:
+        """
+        Whisper 모델 로드 시작 (백그라운드, 프로세스 전체 캐시 공유)
+        
+        Returns:
+            로드된 모델을 담을 Future 또는 None (Whisper 미설치)
+        """
+        if not WHISPER_AVAILABLE:
+            return None
+        self._whisper_future = load_whisper_model(self.whisper_model_size)
+        return self._whisper_future
+    
+    @property
+    def whisper_ready(self) -> bool:
+        """Whisper 모델 로드 완료 여부 (기다리지 않음)"""
+        future = self._whisper_future
+        return future is not None and future.done() and future.exception() is None
+    
+    @property
+    def whisper_model(self):
+        """로드된 Whisper 모델 (아직 로드되지 않았거나 실패했으면 None, 기다리지 않음)"""
+        return self._whisper_future.result() if self.whisper_ready else None
+    
+    def get_whisper_model(self, timeout: float = None):
+        """
+        Whisper 모델 반환 (로드되지 않았으면 로드하고 완료까지 대기)
+        
+        Args:
+            timeout: 최대 대기 시간(초, None이면 무제한)
+        
+        Returns:
+            Whisper 모델 또는 None (미설치, 로드 실패 또는 시간 초과)
+        """
+        future = self.load_whisper_model()
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except Exception:
+            return None
+    
     def speech_to_text(self, audio_file_path: str) -> Optional[str]:
         """
-        음성 파일을 텍스트로 변환 (STT)
+        음성 파일을 텍스트로 변환 (STT, 모델이 로드되지 않았으면 로드될 때까지 대기)
         
         Args:
             audio_file_path: 음성 파일 경로
-            
+        
         Returns:
             인식된 텍스트 또는 None
         """
-        if not self.whisper_model:
+        model = self.get_whisper_model()
+        if not model:
             return None
         
         try:
-            result = self.whisper_model.transcribe(audio_file_path, language="ko")
+            result = self._transcribe(model, audio_file_path)
             return result["text"].strip()
         except Exception as e:
             print(f"STT 오류: {e}")
             return None
     
-    def text_to_speech(self, text: str, async_mode: bool = True):
+    def _transcribe(self, model, audio) -> Dict:
         """
-        텍스트를 음성으로 변환 (TTS)
+        모델 인식 실행 (같은 모델을 쓰는 스트리밍/일괄 인식이 동시에 실행되지 않도록 모델별 잠금)
         
         Args:
-            text: 변환할 텍스트
-            async_mode: 비동기 모드 (기본값: True)
+            model: get_whisper_model()로 얻은 모델
+            audio: 음성 파일 경로 또는 16kHz float32 오디오
+        
+        Returns:
+            Whisper 인식 결과 딕셔너리
         """
-        if not self.tts_engine:
-            return
+        with _whisper_inference_locks[self.whisper_model_size]:
+            return model.transcribe(audio, language="ko")
+    
+    def transcribe_pcm(self, pcm: bytes, sample_rate: int) -> Optional[str]:
+        """
+        PCM 오디오를 텍스트로 변환 (파일을 거치지 않음)
+        
+        Args:
+            pcm: 16비트 모노 PCM
+            sample_rate: 샘플레이트 (16kHz가 아니면 선형 보간으로 변환)
+        
+        Returns:
+            인식된 텍스트 또는 None
+        """
+        model = self.get_whisper_model()
+        if not model or not pcm:
+            return None
         
         try:
-            if async_mode:
-                # 비동기로 실행하여 UI 블로킹 방지
-                thread = threading.Thread(target=self._speak, args=(text,))
-                thread.daemon = True
-                thread.start()
-            else:
-                self._speak(text)
+            import numpy as np  # whisper 의존성
+            audio = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype=np.int16).astype(np.float32) / 32768.0
+            if sample_rate != WHISPER_SAMPLE_RATE and len(audio):
+                duration = len(audio) / sample_rate
+                target = np.arange(0, duration, 1.0 / WHISPER_SAMPLE_RATE)
+                audio = np.interp(target, np.arange(len(audio)) / sample_rate, audio).astype(np.float32)
+            result = self._transcribe(model, audio)
+            return result["text"].strip()
         except Exception as e:
-            print(f"TTS 오류: {e}")
+            print(f"STT 오류: {e}")
+            return None
     
-    def _speak(self, text: str):
-        """내부 TTS 실행 메서드"""
-        if self.tts_engine:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+    def stream_speech_to_text(self, frames: Iterable[bytes], sample_rate: int,
+                              on_result: Callable[[Dict], None] = None,
+                              on_finish: Callable[[STTStreamHandle], None] = None,
+                              **segmenter_options) -> Optional[STTStreamHandle]:
+        """
+        PCM 프레임 스트림을 음성 구간별로 나누어 인식 (말하는 중에는 부분 결과, 구간이 끝나면 최종 결과)
+        
+        Args:
+            frames: 16비트 모노 PCM 프레임 이터러블 (마이크 제너레이터, iter_wav_frames 등)
+            sample_rate: 샘플레이트 (Hz)
+            on_result: 결과 콜백 ({"type": "partial"|"final", "segment", "text", "start", "end"}, 작업 스레드에서 호출)
+            on_finish: 종료 콜백 (작업 스레드에서 호출)
+            **segmenter_options: 구간 분할 옵션 (stt_stream.SpeechSegmenter 참고)
+        
+        Returns:
+            작업 핸들 또는 None (Whisper 미설치)
+        """
+        if not WHISPER_AVAILABLE:
+            return None
+        # 모델 로드는 인식 스레드에서 첫 구간을 인식할 때 기다림
+        self.load_whisper_model()
+        transcriber = StreamingTranscriber(self.transcribe_pcm, **segmenter_options)
+        return transcriber.start(frames, sample_rate, on_result, on_finish)
+    
+    def stream_file_to_text(self, audio_file_path: str,
+                            on_result: Callable[[Dict], None] = None,
+                            on_finish: Callable[[STTStreamHandle], None] = None,
+                            **segmenter_options) -> Optional[STTStreamHandle]:
+        """
+        WAV 파일을 스트림처럼 읽으며 인식 (stream_speech_to_text 참고)
+        
+        Args:
+            audio_file_path: 16비트 PCM WAV 파일 경로
+        
+        Returns:
+            작업 핸들 또는 None (Whisper 미설치 또는 파일 읽기 실패)
+        """
+        try:
+            sample_rate, frames = iter_wav_frames(audio_file_path)
+        except Exception as e:
+            print(f"오디오 파일 읽기 오류: {e}")
+            return None
+        return self.stream_speech_to_text(frames, sample_rate, on_result, on_finish, **segmenter_options)
+    
+    def transcribe_batch(self, paths: Iterable[str], memo_manager=None,
+                         progress: Callable[[Dict], None] = None,
+                         cancel_event: threading.Event = None,
+                         decode_workers: int = None) -> Optional[Dict]:
+        """
+        여러 음성 파일(또는 폴더)을 일괄 인식 (완료까지 대기하므로 작업 스레드에서 호출)
+        
+        모델은 한 번만 로드하여 모든 파일에 사용하고, 다음 파일들의 오디오 디코딩(ffmpeg)은
+        인식과 동시에 스레드 풀에서 진행합니다. 파일별 상태는 DB에 기록되어 중단 후 다시 실행하면
+        끝나지 않은 파일부터 이어서 처리합니다.
+        
+        Args:
+            paths: 파일 또는 폴더 경로 목록
+            memo_manager: 지정하면 인식 결과를 메모로 추가 (MemoManager)
+            progress: 파일별 진행 콜백 (stt_batch.BatchTranscriber.run 참고)
+            cancel_event: 설정되면 진행 중인 파일까지만 처리하고 중단
+            decode_workers: 디코딩 스레드 수
+        
+        Returns:
+            처리 결과 요약 (BatchTranscriber.run 참고) 또는 None (Whisper 미설치/모델 로드 실패)
+        """
+        model = self.get_whisper_model()
+        if not model:
+            return None
+        
+        def transcribe(audio):
+            return self._transcribe(model, audio)["text"]
+        
+        batch = BatchTranscriber(
+            whisper.load_audio, transcribe, f"whisper-{self.whisper_model_size}",
+            decode_workers=decode_workers
+        )
+        return batch.run(paths, memo_manager=memo_manager, progress=progress, cancel_event=cancel_event)
+    
+    def text_to_speech(self, text: str, async_mode: bool = True, cache: Optional[bool] = None):
+        """
+        텍스트를 음성으로 변환 (TTS, 문장 단위로 TTS 대기열에 추가하여 차례로 읽음)
+        
+        Args:
+            text: 변환할 텍스트
+            async_mode: 비동기 모드 (기본값: True, False면 다 읽을 때까지 대기)
+            cache: 합성 음성 캐시 사용 방식 (True: 항상 캐시, False: 사용 안 함, None: 반복되는 문장만)
+        """
+        if not self.tts:
+            return
+        
+        self.tts.speak(text, cache)
+        if not async_mode:
+            self.tts.wait()
+    
+    def prewarm_speech(self, phrases: Iterable[str]) -> int:
+        """
+        자주 읽는 문구(인사말, 고정 응답 등)를 미리 캐시에 합성 (백그라운드)
+        
+        Args:
+            phrases: 문구 목록
+        
+        Returns:
+            합성 예약한 문장 수 (캐시를 사용할 수 없으면 0)
+        """
+        if not self.tts:
+            return 0
+        return self.tts.prewarm(phrases)
+    
+    def feed_speech(self, chunk: str):
+        """
+        스트리밍 응답 조각을 TTS 대기열에 전달 (문장이 완성될 때마다 읽기 시작)
+        
+        Args:
+            chunk: 응답 조각
+        """
+        if self.tts:
+            self.tts.feed(chunk)
+    
+    def finish_speech(self):
+        """스트리밍 응답 끝 (마지막 문장까지 읽음)"""
+        if self.tts:
+            self.tts.end_feed()
+    
+    def cancel_speech(self):
+        """읽는 중인 음성과 대기 중인 문장 모두 중단 (새 메시지를 보낼 때 등)"""
+        if self.tts:
+            self.tts.cancel()
+    
+    @property
+    def is_speaking(self) -> bool:
+        """읽는 중이거나 읽을 문장이 남아 있는지 여부"""
+        return bool(self.tts and self.tts.is_speaking)
     
     def set_tts_rate(self, rate: int):
         """
@@ -109,8 +365,8 @@ class VoiceHandler:
         Args:
             rate: 속도 (50-300, 기본값: 150)
         """
-        if self.tts_engine:
-            self.tts_engine.setProperty('rate', max(50, min(300, rate)))
+        if self.tts:
+            self.tts.set_property('rate', max(50, min(300, rate)))
     
     def set_tts_volume(self, volume: float):
         """
@@ -119,7 +375,10 @@ class VoiceHandler:
         Args:
             volume: 볼륨 (0.0-1.0)
         """
-        if self.tts_engine:
-            self.tts_engine.setProperty('volume', max(0.0, min(1.0, volume)))
-
-
+        if self.tts:
+            self.tts.set_property('volume', max(0.0, min(1.0, volume)))
+    
+    def shutdown(self):
+        """진행 중인 음성 합성 중단 및 TTS 작업 스레드 종료"""
+        if self.tts:
+            self.tts.shutdown()
@@ -0,0 +1,263 @@
+"""
+ZiTTA 목록 뷰 모델
+QAbstractListModel 기반으로 필요한 만큼만 행을 가져오는 목록 모델을 제공합니다.
+"""
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class LazyListModel(QAbstractListModel):
+    """
+    행을 지연 로딩하는 목록 모델
+    
+    set_source()로 받은 이터러블에서 뷰가 스크롤될 때마다 batch_size개씩만 가져오며
+    (canFetchMore/fetchMore), 추가/삭제/수정은 전체 재구성 없이 해당 행만 반영합니다.
+    각 행은 딕셔너리이며 UserRole로 원본 딕셔너리를 돌려줍니다.
+    """
+    
+    def __init__(self, formatter: Callable[[Dict], str], key: Callable[[Dict], Any],
+                 batch_size: int = 100, parent=None):
+        """
+        모델 초기화
+        
+        Args:
+            formatter: 행 딕셔너리를 표시 문자열로 변환하는 함수
+            key: 행을 식별하는 키를 반환하는 함수 (예: lambda row: row["id"])
+            batch_size: fetchMore() 한 번에 가져올 행 수
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self.formatter = formatter
+        self.key = key
+        self.batch_size = batch_size
+        self._rows: List[Dict] = []
+        self._source = None
+        # 키 -> 행 번호 (중간 삽입/삭제/정렬 후에는 None, 다음 조회 때 한 번에 재구성)
+        self._positions: Optional[Dict[Any, int]] = {}
+    
+    def set_source(self, rows: Iterable[Dict]):
+        """
+        새 행 공급원으로 교체 (첫 배치만 즉시 가져옴)
+        
+        Args:
+            rows: 행 딕셔너리 이터러블 (제너레이터 권장)
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._positions = {}
+        self._source = iter(rows)
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+    
+    def clear(self):
+        """모든 행 제거"""
+        self.beginResetModel()
+        self._rows = []
+        self._positions = {}
+        self._source = None
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.formatter(row)
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._source is not None
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid() or self._source is None:
+            return
+        
+        batch = list(islice(self._source, self.batch_size))
+        if len(batch) < self.batch_size:
+            # 공급원 소진
+            self._source = None
+        self.append_items(batch)
+    
+    def row_at(self, row: int) -> Optional[Dict]:
+        """
+        행 번호로 행 딕셔너리 조회
+        
+        Args:
+            row: 행 번호
+            
+        Returns:
+            행 딕셔너리 또는 None
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def find_row(self, key: Any) -> int:
+        """
+        키로 행 번호 찾기 (키 -> 행 번호 사전 사용)
+        
+        Args:
+            key: 행 키
+            
+        Returns:
+            행 번호 (없으면 -1)
+        """
+        if self._positions is None:
+            self._positions = {self.key(item): row for row, item in enumerate(self._rows)}
+        return self._positions.get(key, -1)
+    
+    def append_items(self, items: List[Dict]):
+        """
+        행 여러 개를 끝에 추가
+        
+        Args:
+            items: 행 딕셔너리 리스트
+        """
+        if not items:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(items) - 1)
+        self._rows.extend(items)
+        if self._positions is not None:
+            for offset, item in enumerate(items):
+                self._positions[self.key(item)] = start + offset
+        self.endInsertRows()
+    
+    def insert_item(self, item: Dict, position: int = 0):
+        """
+        행 하나 삽입
+        
+        Args:
+            item: 행 딕셔너리
+            position: 삽입 위치 (기본값: 맨 앞)
+        """
+        position = max(0, min(position, len(self._rows)))
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, item)
+        if self._positions is not None and position == len(self._rows) - 1:
+            self._positions[self.key(item)] = position
+        else:
+            self._positions = None
+        self.endInsertRows()
+    
+    def insert_sorted(self, item: Dict, sort_key: Callable[[Dict], Any]):
+        """
+        정렬된 목록에서 sort_key 순서에 맞는 위치에 행 삽입
+        
+        Args:
+            item: 행 딕셔너리
+            sort_key: 목록 정렬에 사용한 키 함수
+        """
+        item_key = sort_key(item)
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            if sort_key(self._rows[middle]) < item_key:
+                low = middle + 1
+            else:
+                high = middle
+        self.insert_item(item, low)
+    
+    def remove_item(self, key: Any) -> bool:
+        """
+        키에 해당하는 행 제거
+        
+        Args:
+            key: 행 키
+            
+        Returns:
+            제거 여부
+        """
+        row = self.find_row(key)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        if row == len(self._rows):
+            del self._positions[key]
+        else:
+            self._positions = None
+        self.endRemoveRows()
+        return True
+    
+    def remove_items(self, keys: Iterable[Any]) -> int:
+        """
+        키에 해당하는 행 여러 개를 한 번에 제거 (연속된 행은 묶어서 제거)
+        
+        Args:
+            keys: 행 키 목록
+            
+        Returns:
+            제거한 행 수
+        """
+        rows = sorted({row for row in (self.find_row(key) for key in keys) if row >= 0})
+        if not rows:
+            return 0
+        # 뒤쪽 구간부터 제거해야 앞쪽 행 번호가 바뀌지 않음
+        ranges = []
+        start = end = rows[0]
+        for row in rows[1:]:
+            if row == end + 1:
+                end = row
+            else:
+                ranges.append((start, end))
+                start = end = row
+        ranges.append((start, end))
+        for start, end in reversed(ranges):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            self._positions = None
+            self.endRemoveRows()
+        return len(rows)
+    
+    def update_item(self, item: Dict) -> bool:
+        """
+        같은 키를 가진 행의 내용 교체
+        
+        Args:
+            item: 새 행 딕셔너리
+            
+        Returns:
+            교체 여부
+        """
+        row = self.find_row(self.key(item))
+        if row < 0:
+            return False
+        self._rows[row] = item
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def sort_items(self, sort_key: Callable[[Dict], Any]):
+        """
+        현재 가져온 행 정렬 (선택/현재 항목 등 뷰의 영구 인덱스는 같은 행을 계속 가리킴)
+        
+        Args:
+            sort_key: 정렬 키 함수
+        """
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_keys = [
+            self.key(self._rows[index.row()]) if 0 <= index.row() < len(self._rows) else None
+            for index in old_indexes
+        ]
+        self._rows.sort(key=sort_key)
+        self._positions = None
+        new_indexes = []
+        for index, key in zip(old_indexes, old_keys):
+            row = self.find_row(key) if key is not None else -1
+            new_indexes.append(self.index(row, index.column()) if row >= 0 else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
@@ -5,44 +5,246 @@ PyQt6를 사용하여 구현된 메인 인터페이스
 import sys
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QLineEdit, QPushButton, QListWidget, QListWidgetItem,
-    QLabel, QSplitter, QMessageBox, QTabWidget, QFileDialog
+    QTextEdit, QLineEdit, QPushButton, QListView,
+    QLabel, QSplitter, QMessageBox, QTabWidget, QFileDialog,
+    QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QTextCursor
+import html
 import json
+import threading
 
 # 상위 디렉토리에서 모듈 import
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.config import Config
 from core.llm_client import LLMClient
 from core.todo_manager import TodoManager
 from core.memo_manager import MemoManager
 from core.file_explorer import FileExplorer
 from core.voice_handler import VoiceHandler
+from core.db import close_all_databases, close_thread_connections
 from core.plugin_manager import PluginManager
+from gui.list_models import LazyListModel
 
 class LLMWorker(QThread):
     """LLM 응답을 비동기로 처리하는 워커 스레드"""
     response_ready = pyqtSignal(str)
+    chunk_ready = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, llm_client, message, history):
+    def __init__(self, llm_client, message, history, stream=False):
         super().__init__()
         self.llm_client = llm_client
         self.message = message
         self.history = history
+        self.stream = stream
     
     def run(self):
         try:
-            response = self.llm_client.chat(self.message, self.history)
+            if self.stream:
+                # 조각이 도착할 때마다 전달하고, 마지막에 전체 응답을 한 번 더 전달
+                chunks = []
+                for chunk in self.llm_client.chat_stream(self.message, self.history):
+                    chunks.append(chunk)
+                    self.chunk_ready.emit(chunk)
+                response = "".join(chunks).strip()
+            else:
+                response = self.llm_client.chat(self.message, self.history)
             self.response_ready.emit(response)
         except Exception as e:
             self.error_occurred.emit(str(e))
+        finally:
+            # 워커 스레드가 쓴 DB 연결 정리
+            close_thread_connections()
+
+class DirectoryLoader(QThread):
+    """디렉토리 목록을 백그라운드에서 읽어 배치 단위로 전달하는 워커 스레드"""
+    batch_ready = pyqtSignal(list)
+    finished_loading = pyqtSignal()
+    
+    # 한 번에 전달할 항목 수
+    BATCH_SIZE = 200
+    
+    def __init__(self, file_explorer, path, parent=None):
+        super().__init__(parent)
+        self.file_explorer = file_explorer
+        self.path = path
+    
+    def run(self):
+        try:
+            batch = []
+            for item in self.file_explorer.iter_directory(self.path):
+                if self.isInterruptionRequested():
+                    return
+                batch.append(item)
+                if len(batch) >= self.BATCH_SIZE:
+                    self.batch_ready.emit(batch)
+                    batch = []
+            if batch:
+                self.batch_ready.emit(batch)
+            self.finished_loading.emit()
+        finally:
+            close_thread_connections()
+
+class DiskAnalysisWorker(QThread):
+    """디스크 사용량 분석/중복 파일 탐지 워커 스레드"""
+    progress_changed = pyqtSignal(dict)
+    result_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, file_explorer, task, root, parent=None):
+        """
+        Args:
+            task: "usage" (용량 분석) 또는 "duplicates" (중복 파일 찾기)
+            root: 분석할 디렉토리
+        """
+        super().__init__(parent)
+        self.file_explorer = file_explorer
+        self.task = task
+        self.root = root
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """분석 중단 요청"""
+        self.cancel_event.set()
+    
+    def run(self):
+        try:
+            if self.task == "duplicates":
+                result = self.file_explorer.find_duplicates(
+                    self.root, progress=self.progress_changed.emit, cancel_event=self.cancel_event
+                )
+            else:
+                result = self.file_explorer.disk_usage(
+                    self.root, progress=self.progress_changed.emit, cancel_event=self.cancel_event
+                )
+            self.result_ready.emit(result)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            close_thread_connections()
+
+
+class FileSearchWorker(QThread):
+    """파일명 검색 워커 스레드 (처음 검색하는 폴더는 색인부터 생성)"""
+    indexing_started = pyqtSignal()
+    result_ready = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+    
+    # 목록에 표시할 최대 결과 수
+    MAX_RESULTS = 1000
+    
+    def __init__(self, file_explorer, root, pattern, parent=None):
+        super().__init__(parent)
+        self.file_explorer = file_explorer
+        self.root = root
+        self.pattern = pattern
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """검색 중단 요청 (색인 생성 중이면 읽은 디렉토리까지만 저장)"""
+        self.cancel_event.set()
+    
+    def run(self):
+        try:
+            indexed = False
+            if not self.file_explorer.file_index.covers(self.root):
+                self.indexing_started.emit()
+                stats = self.file_explorer.update_index(self.root, cancel_event=self.cancel_event)
+                if stats["cancelled"]:
+                    return
+                indexed = True
+            # 방금 색인했으면 검색 범위를 다시 확인하지 않음
+            paths = self.file_explorer.search_files(self.root, self.pattern, refresh=not indexed)
+            items = []
+            for path in paths[:self.MAX_RESULTS]:
+                if self.cancel_event.is_set():
+                    return
+                item = self.file_explorer.get_item(path)
+                if item is not None:
+                    # 하위 폴더의 결과도 구분되도록 검색 폴더 기준 상대 경로로 표시
+                    item["name"] = os.path.relpath(path, self.root)
+                    items.append(item)
+            self.result_ready.emit(items)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            close_thread_connections()
+
+
+class TranscriptionWorker(QThread):
+    """음성 파일 일괄 인식 및 메모 가져오기 워커 스레드"""
+    progress_changed = pyqtSignal(dict)
+    result_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, voice_handler, memo_manager, root, parent=None):
+        """
+        Args:
+            root: 음성 파일이 있는 폴더
+        """
+        super().__init__(parent)
+        self.voice_handler = voice_handler
+        self.memo_manager = memo_manager
+        self.root = root
+        self.cancel_event = threading.Event()
+    
+    def cancel(self):
+        """인식 중단 요청 (남은 파일은 다음 실행 때 이어서 처리)"""
+        self.cancel_event.set()
+    
+    def run(self):
+        try:
+            result = self.voice_handler.transcribe_batch(
+                [self.root], memo_manager=self.memo_manager,
+                progress=self.progress_changed.emit, cancel_event=self.cancel_event
+            )
+            if result is None:
+                self.error_occurred.emit("Whisper 모델을 사용할 수 없습니다.")
+                return
+            self.result_ready.emit(result)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            close_thread_connections()
+
 
 class MainWindow(QMainWindow):
     """ZiTTA 메인 윈도우"""
+    # 파일 감시 스레드에서 GUI 스레드로 이벤트 전달
+    file_events_ready = pyqtSignal(list)
+    # 명령 실행 스레드에서 GUI 스레드로 출력 전달 (명령 번호, 스트림 이름, 줄)
+    command_output_ready = pyqtSignal(int, str, str)
+    command_finished = pyqtSignal(int, object)
+    # 플러그인 처리 스레드에서 GUI 스레드로 결과 전달
+    plugin_result_ready = pyqtSignal(object)
+    # 플러그인 디렉토리 감시 스레드에서 GUI 스레드로 다시 로드된 플러그인 목록 전달
+    plugins_reloaded = pyqtSignal(list)
+    # 스트리밍 음성 인식 스레드에서 GUI 스레드로 부분/최종 결과 및 종료 전달
+    stt_result_ready = pyqtSignal(object)
+    stt_finished = pyqtSignal(object)
+    # 창을 닫을 때 중단을 요청한 백그라운드 워커를 기다리는 최대 시간 (ms)
+    WORKER_STOP_TIMEOUT_MS = 3000
+    # 대화창에 표시할 명령 출력 최대 줄 수 (이후는 생략, 전체는 핸들의 링 버퍼에 최근 줄만 보관)
+    CHAT_COMMAND_MAX_LINES = 200
+    # 시작 인사말 (음성 캐시에 미리 합성)
+    GREETING = "안녕하세요! 저는 ZiTTA입니다. 무엇을 도와드릴까요?"
+    # 진단 탭 표의 열 (머리글, get_plugin_list 항목의 "metrics" 키)
+    METRICS_COLUMNS = [
+        ("플러그인", "name"),
+        ("상태", "status"),
+        ("호출", "calls"),
+        ("오류", "errors"),
+        ("시간 초과", "timeouts"),
+        ("p50", "p50_ms"),
+        ("p95", "p95_ms"),
+        ("p99", "p99_ms"),
+        ("로드 시간", "load_time_ms"),
+        ("마지막 오류", "last_error"),
+    ]
     
     def __init__(self):
         super().__init__()
@@ -59,18 +261,77 @@ class MainWindow(QMainWindow):
         self.todo_manager = TodoManager()
         self.memo_manager = MemoManager()
         self.file_explorer = FileExplorer()
+        # Whisper 모델은 시작 시간에 영향을 주지 않도록 창이 뜬 뒤 백그라운드에서 로드
         self.voice_handler = VoiceHandler()
+        if Config.WHISPER_PRELOAD:
+            QTimer.singleShot(0, self.voice_handler.load_whisper_model)
         self.plugin_manager = PluginManager()
         self.plugin_manager.load_plugins()
+        if Config.PLUGIN_HOT_RELOAD:
+            self.plugins_reloaded.connect(self._show_reloaded_plugins)
+            self.plugin_manager.start_watching(self.plugins_reloaded.emit)
         
         self.conversation_history = []
         self.current_directory = os.getcwd()
+        # 스트리밍 중인 응답 블록의 시작 위치 (없으면 None)
+        self._stream_block_start = None
+        # 스트리밍 중 도착한 다른 메시지 (응답 블록이 끝난 뒤 표시)
+        self._deferred_chat_messages = []
+        self.plugin_result_ready.connect(self._show_plugin_result)
+        # 현재 파일 목록을 읽고 있는 백그라운드 로더
+        self.directory_loader = None
+        # 실행 중인 용량 분석/중복 탐지 워커
+        self.analysis_worker = None
+        # 실행 중인 파일 검색 워커와 파일 목록이 검색 결과를 보여주는지 여부
+        self.file_search_worker = None
+        self.showing_search_results = False
+        # 실행 중인 스트리밍 음성 인식 작업과 그 전까지 입력창에 있던 텍스트
+        self.stt_handle = None
+        # 실행 중인 음성 메모 일괄 가져오기 워커
+        self.transcription_worker = None
+        self._stt_base_text = ""
+        self.stt_result_ready.connect(self._show_stt_result)
+        self.stt_finished.connect(self._finish_voice_input)
+        # 현재 디렉토리 변경 감시 (새로고침 없이 파일 목록 갱신)
+        self.file_events_ready.connect(self._apply_file_events)
+        self.file_watcher = self.file_explorer.create_watcher(self.file_events_ready.emit)
+        # "!명령" 실행 결과를 대화창으로 스트리밍 (명령 번호 -> 표시한 줄 수)
+        self.command_output_ready.connect(self._append_command_output)
+        self.command_finished.connect(self._finish_command)
+        self._command_lines = {}
+        self._next_command_id = 0
         
         # UI 초기화
         self._init_ui()
         self._load_todos()
         self._load_memos()
     
+    def closeEvent(self, event):
+        """창 종료 시 리소스 정리"""
+        if self.llm_client.response_cache is not None:
+            self.llm_client.response_cache.flush()
+        self.file_watcher.stop()
+        self.file_explorer.process_runner.cancel_all()
+        self.plugin_manager.shutdown()
+        if self.stt_handle is not None:
+            self.stt_handle.cancel()
+        self.voice_handler.shutdown()
+        if self.transcription_worker is not None:
+            # 인식 중인 파일은 중간에 멈출 수 없으므로 오래 기다리지 않음 (남은 파일은 pending으로 남아 다음 실행 때 이어서 처리)
+            self.transcription_worker.cancel()
+            if not self.transcription_worker.wait(self.WORKER_STOP_TIMEOUT_MS):
+                print("음성 일괄 인식이 제한 시간 안에 끝나지 않았습니다. 다음 실행 때 이어서 처리합니다.")
+        if self.analysis_worker is not None:
+            self.analysis_worker.cancel()
+            self.analysis_worker.wait()
+        if self.file_search_worker is not None:
+            self.file_search_worker.cancel()
+            if not self.file_search_worker.wait(self.WORKER_STOP_TIMEOUT_MS):
+                print("파일 검색 워커가 제한 시간 안에 끝나지 않았습니다.")
+        # 공유 저장소 계층의 모든 스레드 연결 종료 (WAL 체크포인트 포함)
+        close_all_databases()
+        super().closeEvent(event)
+    
     def _init_ui(self):
         """UI 초기화"""
         central_widget = QWidget()
@@ -90,6 +351,10 @@ class MainWindow(QMainWindow):
         # 탭 3: 파일 탐색
         self._init_file_explorer_tab()
         
+        # 탭 4: 플러그인 진단
+        self._init_diagnostics_tab()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        
         main_layout.addWidget(self.tabs)
     
     def _init_chat_tab(self):
@@ -105,7 +370,7 @@ class MainWindow(QMainWindow):
         self.chat_display = QTextEdit()
         self.chat_display.setReadOnly(True)
         self.chat_display.setFont(QFont("맑은 고딕", 10))
-        self.chat_display.append("🧠 <b>ZiTTA</b>: 안녕하세요! 저는 ZiTTA입니다. 무엇을 도와드릴까요?")
+        self.chat_display.append(f"🧠 <b>ZiTTA</b>: {self.GREETING}")
         
         # 입력 영역
         input_layout = QHBoxLayout()
@@ -124,6 +389,14 @@ class MainWindow(QMainWindow):
         input_layout.addWidget(self.send_button)
         input_layout.addWidget(self.voice_button)
         
+        # 응답 읽어주기 켜기/끄기 (스트리밍 응답은 문장이 완성될 때마다 읽음)
+        self.speak_button = QPushButton("🔊")
+        self.speak_button.setCheckable(True)
+        self.speak_button.setToolTip("응답 읽어주기")
+        self.speak_button.setEnabled(self.voice_handler.tts is not None)
+        self.speak_button.toggled.connect(self._toggle_speech)
+        input_layout.addWidget(self.speak_button)
+        
         chat_widget_layout.addWidget(QLabel("💬 대화"))
         chat_widget_layout.addWidget(self.chat_display)
         chat_widget_layout.addLayout(input_layout)
@@ -134,8 +407,10 @@ class MainWindow(QMainWindow):
         
         todo_layout.addWidget(QLabel("📝 할 일 관리"))
         
-        # 할 일 목록
-        self.todo_list = QListWidget()
+        # 할 일 목록 (스크롤할 때 필요한 만큼만 DB에서 가져옴)
+        self.todo_model = LazyListModel(self._format_todo_item, key=lambda todo: todo['id'])
+        self.todo_list = QListView()
+        self.todo_list.setModel(self.todo_model)
         todo_layout.addWidget(self.todo_list)
         
         # 할 일 추가 버튼
@@ -173,9 +448,11 @@ class MainWindow(QMainWindow):
         
         memo_layout.addWidget(QLabel("📝 메모 관리"))
         
-        # 메모 목록
-        self.memo_list = QListWidget()
-        self.memo_list.itemDoubleClicked.connect(self._edit_memo)
+        # 메모 목록 (스크롤할 때 필요한 만큼만 DB에서 가져옴)
+        self.memo_model = LazyListModel(self._format_memo_item, key=lambda memo: memo['id'])
+        self.memo_list = QListView()
+        self.memo_list.setModel(self.memo_model)
+        self.memo_list.doubleClicked.connect(self._edit_memo)
         memo_layout.addWidget(self.memo_list)
         
         # 메모 추가/검색 영역
@@ -199,16 +476,22 @@ class MainWindow(QMainWindow):
         self.search_memo_button.clicked.connect(self._search_memos)
         self.delete_memo_button = QPushButton("선택 메모 삭제")
         self.delete_memo_button.clicked.connect(self._delete_memo)
+        self.import_voice_button = QPushButton("음성 메모 가져오기")
+        self.import_voice_button.clicked.connect(self._start_voice_import)
         
         memo_button_layout.addWidget(self.add_memo_button)
         memo_button_layout.addWidget(self.search_memo_button)
         memo_button_layout.addWidget(self.delete_memo_button)
+        memo_button_layout.addWidget(self.import_voice_button)
         
         memo_layout.addLayout(memo_input_layout)
         memo_layout.addWidget(QLabel("내용:"))
         memo_layout.addWidget(self.memo_content_input)
         memo_layout.addLayout(memo_button_layout)
         
+        self.memo_status_label = QLabel("")
+        memo_layout.addWidget(self.memo_status_label)
+        
         self.tabs.addTab(memo_tab, "📝 메모")
     
     def _init_file_explorer_tab(self):
@@ -228,10 +511,23 @@ class MainWindow(QMainWindow):
         path_layout.addWidget(self.browse_button)
         path_layout.addWidget(self.refresh_button)
         
+        # 파일명 검색 (현재 폴더 하위, 파일명 색인 사용)
+        search_layout = QHBoxLayout()
+        self.file_search_input = QLineEdit()
+        self.file_search_input.setPlaceholderText("현재 폴더 하위에서 파일 이름 검색...")
+        self.file_search_input.returnPressed.connect(self._search_files)
+        self.file_search_button = QPushButton("파일 검색")
+        self.file_search_button.clicked.connect(self._search_files)
+        search_layout.addWidget(self.file_search_input)
+        search_layout.addWidget(self.file_search_button)
+        
         # 파일 목록
-        self.file_list = QListWidget()
-        self.file_list.itemDoubleClicked.connect(self._open_file_item)
+        self.file_model = LazyListModel(self._format_file_item, key=lambda item: item['path'])
+        self.file_list = QListView()
+        self.file_list.setModel(self.file_model)
+        self.file_list.doubleClicked.connect(self._open_file_item)
         file_layout.addLayout(path_layout)
+        file_layout.addLayout(search_layout)
         file_layout.addWidget(QLabel("📁 파일 목록"))
         file_layout.addWidget(self.file_list)
         
@@ -242,45 +538,93 @@ class MainWindow(QMainWindow):
         self.open_dir_button = QPushButton("폴더 열기")
         self.open_dir_button.clicked.connect(self._open_selected_directory)
         
+        self.disk_usage_button = QPushButton("용량 분석")
+        self.disk_usage_button.clicked.connect(lambda: self._start_disk_analysis("usage"))
+        self.duplicates_button = QPushButton("중복 파일 찾기")
+        self.duplicates_button.clicked.connect(lambda: self._start_disk_analysis("duplicates"))
+        
         file_button_layout.addWidget(self.open_file_button)
         file_button_layout.addWidget(self.open_dir_button)
+        file_button_layout.addWidget(self.disk_usage_button)
+        file_button_layout.addWidget(self.duplicates_button)
         file_layout.addLayout(file_button_layout)
         
+        self.analysis_label = QLabel("")
+        file_layout.addWidget(self.analysis_label)
+        
         self._refresh_file_list()
         self.tabs.addTab(file_tab, "📁 파일 탐색")
     
+    def _init_diagnostics_tab(self):
+        """플러그인 진단 탭 초기화"""
+        self.diagnostics_tab = QWidget()
+        diagnostics_layout = QVBoxLayout(self.diagnostics_tab)
+        
+        diagnostics_layout.addWidget(QLabel("🩺 플러그인 지표 (지연 시간은 ms)"))
+        
+        # 플러그인별 지표 표 (열 머리글을 눌러 정렬)
+        self.metrics_table = QTableWidget(0, len(self.METRICS_COLUMNS))
+        self.metrics_table.setHorizontalHeaderLabels([title for title, _ in self.METRICS_COLUMNS])
+        self.metrics_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.metrics_table.horizontalHeader().setStretchLastSection(True)
+        diagnostics_layout.addWidget(self.metrics_table)
+        
+        diagnostics_button_layout = QHBoxLayout()
+        self.metrics_refresh_button = QPushButton("새로고침")
+        self.metrics_refresh_button.clicked.connect(self._refresh_plugin_metrics)
+        self.metrics_dump_button = QPushButton("JSON 저장")
+        self.metrics_dump_button.clicked.connect(self._dump_plugin_metrics)
+        diagnostics_button_layout.addWidget(self.metrics_refresh_button)
+        diagnostics_button_layout.addWidget(self.metrics_dump_button)
+        diagnostics_layout.addLayout(diagnostics_button_layout)
+        
+        self.tabs.addTab(self.diagnostics_tab, "🩺 진단")
+    
     def _send_message(self):
         """메시지 전송"""
         message = self.input_field.text().strip()
         if not message:
             return
         
+        # "!"로 시작하면 시스템 명령 실행 (CHAT_COMMANDS_ENABLED일 때만, 출력은 스트리밍, 입력창은 막지 않음)
+        if Config.CHAT_COMMANDS_ENABLED and message.startswith("!"):
+            self.input_field.clear()
+            self._run_chat_command(message[1:].strip())
+            return
+        
+        # 이전 응답을 읽는 중이면 바로 멈춤 (끼어들기)
+        self.voice_handler.cancel_speech()
+        
         # 사용자 메시지 표시
         self.chat_display.append(f"<b>사용자</b>: {message}")
         self.input_field.clear()
         self.input_field.setEnabled(False)
         self.send_button.setEnabled(False)
         
-        # 플러그인 명령 처리 먼저 시도
-        plugin_result = self.plugin_manager.handle_command(message)
-        if plugin_result:
-            self.chat_display.append(f"🔌 <b>플러그인 ({plugin_result.get('plugin', 'Unknown')})</b>: {plugin_result.get('response', '')}")
-            # 플러그인 응답 후에도 LLM 응답을 계속 처리
+        # 플러그인 명령 처리 (설정에 따라 백그라운드/작업 프로세스에서 실행, 결과는 시그널로 표시)
+        future = self.plugin_manager.submit_command(message)
+        future.add_done_callback(
+            lambda done: self.plugin_result_ready.emit(None if done.cancelled() or done.exception() else done.result())
+        )
+        # 플러그인 응답과 별개로 LLM 응답을 계속 처리
         
         # 일반 대화 - LLM 응답 처리
         self._process_llm_response(message)
     
     def _process_llm_response(self, message: str, is_todo_extraction: bool = False, is_memo_extraction: bool = False):
         """LLM 응답 처리 (비동기)"""
-        self.worker = LLMWorker(self.llm_client, message, self.conversation_history)
+        # 일반 대화만 스트리밍 (할 일/메모 추출은 전체 응답이 필요)
+        stream = not (is_todo_extraction or is_memo_extraction)
+        self.worker = LLMWorker(self.llm_client, message, self.conversation_history, stream=stream)
         
         if is_todo_extraction:
             def handle_todo_response(response):
                 # 할 일 추가
                 todo_title = response.strip()
                 if todo_title:
-                    self.todo_manager.add_todo(todo_title)
-                    self._load_todos()
+                    todo_id = self.todo_manager.add_todo(todo_title)
+                    self._insert_todo_item(todo_id)
                     self.chat_display.append(f"🧠 <b>ZiTTA</b>: 할 일 '{todo_title}'을 추가했습니다.")
                 self.input_field.setEnabled(True)
                 self.send_button.setEnabled(True)
@@ -291,8 +635,8 @@ class MainWindow(QMainWindow):
                 # 메모 추가
                 memo_title = response.strip()
                 if memo_title:
-                    self.memo_manager.add_memo(memo_title)
-                    self._load_memos()
+                    memo_id = self.memo_manager.add_memo(memo_title)
+                    self._insert_memo_item(memo_id)
                     self.chat_display.append(f"🧠 <b>ZiTTA</b>: 메모 '{memo_title}'을 추가했습니다.")
                 self.input_field.setEnabled(True)
                 self.send_button.setEnabled(True)
@@ -300,8 +644,14 @@ class MainWindow(QMainWindow):
             self.worker.response_ready.connect(handle_memo_response)
         else:
             def handle_response(response):
-                # append()는 HTML을 지원하므로 HTML이 포함된 경우 그대로 전달
-                self.chat_display.append(f"🧠 <b>ZiTTA</b>: {response}")
+                # 스트리밍 중 읽지 못한 마지막 문장까지 읽기 (조각 없이 온 응답은 전체를 읽음)
+                if self.speak_button.isChecked():
+                    if self._stream_block_start is not None:
+                        self.voice_handler.finish_speech()
+                    else:
+                        self.voice_handler.text_to_speech(response)
+                # 스트리밍으로 표시한 내용을 최종 응답으로 교체 (HTML 오류 메시지 포함)
+                self._finish_stream_message(response)
                 # 대화 기록 업데이트
                 self.conversation_history.append({"role": "user", "content": message})
                 self.conversation_history.append({"role": "assistant", "content": response})
@@ -311,30 +661,167 @@ class MainWindow(QMainWindow):
                 self.input_field.setEnabled(True)
                 self.send_button.setEnabled(True)
             
+            self._stream_block_start = None
+            self.worker.chunk_ready.connect(self._append_stream_chunk)
             self.worker.response_ready.connect(handle_response)
         
         self.worker.error_occurred.connect(lambda e: self._handle_error(e))
         self.worker.start()
     
+    def _append_stream_chunk(self, chunk: str):
+        """스트리밍 응답 조각을 대화 창에 이어 붙이기"""
+        if self.speak_button.isChecked():
+            self.voice_handler.feed_speech(chunk)
+        if self._stream_block_start is None:
+            # 첫 조각: 새 응답 블록 시작
+            first_chunk = html.escape(chunk).replace("\n", "<br>")
+            self.chat_display.append(f"🧠 <b>ZiTTA</b>: {first_chunk}")
+            self._stream_block_start = self.chat_display.document().lastBlock().position()
+        else:
+            self.chat_display.moveCursor(QTextCursor.MoveOperation.End)
+            self.chat_display.insertPlainText(chunk)
+        self.chat_display.ensureCursorVisible()
+    
+    def _finish_stream_message(self, response: str):
+        """스트리밍이 끝난 응답 블록을 최종 응답으로 다시 렌더링"""
+        if self._stream_block_start is None:
+            # 조각 없이 끝난 경우 (비어있는 응답 등)
+            # append()는 HTML을 지원하므로 HTML이 포함된 경우 그대로 전달
+            self.chat_display.append(f"🧠 <b>ZiTTA</b>: {response}")
+            self._flush_deferred_chat()
+            return
+        
+        cursor = QTextCursor(self.chat_display.document())
+        cursor.setPosition(self._stream_block_start)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        cursor.insertHtml(f"🧠 <b>ZiTTA</b>: {response}")
+        self._stream_block_start = None
+        self.chat_display.moveCursor(QTextCursor.MoveOperation.End)
+        self._flush_deferred_chat()
+    
+    def _toggle_speech(self, enabled: bool):
+        """응답 읽어주기 켜기/끄기 (켜면 고정 문구를 음성 캐시에 미리 합성, 끄면 읽는 중인 음성도 멈춤)"""
+        if not enabled:
+            self.voice_handler.cancel_speech()
+            return
+        phrases = [self.GREETING]
+        offline_llm = getattr(self.llm_client, "offline_llm", None)
+        if offline_llm is not None:
+            phrases.extend(response for responses in offline_llm.responses.values() for response in responses)
+        self.voice_handler.prewarm_speech(phrases)
+    
+    def _append_chat(self, text: str):
+        """대화 창에 메시지 추가 (응답 스트리밍 중이면 응답 블록이 끝난 뒤 표시)"""
+        if self._stream_block_start is not None:
+            self._deferred_chat_messages.append(text)
+        else:
+            self.chat_display.append(text)
+    
+    def _flush_deferred_chat(self):
+        """스트리밍 중 미뤄둔 메시지 표시"""
+        messages, self._deferred_chat_messages = self._deferred_chat_messages, []
+        for text in messages:
+            self.chat_display.append(text)
+    
+    def _show_plugin_result(self, result):
+        """플러그인 처리 결과 표시"""
+        if not result:
+            return
+        plugin_name = result.get('plugin', 'Unknown')
+        if result.get("type") == "plugin_error":
+            self._append_chat(f"❌ <b>플러그인 ({plugin_name}) 오류</b>: {html.escape(result.get('response', ''))}")
+        else:
+            self._append_chat(f"🔌 <b>플러그인 ({plugin_name})</b>: {result.get('response', '')}")
+    
+    def _show_reloaded_plugins(self, plugin_names: list):
+        """핫 리로드된 플러그인 알림"""
+        self._append_chat(f"🔌 플러그인 다시 로드: {html.escape(', '.join(plugin_names))}")
+    
+    def _run_chat_command(self, command: str):
+        """대화창 명령 실행 ("!취소"는 실행 중인 명령 모두 취소)"""
+        if not command:
+            return
+        if command == "취소":
+            running = self.file_explorer.process_runner.running()
+            self.file_explorer.process_runner.cancel_all()
+            self._append_chat(f"💻 실행 중인 명령 {len(running)}개를 취소했습니다.")
+            return
+        
+        # 셸 명령은 현재 사용자 권한으로 실행되므로 매번 확인
+        reply = QMessageBox.question(
+            self, "명령 실행 확인",
+            f"다음 명령을 현재 폴더에서 실행할까요?\n\n{command}\n\n폴더: {self.current_directory}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            self._append_chat("💻 명령 실행을 취소했습니다.")
+            return
+        
+        self._append_chat(f"<b>사용자</b>: <code>!{html.escape(command)}</code>")
+        command_id = self._next_command_id
+        self._next_command_id += 1
+        self._command_lines[command_id] = 0
+        self.file_explorer.run_command(
+            command,
+            on_line=lambda stream, line: self.command_output_ready.emit(command_id, stream, line),
+            on_exit=lambda handle: self.command_finished.emit(command_id, handle),
+            cwd=self.current_directory
+        )
+    
+    def _append_command_output(self, command_id: int, stream: str, line: str):
+        """명령 출력 한 줄 표시 (명령마다 최대 CHAT_COMMAND_MAX_LINES줄)"""
+        shown = self._command_lines.get(command_id)
+        if shown is None or shown >= self.CHAT_COMMAND_MAX_LINES:
+            return
+        self._command_lines[command_id] = shown + 1
+        color = "#c0392b" if stream == "stderr" else "#555555"
+        text = html.escape(line.rstrip("\n"))
+        self._append_chat(f"<span style='color:{color}; font-family:monospace'>{text}</span>")
+    
+    def _finish_command(self, command_id: int, handle):
+        """명령 종료 결과 표시"""
+        shown = self._command_lines.pop(command_id, 0)
+        if handle.error:
+            self._append_chat(f"❌ <b>오류</b>: {html.escape(handle.error)}")
+            return
+        
+        skipped = handle.line_count - shown
+        if skipped > 0:
+            self._append_chat(f"💻 ... 출력 {skipped}줄 생략")
+        if handle.cancelled:
+            status = "취소됨"
+        elif handle.timed_out:
+            status = "시간 초과"
+        else:
+            status = f"종료 코드 {handle.returncode}"
+        self._append_chat(f"💻 <b>명령 완료</b>: {status}")
+    
     def _handle_error(self, error_msg):
         """오류 처리"""
+        self._stream_block_start = None
+        self._flush_deferred_chat()
         self.chat_display.append(f"❌ <b>오류</b>: {error_msg}")
         self.input_field.setEnabled(True)
         self.send_button.setEnabled(True)
     
+    def _format_todo_item(self, todo: dict) -> str:
+        """할 일 목록 항목 표시 문자열"""
+        item_text = f"[{todo['id']}] {todo['title']}"
+        if todo['description']:
+            item_text += f"\n  {todo['description']}"
+        return item_text
+    
     def _load_todos(self):
-        """할 일 목록 로드"""
-        self.todo_list.clear()
-        todos = self.todo_manager.get_todos(completed=False)
-        
-        for todo in todos:
-            item_text = f"[{todo['id']}] {todo['title']}"
-            if todo['description']:
-                item_text += f"\n  {todo['description']}"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, todo['id'])
-            self.todo_list.addItem(item)
+        """할 일 목록 로드 (첫 페이지만 읽고 나머지는 스크롤 시 로드)"""
+        self.todo_model.set_source(self.todo_manager.iter_todos(completed=False))
+    
+    def _insert_todo_item(self, todo_id: int):
+        """새 할 일을 목록 맨 위에 추가 (전체 재로드 없음)"""
+        todo = self.todo_manager.get_todo(todo_id)
+        if todo:
+            self.todo_model.insert_item(todo, 0)
     
     def _add_todo(self):
         """할 일 추가"""
@@ -342,42 +829,131 @@ class MainWindow(QMainWindow):
         if not title:
             return
         
-        self.todo_manager.add_todo(title)
+        todo_id = self.todo_manager.add_todo(title)
         self.todo_input.clear()
-        self._load_todos()
+        self._insert_todo_item(todo_id)
     
     def _delete_todo(self):
         """선택된 할 일 삭제"""
-        current_item = self.todo_list.currentItem()
-        if not current_item:
+        todo = self.todo_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+        if not todo:
             QMessageBox.warning(self, "알림", "삭제할 항목을 선택하세요.")
             return
         
-        todo_id = current_item.data(Qt.ItemDataRole.UserRole)
+        todo_id = todo['id']
         if self.todo_manager.delete_todo(todo_id):
-            self._load_todos()
+            self.todo_model.remove_item(todo_id)
             QMessageBox.information(self, "성공", "할 일이 삭제되었습니다.")
         else:
             QMessageBox.warning(self, "오류", "할 일 삭제에 실패했습니다.")
     
     def _start_voice_input(self):
-        """음성 입력 시작"""
-        QMessageBox.information(self, "음성 입력", "음성 입력 기능은 준비 중입니다.\n음성 파일을 선택하거나 마이크 입력을 지원합니다.")
-        # TODO: 실제 음성 입력 구현
+        """음성 입력 시작 (WAV 파일을 스트리밍 인식, 인식 중이면 중지)"""
+        if self.stt_handle is not None:
+            self.stt_handle.cancel()
+            return
+        
+        audio_path, _ = QFileDialog.getOpenFileName(self, "음성 파일 선택", self.current_directory, "WAV 파일 (*.wav)")
+        if not audio_path:
+            return
+        
+        handle = self.voice_handler.stream_file_to_text(
+            audio_path,
+            on_result=self.stt_result_ready.emit,
+            on_finish=self.stt_finished.emit,
+        )
+        if handle is None:
+            QMessageBox.warning(self, "음성 입력", "음성 인식을 시작할 수 없습니다.\nWhisper 설치 여부와 16비트 PCM WAV 파일인지 확인하세요.")
+            return
+        self.stt_handle = handle
+        self._stt_base_text = self.input_field.text().strip()
+        self.voice_button.setText("⏹ 중지")
+    
+    def _show_stt_result(self, result: dict):
+        """음성 인식 결과를 입력창에 표시 (부분 결과는 최종 결과가 오면 대체됨)"""
+        if not result["text"]:
+            return
+        text = " ".join(part for part in (self._stt_base_text, result["text"]) if part)
+        if result["type"] == "final":
+            self._stt_base_text = text
+        self.input_field.setText(text)
+    
+    def _finish_voice_input(self, handle):
+        """음성 인식 종료 처리"""
+        if handle is not self.stt_handle:
+            return
+        self.stt_handle = None
+        self.voice_button.setText("🎤 음성")
+        # 마지막 부분 결과 대신 확정된 텍스트만 남김
+        self.input_field.setText(self._stt_base_text)
+        if handle.error:
+            QMessageBox.warning(self, "음성 입력", handle.error)
+        elif not handle.cancelled and not handle.finals:
+            self._append_chat("🎤 인식된 음성이 없습니다.")
+    
+    def _start_voice_import(self):
+        """폴더의 음성 파일을 일괄 인식하여 메모로 가져오기 (실행 중이면 중단)"""
+        if self.transcription_worker is not None:
+            self.transcription_worker.cancel()
+            return
+        
+        root = QFileDialog.getExistingDirectory(self, "음성 메모 폴더 선택", self.current_directory)
+        if not root:
+            return
+        
+        worker = TranscriptionWorker(self.voice_handler, self.memo_manager, root, parent=self)
+        worker.progress_changed.connect(
+            lambda stats: self.memo_status_label.setText(
+                f"음성 인식 중: {stats['done']:,} / {stats['total']:,} — {os.path.basename(stats['path'])}"
+            )
+        )
+        worker.result_ready.connect(self._show_voice_import_result)
+        worker.error_occurred.connect(self._handle_error)
+        worker.finished.connect(lambda: self._finish_voice_import(worker))
+        self.transcription_worker = worker
+        self.import_voice_button.setText("중단")
+        self.memo_status_label.setText("음성 인식 준비 중... (모델 로드)")
+        worker.start()
+    
+    def _finish_voice_import(self, worker):
+        """일괄 인식 워커 정리 및 버튼 복원"""
+        if worker is self.transcription_worker:
+            self.transcription_worker = None
+        worker.deleteLater()
+        self.import_voice_button.setText("음성 메모 가져오기")
+    
+    def _show_voice_import_result(self, result: dict):
+        """일괄 인식 결과 표시 및 메모 목록 갱신"""
+        text = (
+            f"음성 메모 {result['imported']:,}개 추가, {result['updated']:,}개 갱신 "
+            f"(인식 {result['transcribed']:,}, 이전 결과 사용 {result['skipped']:,}, 실패 {result['failed']:,}, "
+            f"{result['elapsed']:.1f}초)"
+        )
+        if result["cancelled"]:
+            text += " — 중단됨, 다시 실행하면 이어서 처리합니다."
+        self.memo_status_label.setText(text)
+        if result["imported"] or result["updated"]:
+            self._load_memos()
+    
+    def _format_memo_item(self, memo: dict) -> str:
+        """메모 목록 항목 표시 문자열 (검색 결과면 미리보기 포함)"""
+        item_text = f"[{memo['id']}] {memo['title']}"
+        if memo['tags']:
+            item_text += f" (태그: {memo['tags']})"
+        if memo.get('snippet'):
+            item_text += f"\n  {memo['snippet']}"
+        return item_text
     
     def _load_memos(self):
-        """메모 목록 로드"""
-        self.memo_list.clear()
-        memos = self.memo_manager.get_memos()
-        
-        for memo in memos:
-            item_text = f"[{memo['id']}] {memo['title']}"
-            if memo['tags']:
-                item_text += f" (태그: {memo['tags']})"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, memo['id'])
-            self.memo_list.addItem(item)
+        """메모 목록 로드 (첫 페이지만 읽고 나머지는 스크롤 시 로드)"""
+        self.memo_model.set_source(self.memo_manager.iter_memos())
+    
+    def _insert_memo_item(self, memo_id: int):
+        """새로 추가/수정된 메모를 목록 맨 위로 반영 (전체 재로드 없음)"""
+        memo = self.memo_manager.get_memo(memo_id)
+        self.memo_model.remove_item(memo_id)
+        if memo:
+            self.memo_model.insert_item(memo, 0)
     
     def _add_memo(self):
         """메모 추가"""
@@ -389,16 +965,16 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "알림", "메모 제목을 입력하세요.")
             return
         
-        self.memo_manager.add_memo(title, content, tags)
+        memo_id = self.memo_manager.add_memo(title, content, tags)
         self.memo_title_input.clear()
         self.memo_content_input.clear()
         self.memo_tags_input.clear()
-        self._load_memos()
+        self._insert_memo_item(memo_id)
         QMessageBox.information(self, "성공", "메모가 추가되었습니다.")
     
-    def _edit_memo(self, item):
+    def _edit_memo(self, index):
         """메모 편집"""
-        memo_id = item.data(Qt.ItemDataRole.UserRole)
+        memo_id = index.data(Qt.ItemDataRole.UserRole)['id']
         memo = self.memo_manager.get_memo(memo_id)
         
         if memo:
@@ -418,7 +994,7 @@ class MainWindow(QMainWindow):
         tags = self.memo_tags_input.text().strip()
         
         if self.memo_manager.update_memo(memo_id, title, content, tags):
-            self._load_memos()
+            self._insert_memo_item(memo_id)
             self.memo_title_input.clear()
             self.memo_content_input.clear()
             self.memo_tags_input.clear()
@@ -430,28 +1006,25 @@ class MainWindow(QMainWindow):
     def _search_memos(self):
         """메모 검색"""
         query = self.memo_title_input.text().strip()
-        self.memo_list.clear()
-        memos = self.memo_manager.get_memos(search_query=query if query else None)
+        if not query:
+            self._load_memos()
+            return
         
-        for memo in memos:
-            item_text = f"[{memo['id']}] {memo['title']}"
-            if memo['tags']:
-                item_text += f" (태그: {memo['tags']})"
-            
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, memo['id'])
-            self.memo_list.addItem(item)
+        # 전문 검색 색인으로 관련도 순 검색 (목록은 일반 텍스트이므로 «»로 강조)
+        self.memo_model.set_source(
+            self.memo_manager.iter_search_memos(query, highlight=("«", "»"))
+        )
     
     def _delete_memo(self):
         """선택된 메모 삭제"""
-        current_item = self.memo_list.currentItem()
-        if not current_item:
+        memo = self.memo_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+        if not memo:
             QMessageBox.warning(self, "알림", "삭제할 메모를 선택하세요.")
             return
         
-        memo_id = current_item.data(Qt.ItemDataRole.UserRole)
+        memo_id = memo['id']
         if self.memo_manager.delete_memo(memo_id):
-            self._load_memos()
+            self.memo_model.remove_item(memo_id)
             QMessageBox.information(self, "성공", "메모가 삭제되었습니다.")
         else:
             QMessageBox.warning(self, "오류", "메모 삭제에 실패했습니다.")
@@ -465,18 +1038,136 @@ class MainWindow(QMainWindow):
             self._refresh_file_list()
     
     def _refresh_file_list(self):
-        """파일 목록 새로고침"""
-        self.file_list.clear()
-        items = self.file_explorer.list_directory(self.current_directory)
-        
-        for item in items:
-            icon = "📁" if item["is_directory"] else "📄"
-            size_text = f" ({self._format_size(item['size'])})" if not item["is_directory"] else ""
-            item_text = f"{icon} {item['name']}{size_text}"
+        """파일 목록 새로고침 (백그라운드에서 읽어 배치 단위로 표시)"""
+        if self.directory_loader is not None:
+            self.directory_loader.requestInterruption()
+        
+        self.file_model.clear()
+        self.showing_search_results = False
+        # 부모를 지정하여 중단된 로더가 실행 중에 해제되지 않도록 함
+        loader = DirectoryLoader(self.file_explorer, self.current_directory, parent=self)
+        loader.finished.connect(lambda: self._release_directory_loader(loader))
+        # 이전 디렉토리의 로더가 늦게 보낸 배치는 무시
+        loader.batch_ready.connect(
+            lambda batch: self.file_model.append_items(batch) if loader is self.directory_loader else None
+        )
+        loader.finished_loading.connect(
+            lambda: self._finish_file_list_loading(loader)
+        )
+        self.directory_loader = loader
+        loader.start()
+        self._watch_current_directory()
+    
+    def _watch_current_directory(self):
+        """감시 대상을 현재 디렉토리로 교체"""
+        current = os.path.abspath(self.current_directory)
+        for path in self.file_watcher.watched_paths():
+            if path != current:
+                self.file_watcher.unwatch(path)
+        self.file_watcher.watch(current)
+    
+    def _apply_file_events(self, events: list):
+        """파일 감시 이벤트를 현재 파일 목록에 반영 (전체 재로드 없음, 삭제/추가는 묶어서 한 번에)"""
+        if self.showing_search_results:
+            return
+        current = os.path.abspath(self.current_directory)
+        
+        def item_path(path):
+            # 목록 항목과 같은 방식으로 경로 구성 (모델 키 일치)
+            return os.path.join(self.current_directory, os.path.basename(path))
+        
+        removed = []
+        changed = {}
+        for event in events:
+            kind = event["type"]
+            if kind == "overflow":
+                # 일부 이벤트 유실: 현재 디렉토리면 다시 읽음
+                if event["path"] == current:
+                    self._refresh_file_list()
+                    return
+                continue
+            
+            if kind in ("deleted", "renamed") and os.path.dirname(event["path"]) == current:
+                removed.append(item_path(event["path"]))
+                changed.pop(item_path(event["path"]), None)
             
-            list_item = QListWidgetItem(item_text)
-            list_item.setData(Qt.ItemDataRole.UserRole, item)
-            self.file_list.addItem(list_item)
+            target = event["dest_path"] if kind == "renamed" else event["path"]
+            if kind == "deleted" or os.path.dirname(target) != current:
+                continue
+            
+            # 상태는 처리 시점의 파일 기준 (같은 경로의 이벤트가 여러 번 와도 한 번만 조회)
+            changed[item_path(target)] = None
+        
+        self.file_model.remove_items(removed)
+        added = []
+        for path in changed:
+            item = self.file_explorer.get_item(path)
+            if item is not None and not self.file_model.update_item(item):
+                added.append(item)
+        if len(added) == 1:
+            self.file_model.insert_sorted(added[0], self.file_explorer.sort_key)
+        elif added:
+            self.file_model.append_items(added)
+            self.file_model.sort_items(self.file_explorer.sort_key)
+    
+    def _search_files(self):
+        """현재 폴더 하위에서 파일 이름 검색 (검색어가 비어 있으면 폴더 목록으로 복귀)"""
+        pattern = self.file_search_input.text().strip()
+        if not pattern:
+            self._refresh_file_list()
+            return
+        if self.file_search_worker is not None:
+            return
+        
+        if self.directory_loader is not None:
+            self.directory_loader.requestInterruption()
+            self.directory_loader = None
+        
+        worker = FileSearchWorker(self.file_explorer, self.current_directory, pattern, parent=self)
+        worker.indexing_started.connect(
+            lambda: self.analysis_label.setText("처음 검색하는 폴더입니다. 파일 이름 색인을 만드는 중...")
+        )
+        worker.result_ready.connect(self._show_file_search_result)
+        worker.error_occurred.connect(self._handle_error)
+        worker.finished.connect(lambda: self._finish_file_search(worker))
+        self.file_search_worker = worker
+        self.file_search_button.setEnabled(False)
+        self.analysis_label.setText("검색 중...")
+        worker.start()
+    
+    def _show_file_search_result(self, items: list):
+        """파일 검색 결과를 파일 목록에 표시"""
+        self.file_model.clear()
+        self.showing_search_results = True
+        self.file_model.append_items(items)
+        self.file_model.sort_items(self.file_explorer.sort_key)
+        self.analysis_label.setText(f"검색 결과 {len(items):,}개")
+    
+    def _finish_file_search(self, worker):
+        """검색 워커 정리 및 버튼 복원"""
+        if worker is self.file_search_worker:
+            self.file_search_worker = None
+        worker.deleteLater()
+        self.file_search_button.setEnabled(True)
+        if not self.showing_search_results:
+            self.analysis_label.setText("")
+    
+    def _release_directory_loader(self, loader):
+        """종료된 로더 정리"""
+        if loader is self.directory_loader:
+            self.directory_loader = None
+        loader.deleteLater()
+    
+    def _finish_file_list_loading(self, loader):
+        """파일 목록 로드 완료 시 정렬 (디렉토리 먼저, 이름순)"""
+        if loader is self.directory_loader:
+            self.file_model.sort_items(self.file_explorer.sort_key)
+    
+    def _format_file_item(self, item: dict) -> str:
+        """파일 목록 항목 표시 문자열"""
+        icon = "📁" if item["is_directory"] else "📄"
+        size_text = f" ({self._format_size(item['size'])})" if not item["is_directory"] else ""
+        return f"{icon} {item['name']}{size_text}"
     
     def _format_size(self, size: int) -> str:
         """파일 크기 포맷팅"""
@@ -486,9 +1177,9 @@ class MainWindow(QMainWindow):
             size /= 1024.0
         return f"{size:.1f} TB"
     
-    def _open_file_item(self, item):
+    def _open_file_item(self, index):
         """파일/디렉토리 더블클릭 처리"""
-        file_data = item.data(Qt.ItemDataRole.UserRole)
+        file_data = index.data(Qt.ItemDataRole.UserRole)
         if file_data["is_directory"]:
             self.current_directory = file_data["path"]
             self.path_label.setText(f"경로: {self.current_directory}")
@@ -498,12 +1189,11 @@ class MainWindow(QMainWindow):
     
     def _open_selected_file(self):
         """선택된 파일 열기"""
-        current_item = self.file_list.currentItem()
-        if not current_item:
+        file_data = self.file_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+        if not file_data:
             QMessageBox.warning(self, "알림", "열 파일을 선택하세요.")
             return
         
-        file_data = current_item.data(Qt.ItemDataRole.UserRole)
         if not file_data["is_directory"]:
             self._open_file(file_data["path"])
         else:
@@ -516,14 +1206,126 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "오류", "파일을 열 수 없습니다.")
     
+    def _start_disk_analysis(self, task: str):
+        """현재 디렉토리 용량 분석/중복 파일 탐지 시작 (실행 중이면 중단)"""
+        if self.analysis_worker is not None:
+            self.analysis_worker.cancel()
+            return
+        
+        worker = DiskAnalysisWorker(self.file_explorer, task, self.current_directory, parent=self)
+        worker.progress_changed.connect(self._show_analysis_progress)
+        worker.result_ready.connect(
+            self._show_duplicates_result if task == "duplicates" else self._show_disk_usage_result
+        )
+        worker.error_occurred.connect(self._handle_error)
+        worker.finished.connect(lambda: self._finish_disk_analysis(worker))
+        self.analysis_worker = worker
+        
+        button = self.duplicates_button if task == "duplicates" else self.disk_usage_button
+        button.setText("중단")
+        (self.disk_usage_button if task == "duplicates" else self.duplicates_button).setEnabled(False)
+        worker.start()
+    
+    def _finish_disk_analysis(self, worker):
+        """분석 워커 정리 및 버튼 복원"""
+        if worker is self.analysis_worker:
+            self.analysis_worker = None
+        worker.deleteLater()
+        self.disk_usage_button.setText("용량 분석")
+        self.duplicates_button.setText("중복 파일 찾기")
+        self.disk_usage_button.setEnabled(True)
+        self.duplicates_button.setEnabled(True)
+        self.analysis_label.setText("")
+    
+    def _show_analysis_progress(self, stats: dict):
+        """분석 진행 상태 표시"""
+        phase = stats.get("phase")
+        if phase == "scan":
+            text = f"탐색 중: 폴더 {stats['dirs']:,}개, 파일 {stats['files']:,}개"
+            if "bytes" in stats:
+                text += f", {self._format_size(stats['bytes'])}"
+        else:
+            label = "부분 비교" if phase == "partial" else "전체 비교"
+            text = f"{label} 중: {stats['done']:,} / {stats['total']:,}"
+        self.analysis_label.setText(text)
+    
+    def _on_tab_changed(self, index: int):
+        """진단 탭을 열 때 지표 갱신"""
+        if self.tabs.widget(index) is self.diagnostics_tab:
+            self._refresh_plugin_metrics()
+    
+    def _refresh_plugin_metrics(self):
+        """플러그인 지표 표 갱신"""
+        plugins = self.plugin_manager.get_plugin_list()
+        self.metrics_table.setSortingEnabled(False)
+        self.metrics_table.setRowCount(len(plugins))
+        for row, plugin in enumerate(plugins):
+            for column, (_, key) in enumerate(self.METRICS_COLUMNS):
+                if key == "name":
+                    value = f"{plugin['name']} v{plugin['version']}"
+                elif key == "status":
+                    value = "로드됨" if plugin["loaded"] else "대기"
+                else:
+                    value = plugin["metrics"][key]
+                item = QTableWidgetItem()
+                if isinstance(value, (int, float)):
+                    # 숫자 열은 값 기준으로 정렬
+                    item.setData(Qt.ItemDataRole.DisplayRole, value)
+                else:
+                    item.setText("" if value is None else str(value))
+                self.metrics_table.setItem(row, column, item)
+        self.metrics_table.setSortingEnabled(True)
+    
+    def _dump_plugin_metrics(self):
+        """플러그인 지표를 JSON 파일로 저장"""
+        path = self.plugin_manager.dump_metrics()
+        self._refresh_plugin_metrics()
+        QMessageBox.information(self, "알림", f"플러그인 지표를 저장했습니다.\n{path}")
+    
+    def _show_disk_usage_result(self, result: dict):
+        """용량 분석 결과를 대화창에 표시"""
+        lines = [
+            f"📊 <b>용량 분석</b>: {html.escape(result['path'])} — {self._format_size(result['size'])} "
+            f"(파일 {result['file_count']:,}개, 폴더 {result['dir_count']:,}개, {result['elapsed']:.1f}초)"
+        ]
+        for child in result["children"][:10]:
+            lines.append(f"&nbsp;&nbsp;📁 {html.escape(child['name'])}: {self._format_size(child['size'])}")
+        if result["files_size"]:
+            lines.append(f"&nbsp;&nbsp;📄 (이 폴더의 파일): {self._format_size(result['files_size'])}")
+        if result["cancelled"]:
+            lines.append("⚠️ 분석이 중단되어 일부 결과만 집계되었습니다.")
+        if result["errors"]:
+            lines.append(f"⚠️ 읽을 수 없는 항목 {len(result['errors'])}개를 건너뛰었습니다.")
+        self._append_chat("<br>".join(lines))
+    
+    def _show_duplicates_result(self, result: dict):
+        """중복 파일 탐지 결과를 대화창에 표시"""
+        groups = result["groups"]
+        if not groups:
+            self._append_chat(
+                f"🔍 <b>중복 파일</b>: 없음 (파일 {result['files_scanned']:,}개 확인, {result['elapsed']:.1f}초)"
+            )
+            return
+        
+        lines = [
+            f"🔍 <b>중복 파일</b>: {len(groups)}묶음, 낭비 용량 {self._format_size(result['wasted'])} "
+            f"(파일 {result['files_scanned']:,}개 확인, {result['elapsed']:.1f}초)"
+        ]
+        for group in groups[:10]:
+            lines.append(f"&nbsp;&nbsp;{self._format_size(group['size'])} × {len(group['paths'])}")
+            for path in group["paths"][:5]:
+                lines.append(f"&nbsp;&nbsp;&nbsp;&nbsp;📄 {html.escape(path)}")
+        if result["cancelled"]:
+            lines.append("⚠️ 탐지가 중단되어 일부 결과만 표시됩니다.")
+        self._append_chat("<br>".join(lines))
+    
     def _open_selected_directory(self):
         """선택된 디렉토리 열기"""
-        current_item = self.file_list.currentItem()
-        if not current_item:
+        file_data = self.file_list.currentIndex().data(Qt.ItemDataRole.UserRole)
+        if not file_data:
             QMessageBox.warning(self, "알림", "열 폴더를 선택하세요.")
             return
         
-        file_data = current_item.data(Qt.ItemDataRole.UserRole)
         if file_data["is_directory"]:
             if self.file_explorer.open_directory(file_data["path"]):
                 self.chat_display.append(f"📁 폴더 열기: {file_data['path']}")
@@ -6,7 +6,16 @@ ZiTTA 플러그인 예제
 1. 이 파일을 plugins/ 디렉토리에 복사
 2. PluginBase를 상속하여 플러그인 클래스 생성
 3. handle_command 메서드를 구현하여 명령 처리
-4. 애플리케이션 재시작 시 자동으로 로드됨
+4. 저장하면 자동으로 로드됨 (실행 중에도 파일 변경을 감지하여 재시작 없이 다시 로드,
+   .env의 PLUGIN_HOT_RELOAD=false 이면 애플리케이션 재시작 시 로드)
+
+참고:
+- get_commands()의 키워드가 메시지에 포함될 때만 handle_command가 호출됩니다.
+  (빈 리스트를 반환하면 모든 메시지를 받음)
+- 네트워크/DB 조회처럼 I/O를 기다리는 플러그인은 handle_command_async를 async def로 재정의하면
+  PluginManager.handle_command_async에서 다른 플러그인과 동시에 실행됩니다.
+- 다시 로드될 때는 새 인스턴스의 on_load() 호출 후 기존 인스턴스의 on_unload()가 호출되므로,
+  on_unload()에서 스레드/파일 등 리소스를 정리하세요.
 """
 import sys
 import os
@@ -0,0 +1,128 @@
+"""
+core.stt_stream 테스트
+합성한 WAV 파일(톤/무음)로 구간 분할과 스트리밍 인식 결과를 확인합니다 (Whisper 불필요).
+"""
+import math
+import wave
+import array
+import threading
+
+import pytest
+
+from core.stt_stream import SpeechSegmenter, StreamingTranscriber, iter_wav_frames
+
+
+SAMPLE_RATE = 16000
+# 프레임 경계가 구간 경계와 맞도록 20ms 프레임 사용
+FRAME_MS = 20
+
+
+def write_wav(path, parts, channels=1):
+    """
+    ("tone"|"silence", 초) 목록으로 16비트 WAV 파일 생성
+    
+    Args:
+        path: 저장할 경로
+        parts: [("tone", 1.0), ("silence", 0.5), ...]
+        channels: 채널 수 (첫 채널 외에는 무음)
+    """
+    samples = array.array("h")
+    for kind, seconds in parts:
+        for i in range(int(SAMPLE_RATE * seconds)):
+            value = int(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) if kind == "tone" else 0
+            samples.append(value)
+            samples.extend([0] * (channels - 1))
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+
+
+def segment_wav(path, **options):
+    """WAV 파일을 SpeechSegmenter로 나눈 전체 구간 목록"""
+    sample_rate, frames = iter_wav_frames(str(path), FRAME_MS)
+    segmenter = SpeechSegmenter(sample_rate, **options)
+    segments = []
+    for frame in frames:
+        segments.extend(segmenter.feed(frame))
+    segments.extend(segmenter.flush())
+    return segments
+
+
+def test_iter_wav_frames_uses_first_channel(tmp_path):
+    path = tmp_path / "stereo.wav"
+    write_wav(path, [("tone", 0.1)], channels=2)
+    
+    sample_rate, frames = iter_wav_frames(str(path), FRAME_MS)
+    frames = list(frames)
+    
+    assert sample_rate == SAMPLE_RATE
+    assert len(frames) == 5
+    assert all(len(frame) == SAMPLE_RATE * FRAME_MS // 1000 * 2 for frame in frames)
+    assert array.array("h", frames[0])[1] == int(8000 * math.sin(2 * math.pi * 440 / SAMPLE_RATE))
+
+
+def test_tone_silence_tone_boundaries(tmp_path):
+    path = tmp_path / "speech.wav"
+    write_wav(path, [("tone", 1.0), ("silence", 1.0), ("tone", 1.0), ("silence", 1.0)])
+    
+    finals = [segment for segment in segment_wav(path) if segment.final]
+    
+    # 구간 끝에는 pre_roll(200ms)만큼의 무음만 남고, 두 번째 구간은 직전 200ms부터 시작
+    assert [segment.index for segment in finals] == [0, 1]
+    assert finals[0].start == pytest.approx(0.0, abs=0.03)
+    assert finals[0].end == pytest.approx(1.2, abs=0.03)
+    assert finals[1].start == pytest.approx(1.8, abs=0.03)
+    assert finals[1].end == pytest.approx(3.2, abs=0.03)
+    assert len(finals[1].audio) == pytest.approx(1.4 * SAMPLE_RATE * 2, abs=SAMPLE_RATE * 2 * 0.03)
+
+
+def test_short_noise_burst_is_dropped(tmp_path):
+    path = tmp_path / "burst.wav"
+    # 100ms 잡음은 구간 시작 기준(90ms)은 넘지만 최소 음성 길이(250ms)보다 짧음
+    write_wav(path, [("silence", 0.5), ("tone", 0.1), ("silence", 1.0), ("tone", 1.0), ("silence", 1.0)])
+    
+    segments = segment_wav(path)
+    finals = [segment for segment in segments if segment.final]
+    
+    assert len(finals) == 1
+    assert finals[0].index == 0
+    assert finals[0].start == pytest.approx(1.4, abs=0.03)
+    assert all(segment.start > 1.0 for segment in segments)
+
+
+def test_streaming_transcriber_replaces_stale_partials(tmp_path):
+    path = tmp_path / "long.wav"
+    write_wav(path, [("tone", 3.0), ("silence", 1.0)])
+    sample_rate, frames = iter_wav_frames(str(path), FRAME_MS)
+    
+    # 첫 부분 결과(0.5초 시점)를 인식하는 동안 나머지 프레임을 모두 읽게 해서 인식 대기열이 밀리도록 함
+    first_call = threading.Event()
+    frames_done = threading.Event()
+    
+    def tracked_frames():
+        for number, frame in enumerate(frames):
+            if number == 40:
+                first_call.wait(5)
+            yield frame
+        frames_done.set()
+    
+    def transcribe(audio, rate):
+        assert rate == SAMPLE_RATE
+        first_call.set()
+        frames_done.wait(5)
+        return f"{len(audio) / 2 / rate:.1f}초"
+    
+    results = []
+    transcriber = StreamingTranscriber(transcribe, partial_interval=0.5)
+    handle = transcriber.start(tracked_frames(), sample_rate, on_result=results.append)
+    
+    assert handle.wait(10)
+    assert handle.error is None
+    # 밀린 동안 쌓인 부분본들은 최종본으로 대체되어 인식되지 않음
+    assert [result["type"] for result in results] == ["partial", "final"]
+    assert all(result["segment"] == 0 for result in results)
+    assert results[1]["end"] == pytest.approx(3.2, abs=0.03)
+    assert handle.finals == [results[1]]
+    assert handle.text == "3.2초"